@@ -0,0 +1,65 @@
+"""add analysis_jobs table
+
+Revision ID: 3b7e1c2d9a40
+Revises: 0ae7fd7ef05a
+Create Date: 2026-01-12 09:14:22.418310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1c2d9a40'
+down_revision: Union[str, None] = '0ae7fd7ef05a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per analysis attempt: timings, sizes, token usage and failure class
+    op.create_table(
+        'analysis_jobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('document_id', sa.UUID(), nullable=False),
+        sa.Column('tenant_id', sa.UUID(), nullable=True),
+        sa.Column(
+            'status',
+            sa.Enum('running', 'succeeded', 'failed', name='analysisjobstatus'),
+            nullable=False,
+        ),
+        sa.Column('attempt', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('celery_task_id', sa.String(), nullable=True),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('current_stage', sa.String(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('stage_durations', sa.JSON(), nullable=True),
+        sa.Column('file_bytes', sa.Integer(), nullable=True),
+        sa.Column('page_count', sa.Integer(), nullable=True),
+        sa.Column('text_chars', sa.Integer(), nullable=True),
+        sa.Column('suggestions_count', sa.Integer(), nullable=True),
+        sa.Column('llm_model', sa.String(), nullable=True),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+        sa.Column('completion_tokens', sa.Integer(), nullable=True),
+        sa.Column('total_tokens', sa.Integer(), nullable=True),
+        sa.Column('error_class', sa.String(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analysis_jobs_document_id', 'analysis_jobs', ['document_id'])
+    op.create_index('ix_analysis_jobs_tenant_started', 'analysis_jobs', ['tenant_id', 'started_at'])
+    op.create_index('ix_analysis_jobs_status', 'analysis_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_jobs_status', table_name='analysis_jobs')
+    op.drop_index('ix_analysis_jobs_tenant_started', table_name='analysis_jobs')
+    op.drop_index('ix_analysis_jobs_document_id', table_name='analysis_jobs')
+    op.drop_table('analysis_jobs')
+    sa.Enum(name='analysisjobstatus').drop(op.get_bind(), checkfirst=True)
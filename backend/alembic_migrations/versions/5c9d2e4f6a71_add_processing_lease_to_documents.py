@@ -0,0 +1,36 @@
+"""add processing lease to documents
+
+Revision ID: 5c9d2e4f6a71
+Revises: 3b7e1c2d9a40
+Create Date: 2026-01-14 16:42:08.907115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c9d2e4f6a71'
+down_revision: Union[str, None] = '3b7e1c2d9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lease columns: owner attempt, expiry renewed by heartbeats, and retry schedule
+    op.add_column('documents', sa.Column('lease_owner', sa.UUID(), nullable=True))
+    op.add_column('documents', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.add_column('documents', sa.Column('next_attempt_at', sa.DateTime(), nullable=True))
+
+    # Supports the reaper's scan for processing documents with an expired lease
+    op.create_index('ix_documents_status_lease', 'documents', ['status', 'lease_expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_status_lease', table_name='documents')
+    op.drop_column('documents', 'next_attempt_at')
+    op.drop_column('documents', 'lease_expires_at')
+    op.drop_column('documents', 'lease_owner')
@@ -0,0 +1,42 @@
+"""add tenant_id to documents
+
+Revision ID: 7e3f8a1b2c64
+Revises: 5c9d2e4f6a71
+Create Date: 2026-01-19 10:05:47.331842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3f8a1b2c64'
+down_revision: Union[str, None] = '5c9d2e4f6a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Denormalise the uploader's tenant onto documents so access checks and
+    # tenant listings filter on documents alone instead of joining "user"
+    op.add_column('documents', sa.Column('tenant_id', sa.UUID(), nullable=True))
+
+    # Backfill from the uploader (correlated subquery, portable across dialects)
+    op.execute(
+        """
+        UPDATE documents
+        SET tenant_id = (SELECT u.tenant_id FROM "user" AS u WHERE u.id = documents.uploaded_by)
+        WHERE tenant_id IS NULL
+        """
+    )
+
+    # Tenant listing is ordered by created_at
+    op.create_index('ix_documents_tenant_created', 'documents', ['tenant_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_tenant_created', table_name='documents')
+    op.drop_column('documents', 'tenant_id')
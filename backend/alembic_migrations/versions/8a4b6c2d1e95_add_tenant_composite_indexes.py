@@ -0,0 +1,50 @@
+"""add tenant composite indexes and ai_suggestions.created_at
+
+Revision ID: 8a4b6c2d1e95
+Revises: 7e3f8a1b2c64
+Create Date: 2026-01-21 14:27:10.582093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4b6c2d1e95'
+down_revision: Union[str, None] = '7e3f8a1b2c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Suggestions had no timestamp; existing rows get the migration time
+    op.add_column(
+        'ai_suggestions',
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    )
+
+    # Document listing: tenant_id = ? AND archived_at IS NULL ORDER BY created_at DESC
+    op.drop_index('ix_documents_tenant_created', table_name='documents')
+    op.create_index(
+        'ix_documents_tenant_archived_created', 'documents', ['tenant_id', 'archived_at', 'created_at']
+    )
+
+    # Suggestion listing and dashboard counts: tenant_id = ? AND status = ?
+    op.create_index(
+        'ix_ai_suggestions_tenant_status_created', 'ai_suggestions', ['tenant_id', 'status', 'created_at']
+    )
+    # BPO review queue: tenant_id = ? AND assigned_bpo_id = ? AND status = ?
+    op.create_index(
+        'ix_ai_suggestions_tenant_bpo_status', 'ai_suggestions', ['tenant_id', 'assigned_bpo_id', 'status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_suggestions_tenant_bpo_status', table_name='ai_suggestions')
+    op.drop_index('ix_ai_suggestions_tenant_status_created', table_name='ai_suggestions')
+    op.drop_index('ix_documents_tenant_archived_created', table_name='documents')
+    op.create_index('ix_documents_tenant_created', 'documents', ['tenant_id', 'created_at'])
+    op.drop_column('ai_suggestions', 'created_at')
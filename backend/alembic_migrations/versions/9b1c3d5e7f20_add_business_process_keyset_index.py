@@ -0,0 +1,29 @@
+"""add business_processes (tenant_id, created_at, id) index
+
+Revision ID: 9b1c3d5e7f20
+Revises: 8a4b6c2d1e95
+Create Date: 2026-01-22 10:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1c3d5e7f20'
+down_revision: Union[str, None] = '8a4b6c2d1e95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Overview pagination/streaming: tenant_id = ? ORDER BY created_at DESC, id DESC
+    op.create_index(
+        'ix_business_processes_tenant_created', 'business_processes', ['tenant_id', 'created_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_business_processes_tenant_created', table_name='business_processes')
@@ -0,0 +1,48 @@
+"""add tenant_compliance_summary and tenant_activity_counters
+
+Revision ID: a2c4e6f8b013
+Revises: 9b1c3d5e7f20
+Create Date: 2026-01-23 09:41:05.227914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c4e6f8b013'
+down_revision: Union[str, None] = '9b1c3d5e7f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows are created on each tenant's first compliance write or dashboard visit
+    op.create_table(
+        'tenant_compliance_summary',
+        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.Column('requirements_total', sa.Integer(), nullable=False),
+        sa.Column('requirements_mapped', sa.Integer(), nullable=False),
+        sa.Column('risks_total', sa.Integer(), nullable=False),
+        sa.Column('risks_uncontrolled', sa.Integer(), nullable=False),
+        sa.Column('suggestions_backlog', sa.Integer(), nullable=False),
+        sa.Column('suggestions_stale', sa.Integer(), nullable=False),
+        sa.Column('compliance_score', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id'),
+    )
+    op.create_table(
+        'tenant_activity_counters',
+        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.Column('bucket_date', sa.Date(), nullable=False),
+        sa.Column('events', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id', 'bucket_date'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tenant_activity_counters')
+    op.drop_table('tenant_compliance_summary')
@@ -0,0 +1,83 @@
+"""add user.role_mask and role indexes
+
+Revision ID: a8c0e2f4b679
+Revises: f7b9d1e3a568
+Create Date: 2026-02-12 09:27:44.610392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c0e2f4b679'
+down_revision: Union[str, None] = 'f7b9d1e3a568'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.user.ROLE_BITS
+ROLE_BITS = {
+    "admin": 1 << 0,
+    "bpo": 1 << 1,
+    "executive": 1 << 2,
+    "general_user": 1 << 3,
+    "compliance_officer": 1 << 4,
+    "auditor": 1 << 5,
+}
+
+
+def _mask_sql(contains) -> str:
+    return " | ".join(
+        f"(CASE WHEN {contains(role)} THEN {bit} ELSE 0 END)" for role, bit in ROLE_BITS.items()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.add_column(
+            sa.Column('role_mask', sa.Integer(), nullable=False, server_default=str(ROLE_BITS["general_user"]))
+        )
+
+    if is_postgresql:
+        mask = _mask_sql(lambda role: f"'{role}' = ANY(NEW.roles)")
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION user_role_mask() RETURNS trigger AS $$
+            BEGIN
+                NEW.role_mask := {mask};
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """)
+        # Keeps role_mask right for rows written outside the ORM (handle_new_user, scripts)
+        op.execute("""
+            CREATE TRIGGER user_role_mask
+            BEFORE INSERT OR UPDATE OF roles ON "user"
+            FOR EACH ROW EXECUTE FUNCTION user_role_mask();
+        """)
+        # Backfill by firing the trigger
+        op.execute('UPDATE "user" SET roles = roles')
+        op.create_index('ix_user_roles_gin', 'user', ['roles'], postgresql_using='gin')
+    else:
+        op.execute(
+            'UPDATE "user" SET role_mask = '
+            + _mask_sql(lambda role: f"EXISTS (SELECT 1 FROM json_each(\"user\".roles) WHERE value = '{role}')")
+        )
+
+    op.create_index('ix_user_tenant_role_mask', 'user', ['tenant_id', 'role_mask'])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    op.drop_index('ix_user_tenant_role_mask', table_name='user')
+    if bind.dialect.name == "postgresql":
+        op.drop_index('ix_user_roles_gin', table_name='user')
+        op.execute('DROP TRIGGER IF EXISTS user_role_mask ON "user"')
+        op.execute('DROP FUNCTION IF EXISTS user_role_mask()')
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('role_mask')
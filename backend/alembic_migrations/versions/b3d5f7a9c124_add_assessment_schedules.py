@@ -0,0 +1,78 @@
+"""add assessment_schedules and control_assessments
+
+Revision ID: b3d5f7a9c124
+Revises: a2c4e6f8b013
+Create Date: 2026-01-24 11:05:37.640128
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c124'
+down_revision: Union[str, None] = 'a2c4e6f8b013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'assessment_schedules',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.Column('control_id', sa.UUID(), nullable=False),
+        sa.Column('owner_id', sa.UUID(), nullable=False),
+        sa.Column(
+            'recurrence',
+            sa.Enum('monthly', 'quarterly', 'semiannual', 'annual', name='assessmentrecurrence'),
+            nullable=False,
+        ),
+        sa.Column('next_due_at', sa.DateTime(), nullable=False),
+        sa.Column('active', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['control_id'], ['controls.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['owner_id'], ['user.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_assessment_schedules_control_id', 'assessment_schedules', ['control_id'])
+    # Materialiser scan: active schedules whose next occurrence is inside the horizon
+    op.create_index('ix_assessment_schedules_active_next_due', 'assessment_schedules', ['active', 'next_due_at'])
+
+    op.create_table(
+        'control_assessments',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.Column('schedule_id', sa.UUID(), nullable=False),
+        sa.Column('control_id', sa.UUID(), nullable=False),
+        sa.Column('owner_id', sa.UUID(), nullable=False),
+        sa.Column('due_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_by', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['schedule_id'], ['assessment_schedules.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['control_id'], ['controls.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['owner_id'], ['user.id']),
+        sa.ForeignKeyConstraint(['completed_by'], ['user.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('schedule_id', 'due_at', name='uq_control_assessments_schedule_due'),
+    )
+    # Overdue queue: tenant_id = ? AND owner_id = ? AND due_at < now() over open rows only
+    op.create_index(
+        'ix_control_assessments_tenant_owner_due',
+        'control_assessments',
+        ['tenant_id', 'owner_id', 'due_at'],
+        postgresql_where=sa.text('completed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_control_assessments_tenant_owner_due', table_name='control_assessments')
+    op.drop_table('control_assessments')
+    op.drop_index('ix_assessment_schedules_active_next_due', table_name='assessment_schedules')
+    op.drop_index('ix_assessment_schedules_control_id', table_name='assessment_schedules')
+    op.drop_table('assessment_schedules')
+    sa.Enum(name='assessmentrecurrence').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,49 @@
+"""count residual-risk categories in tenant_compliance_summary
+
+Revision ID: b9d1f3a5c780
+Revises: a8c0e2f4b679
+Create Date: 2026-02-10 09:18:42.551937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d1f3a5c780'
+down_revision: Union[str, None] = 'a8c0e2f4b679'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = ("high", "medium", "low")
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('tenant_compliance_summary') as batch_op:
+        for category in CATEGORIES:
+            batch_op.add_column(
+                sa.Column(f'risks_{category}', sa.Integer(), nullable=False, server_default='0')
+            )
+        batch_op.drop_column('risks_uncontrolled')
+
+    # Backfill with correlated subqueries (portable); scores are recomputed by the next
+    # hourly refresh_compliance_summaries run
+    for category in CATEGORIES:
+        op.execute(
+            f"UPDATE tenant_compliance_summary SET risks_{category} = ("
+            "SELECT count(*) FROM risks "
+            "WHERE risks.tenant_id = tenant_compliance_summary.tenant_id "
+            f"AND lower(risks.category) = '{category}')"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tenant_compliance_summary') as batch_op:
+        batch_op.add_column(
+            sa.Column('risks_uncontrolled', sa.Integer(), nullable=False, server_default='0')
+        )
+        for category in CATEGORIES:
+            batch_op.drop_column(f'risks_{category}')
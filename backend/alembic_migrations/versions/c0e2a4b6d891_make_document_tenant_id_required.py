@@ -0,0 +1,38 @@
+"""make documents.tenant_id required
+
+Revision ID: c0e2a4b6d891
+Revises: b9d1f3a5c780
+Create Date: 2026-02-11 14:02:19.604183
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0e2a4b6d891'
+down_revision: Union[str, None] = 'b9d1f3a5c780'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows written without a tenant since the column was added take the uploader's
+    # (user.tenant_id is NOT NULL); correlated subquery so it runs on every dialect
+    op.execute(
+        """
+        UPDATE documents
+        SET tenant_id = (SELECT u.tenant_id FROM "user" AS u WHERE u.id = documents.uploaded_by)
+        WHERE tenant_id IS NULL
+        """
+    )
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.alter_column('tenant_id', existing_type=sa.UUID(), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.alter_column('tenant_id', existing_type=sa.UUID(), nullable=True)
@@ -0,0 +1,47 @@
+"""anchor assessment schedules on their first due date
+
+Revision ID: d1f3b5c7e902
+Revises: c0e2a4b6d891
+Create Date: 2026-02-11 16:40:52.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e902'
+down_revision: Union[str, None] = 'c0e2a4b6d891'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('assessment_schedules') as batch_op:
+        batch_op.add_column(sa.Column('first_due_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('occurrences', sa.Integer(), nullable=False, server_default='0'))
+
+    # The earliest materialised occurrence is the anchor; schedules without any start
+    # from their next due date. Correlated subqueries so this runs on every dialect.
+    op.execute(
+        """
+        UPDATE assessment_schedules
+        SET first_due_at = COALESCE(
+                (SELECT min(a.due_at) FROM control_assessments AS a
+                 WHERE a.schedule_id = assessment_schedules.id),
+                next_due_at),
+            occurrences = (SELECT count(*) FROM control_assessments AS a
+                           WHERE a.schedule_id = assessment_schedules.id)
+        """
+    )
+    with op.batch_alter_table('assessment_schedules') as batch_op:
+        batch_op.alter_column('first_due_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('assessment_schedules') as batch_op:
+        batch_op.drop_column('occurrences')
+        batch_op.drop_column('first_due_at')
@@ -0,0 +1,111 @@
+"""partition audit_logs by month and add audit_log_archives
+
+Revision ID: d5f7b9c1e346
+Revises: c4e6a8b0d235
+Create Date: 2026-01-28 14:20:51.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7b9c1e346'
+down_revision: Union[str, None] = 'c4e6a8b0d235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions from the oldest entry through this many months ahead;
+# the maintain_audit_logs task keeps creating them from then on.
+PREMAKE_MONTHS = 3
+
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    month date := date_trunc('month', COALESCE((SELECT min(created_at) FROM {source}), now()))::date;
+    last_month date := (date_trunc('month', now()) + interval '{premake} months')::date;
+BEGIN
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+            month,
+            (month + interval '1 month')::date
+        );
+        month := (month + interval '1 month')::date;
+    END LOOP;
+END $$;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_log_archives',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('month', sa.Date(), nullable=False),
+        sa.Column('object_path', sa.String(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('month'),
+    )
+
+    if op.get_bind().dialect.name != 'postgresql':
+        # No declarative partitioning: retention deletes month ranges instead
+        op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+        return
+
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned')
+    op.execute('ALTER INDEX audit_logs_pkey RENAME TO audit_logs_unpartitioned_pkey')
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL,
+            action VARCHAR NOT NULL,
+            entity_type VARCHAR NOT NULL,
+            entity_id UUID NOT NULL,
+            actor_id UUID NOT NULL REFERENCES "user" (id),
+            changes JSON,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    op.execute(CREATE_MONTHLY_PARTITIONS.format(source='audit_logs_unpartitioned', premake=PREMAKE_MONTHS))
+    # Catches inserts if partition maintenance falls behind
+    op.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+    op.execute(
+        'INSERT INTO audit_logs (id, action, entity_type, entity_id, actor_id, changes, created_at) '
+        'SELECT id, action, entity_type, entity_id, actor_id, changes, created_at FROM audit_logs_unpartitioned'
+    )
+    op.execute('DROP TABLE audit_logs_unpartitioned')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_partitioned')
+        op.create_table(
+            'audit_logs',
+            sa.Column('id', sa.UUID(), nullable=False),
+            sa.Column('action', sa.String(), nullable=False),
+            sa.Column('entity_type', sa.String(), nullable=False),
+            sa.Column('entity_id', sa.UUID(), nullable=False),
+            sa.Column('actor_id', sa.UUID(), nullable=False),
+            sa.Column('changes', sa.JSON(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+            sa.ForeignKeyConstraint(['actor_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id', name='audit_logs_pkey_unpartitioned'),
+        )
+        op.execute(
+            'INSERT INTO audit_logs (id, action, entity_type, entity_id, actor_id, changes, created_at) '
+            'SELECT id, action, entity_type, entity_id, actor_id, changes, created_at FROM audit_logs_partitioned'
+        )
+        # Dropping the parent drops every partition
+        op.execute('DROP TABLE audit_logs_partitioned')
+        op.execute('ALTER INDEX audit_logs_pkey_unpartitioned RENAME TO audit_logs_pkey')
+    else:
+        op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
+    op.drop_table('audit_log_archives')
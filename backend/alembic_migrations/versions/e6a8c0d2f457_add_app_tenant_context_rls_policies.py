@@ -0,0 +1,47 @@
+"""add app.tenant_id RLS policies
+
+Revision ID: e6a8c0d2f457
+Revises: d5f7b9c1e346
+Create Date: 2026-02-03 10:12:37.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0d2f457'
+down_revision: Union[str, None] = 'd5f7b9c1e346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["risks", "controls", "business_processes", "regulatory_frameworks"]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        # Permissive, so it is OR-ed with "Tenant Access" (auth.uid() for Supabase clients).
+        # The backend sets app.tenant_id per transaction (app/core/tenancy.py); unset it
+        # matches nothing. A plain column comparison keeps the tenant_id indexes usable.
+        op.execute(f'DROP POLICY IF EXISTS "App Tenant Context" ON {table}')
+        op.execute(f"""
+            CREATE POLICY "App Tenant Context" ON {table}
+            FOR ALL
+            USING (tenant_id = NULLIF(current_setting('app.tenant_id', true), '')::uuid)
+            WITH CHECK (tenant_id = NULLIF(current_setting('app.tenant_id', true), '')::uuid);
+        """)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.execute(f'DROP POLICY IF EXISTS "App Tenant Context" ON {table}')
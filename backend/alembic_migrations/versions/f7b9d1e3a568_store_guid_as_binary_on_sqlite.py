@@ -0,0 +1,63 @@
+"""store GUID columns as 16-byte binary on non-Postgres databases
+
+Revision ID: f7b9d1e3a568
+Revises: e6a8c0d2f457
+Create Date: 2026-02-09 16:41:08.275190
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9d1e3a568'
+down_revision: Union[str, None] = 'e6a8c0d2f457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def _guid_columns(bind):
+    """(table, column) pairs of the former CHAR(32) hex GUID storage."""
+    inspector = sa.inspect(bind)
+    for table in inspector.get_table_names():
+        for column in inspector.get_columns(table):
+            if isinstance(column["type"], sa.CHAR) and column["type"].length == 32:
+                yield table, column["name"]
+
+
+def _convert(from_type: str, convert) -> None:
+    """Rewrite every GUID value stored as ``from_type`` (SQLite typeof) with ``convert``.
+
+    SQLite keeps BLOB values as-is in a CHAR column, so the column definitions stay.
+    """
+    bind = op.get_bind()
+    for table, column in list(_guid_columns(bind)):
+        select = sa.text(
+            f'SELECT rowid, "{column}" FROM "{table}" '
+            f'WHERE typeof("{column}") = :from_type LIMIT {BATCH_SIZE}'
+        )
+        update = sa.text(f'UPDATE "{table}" SET "{column}" = :value WHERE rowid = :rowid')
+        while True:
+            rows = bind.execute(select, {"from_type": from_type}).all()
+            if not rows:
+                break
+            bind.execute(update, [{"rowid": rowid, "value": convert(value)} for rowid, value in rows])
+
+
+def upgrade() -> None:
+    # Postgres uses the native uuid type; only SQLite databases carry hex strings
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _convert("text", lambda value: uuid.UUID(value).bytes)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _convert("blob", lambda value: uuid.UUID(bytes=value).hex)
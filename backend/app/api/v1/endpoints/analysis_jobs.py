@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import has_role
+from app.database import get_async_session
+from app.models.analysis_job import AnalysisJobStatus
+from app.models.user import User as UserModel
+from app.schemas.analysis_job import AnalysisJobRead, AnalysisJobStats
+from app.services.analysis_job_service import AnalysisJobService
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[AnalysisJobRead], tags=["analysis-jobs"])
+async def list_analysis_jobs(
+    status: Optional[AnalysisJobStatus] = Query(None, description="Filter by job status"),
+    document_id: Optional[UUID] = Query(None, description="Filter by document"),
+    running_longer_than_minutes: Optional[int] = Query(
+        None, ge=0, description="Only jobs still running that started more than N minutes ago"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin"])),
+):
+    """
+    List analysis job attempts for the current tenant, newest first.
+    Requires admin role.
+    """
+    return await AnalysisJobService.list_jobs(
+        db=db,
+        tenant_id=current_user.tenant_id,
+        status=status,
+        document_id=document_id,
+        running_longer_than_minutes=running_longer_than_minutes,
+        limit=limit,
+    )
+
+
+@router.get("/stats", response_model=AnalysisJobStats, tags=["analysis-jobs"])
+async def get_analysis_job_stats(
+    days: int = Query(7, ge=1, le=365, description="Size of the aggregation window in days"),
+    min_pages: Optional[int] = Query(None, ge=0, description="Only documents with at least this many pages"),
+    max_pages: Optional[int] = Query(None, ge=0, description="Only documents with at most this many pages"),
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin"])),
+):
+    """
+    Aggregated analysis statistics: status counts, error classes, end-to-end and
+    per-stage duration percentiles (p50/p90/p99) and token totals.
+    Requires admin role.
+    """
+    return await AnalysisJobService.get_stats(
+        db=db,
+        tenant_id=current_user.tenant_id,
+        since=datetime.utcnow() - timedelta(days=days),
+        min_pages=min_pages,
+        max_pages=max_pages,
+    )
@@ -12,6 +12,8 @@ from app.core.deps import get_current_active_user
 from app.schemas.assessment import (
     AssessmentRequest,
     AssessmentResponse,
+    BulkAssessmentRequest,
+    BulkAssessmentResponse,
     PendingReviewsResponse,
     PendingReviewItem,
     SuggestionDetailResponse
@@ -130,6 +132,56 @@ async def get_pending_reviews(
         )
 
 
+@router.post("/bulk", response_model=BulkAssessmentResponse, tags=["assessments"])
+async def submit_bulk_assessment(
+    request: BulkAssessmentRequest,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user),
+) -> BulkAssessmentResponse:
+    """
+    Approve or discard many suggestions in one transaction.
+
+    Each item is checked like a single assessment (assigned to the current BPO,
+    status "pending_review", residual_risk present for approve). Items failing a
+    check, or currently locked by another assessment, are reported with
+    success=false; the others are applied and committed together.
+
+    Args:
+        request: BulkAssessmentRequest with up to 500 items
+        db: Database session
+        current_user: Authenticated user from JWT
+
+    Returns:
+        BulkAssessmentResponse: One outcome per item plus succeeded/failed counts
+
+    Raises:
+        401: Unauthorized (JWT missing/invalid)
+        403: Forbidden (non-BPO user or no tenant)
+        422: Validation error (empty or oversized request)
+        500: Internal server error (nothing is committed)
+    """
+    verify_bpo_role(current_user)
+
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User has no tenant assigned"
+        )
+
+    try:
+        return await AssessmentService.bulk_assess(
+            db=db,
+            items=request.items,
+            actor_id=current_user.id,
+            tenant_id=current_user.tenant_id
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit bulk assessment: {str(e)}"
+        )
+
+
 @router.get("/{suggestion_id}", response_model=SuggestionDetailResponse, tags=["assessments"])
 async def get_suggestion_detail(
     suggestion_id: UUID = Path(..., description="ID of the suggestion to retrieve"),
@@ -269,15 +321,7 @@ async def submit_assessment(
             )
 
         # Prepare edits dictionary if provided
-        edits = None
-        if (request.edited_risk_description or
-            request.edited_control_description or
-            request.edited_business_process):
-            edits = {
-                "edited_risk_description": request.edited_risk_description,
-                "edited_control_description": request.edited_control_description,
-                "edited_business_process": request.edited_business_process
-            }
+        edits = request.edits()
 
         # Call AssessmentService based on action
         if request.action == "approve":
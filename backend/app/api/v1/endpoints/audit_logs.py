@@ -1,29 +1,59 @@
+from datetime import datetime, timezone
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import UUID
 
-from app.database import get_async_session
+from app.config import settings
+from app.database import get_read_session
 from app.models.user import User as UserModel
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogRead
 from app.core.deps import has_role
+from app.services.audit_archive_service import AuditArchiveService, get_archive_store
 
 router = APIRouter()
 
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # audit_logs.created_at is naive UTC
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 @router.get("", response_model=List[AuditLogRead], tags=["audit-logs"])
 async def list_audit_logs(
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     entity_id: Optional[UUID] = Query(None, description="Filter by entity ID"),
     actor_id: Optional[UUID] = Query(None, description="Filter by actor ID"),
-    db: AsyncSession = Depends(get_async_session),
+    since: Optional[datetime] = Query(None, description="Only entries created at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only entries created before this time"),
+    include_archived: bool = Query(
+        False, description="Also read months past retention from the audit archive (needs since and until)"
+    ),
+    db: AsyncSession = Depends(get_read_session),
     current_user: UserModel = Depends(has_role(["admin"])),
 ):
     """
     Retrieve audit logs.
     Requires admin role.
+    Archived months are decompressed in memory, so ``include_archived`` needs a
+    bounded ``since``/``until`` range of at most AUDIT_ARCHIVE_MAX_READ_DAYS days.
     """
+    since, until = _naive_utc(since), _naive_utc(until)
+    if include_archived:
+        if since is None or until is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="include_archived requires both since and until",
+            )
+        if (until - since).days > settings.AUDIT_ARCHIVE_MAX_READ_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Archive reads are limited to {settings.AUDIT_ARCHIVE_MAX_READ_DAYS} days",
+            )
     query = select(AuditLog)
 
     if entity_type:
@@ -32,9 +62,30 @@ async def list_audit_logs(
         query = query.filter(AuditLog.entity_id == entity_id)
     if actor_id:
         query = query.filter(AuditLog.actor_id == actor_id)
-        
+    # Bounds on created_at also prune Postgres partitions
+    if since:
+        query = query.filter(AuditLog.created_at >= since)
+    if until:
+        query = query.filter(AuditLog.created_at < until)
+
     # Order by most recent
     query = query.order_by(AuditLog.created_at.desc())
-    
+
     result = await db.execute(query)
-    return result.scalars().all()
+    entries = result.scalars().all()
+    if not include_archived:
+        return entries
+
+    archived = await AuditArchiveService.read_archived(
+        db,
+        get_archive_store(),
+        since=since,
+        until=until,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actor_id=actor_id,
+    )
+    combined = [AuditLogRead.model_validate(entry) for entry in entries]
+    combined += [AuditLogRead.model_validate(entry) for entry in archived]
+    combined.sort(key=lambda entry: entry.created_at, reverse=True)
+    return combined
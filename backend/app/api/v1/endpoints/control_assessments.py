@@ -0,0 +1,90 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import has_role
+from app.database import get_async_session, get_read_session
+from app.models.user import User as UserModel
+from app.schemas.assessment_schedule import (
+    AssessmentScheduleCreate,
+    AssessmentScheduleRead,
+    ControlAssessmentRead,
+)
+from app.services.assessment_schedule_service import AssessmentScheduleService
+
+router = APIRouter()
+
+
+@router.post(
+    "/schedules",
+    response_model=AssessmentScheduleRead,
+    status_code=status.HTTP_201_CREATED,
+    tags=["control-assessments"],
+)
+async def create_assessment_schedule(
+    payload: AssessmentScheduleCreate,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin", "bpo"])),
+):
+    """
+    Schedule recurring assessments of a control.
+    Occurrences due within the materialisation horizon are created immediately.
+    """
+    schedule = await AssessmentScheduleService.create_schedule(
+        db, payload, current_user.tenant_id, current_user.id
+    )
+    await db.commit()
+    await db.refresh(schedule)
+    return schedule
+
+
+@router.get("/overdue", response_model=List[ControlAssessmentRead], tags=["control-assessments"])
+async def list_overdue_assessments(
+    response: Response,
+    owner_id: Optional[UUID] = Query(None, description="Owner to list (admin only); defaults to the current user"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_read_session),
+    current_user: UserModel = Depends(has_role(["admin", "bpo"])),
+):
+    """
+    List open assessments past their due date, most overdue first.
+
+    - With more results, the `X-Next-Cursor` response header carries the cursor for the next page
+    """
+    if owner_id and owner_id != current_user.id and "admin" not in current_user.roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can list another owner's assessments",
+        )
+    assessments, next_cursor = await AssessmentScheduleService.list_overdue(
+        db, current_user.tenant_id, owner_id or current_user.id, limit=limit, cursor=cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return assessments
+
+
+@router.post(
+    "/{assessment_id}/complete",
+    response_model=ControlAssessmentRead,
+    tags=["control-assessments"],
+)
+async def complete_assessment(
+    assessment_id: UUID,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin", "bpo"])),
+):
+    """
+    Mark a scheduled control assessment as done.
+
+    - BPOs can only complete their own assessments; admins any in the tenant
+    """
+    assessment = await AssessmentScheduleService.complete_assessment(
+        db, assessment_id, current_user.tenant_id, current_user.id, is_admin="admin" in current_user.roles
+    )
+    await db.commit()
+    await db.refresh(assessment)
+    return assessment
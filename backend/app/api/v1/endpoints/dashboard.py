@@ -1,30 +1,32 @@
 """Dashboard API endpoints for role-specific metrics."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.future import select
 
-from app.database import get_async_session
+from app.database import get_read_session
 from app.models.user import User
-from app.models.compliance import BusinessProcess
 from app.core.deps import get_current_active_user
-from app.schemas.dashboard import (
-    DashboardMetrics,
-    OverviewResponse,
-    OverviewProcess,
-    OverviewControl,
-    OverviewRisk
-)
+from app.core.responses import ResponseSerializer
+from app.schemas.dashboard import DashboardMetrics, OverviewProcess, OverviewResponse
 from app.services.dashboard_service import DashboardService
 
 
 router = APIRouter()
 
+# Processes fetched per round trip by the NDJSON stream
+OVERVIEW_STREAM_BATCH_SIZE = 200
+
+_overview_serializer = ResponseSerializer(OverviewResponse)
+_overview_process_serializer = ResponseSerializer(OverviewProcess)
+
 
 @router.get("/metrics", response_model=DashboardMetrics, tags=["dashboard"])
 async def get_dashboard_metrics(
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_active_user),
 ) -> DashboardMetrics:
     """
@@ -76,12 +78,18 @@ async def get_dashboard_metrics(
 
 @router.get("/overview", response_model=OverviewResponse, tags=["dashboard"])
 async def get_overview_data(
-    db: AsyncSession = Depends(get_async_session),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Processes per page; omit to list everything"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_active_user),
-) -> OverviewResponse:
+) -> Response:
     """
     Retrieve hierarchical overview data (Processes -> Risks/Controls).
 
+    - Newest process first; with `limit`, the `X-Next-Cursor` response header
+      carries the cursor for the next page
+    - For very large tenants prefer `GET /overview/stream` (NDJSON)
+
     Returns:
         OverviewResponse: List of processes with nested risks and controls.
     """
@@ -93,54 +101,49 @@ async def get_overview_data(
                 detail="User has no tenant assigned"
             )
 
-        # Fetch processes with related risks and controls eagerly loaded
-        query = (
-            select(BusinessProcess)
-            .options(
-                selectinload(BusinessProcess.risks),
-                selectinload(BusinessProcess.controls)
-            )
-            .where(BusinessProcess.tenant_id == tenant_id)
+        processes, next_cursor = await DashboardService.get_overview_page(
+            db, tenant_id, limit=limit, cursor=cursor
         )
-        
-        result = await db.execute(query)
-        processes = result.scalars().all()
-
-        overview_processes = []
-        for proc in processes:
-            # Map ORM objects to Pydantic schemas
-            controls = [
-                OverviewControl(
-                    id=c.id,
-                    name=c.name,
-                    description=c.description,
-                    type=c.type
-                ) for c in proc.controls
-            ]
-            
-            risks = [
-                OverviewRisk(
-                    id=r.id,
-                    name=r.name,
-                    description=r.description,
-                    category=r.category
-                ) for r in proc.risks
-            ]
-            
-            overview_processes.append(
-                OverviewProcess(
-                    id=proc.id,
-                    name=proc.name,
-                    description=proc.description,
-                    controls=controls,
-                    risks=risks
-                )
-            )
-
-        return OverviewResponse(processes=overview_processes)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return _overview_serializer.response({"processes": processes}, headers=headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve overview data: {str(e)}"
         )
+
+
+async def _overview_ndjson(db: AsyncSession, tenant_id: UUID) -> AsyncIterator[bytes]:
+    # The request's session has already been closed by dependency teardown when the
+    # body starts streaming; it reconnects on first use, so release it again here.
+    try:
+        async for process in DashboardService.iter_overview(
+            db, tenant_id, batch_size=OVERVIEW_STREAM_BATCH_SIZE
+        ):
+            yield _overview_process_serializer.dump_json(process) + b"\n"
+    finally:
+        await db.close()
+
+
+@router.get("/overview/stream", tags=["dashboard"])
+async def stream_overview_data(
+    db: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Stream the overview as NDJSON: one `OverviewProcess` object per line.
+
+    Processes are fetched in batches, so memory stays bounded regardless of tenant size.
+    """
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User has no tenant assigned"
+        )
+    return StreamingResponse(
+        _overview_ndjson(db, current_user.tenant_id),
+        media_type="application/x-ndjson",
+    )
@@ -1,18 +1,28 @@
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
+import asyncio
+from contextlib import AsyncExitStack
+
+from fastapi import APIRouter, Depends, File, Query, Request, UploadFile, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from typing import List
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from pydantic import BaseModel
 
-from app.database import get_async_session
+from app.database import get_async_session, get_read_session
 from app.models.user import User as UserModel
 from app.models.document import Document
 from app.models.compliance import RegulatoryFramework, RegulatoryRequirement
 from app.schemas import DocumentRead, DocumentUploadResponse
 from app.services.ai_service import DocumentClassification
+from app.config import settings
 from app.core.deps import has_role
+from app.core.pagination import encode_cursor
+from app.core.progress import document_channel, subscribe_progress, tenant_channel
+from app.core.responses import ResponseSerializer
+from app.models.document import DocumentStatus
+from app.schemas.progress import DocumentProgressEvent
 from app.services.document_service import DocumentService
 from tasks.analysis import process_document
 
@@ -22,6 +32,92 @@ class RenameRequest(BaseModel):
 
 router = APIRouter()
 
+_document_list_serializer = ResponseSerializer(List[DocumentRead])
+
+
+def _build_classification(document: Document) -> Optional[DocumentClassification]:
+    """Classification from the document's linked framework or requirement (must be loaded)."""
+    if document.regulatory_framework:
+        return DocumentClassification(
+            document_type="Law",
+            framework_name=document.regulatory_framework.name,
+            framework_description=document.regulatory_framework.description,
+            parent_law_name=None,
+            version=document.regulatory_framework.version,
+        )
+    if document.regulatory_requirement:
+        requirement = document.regulatory_requirement
+        return DocumentClassification(
+            document_type="Regulation",
+            framework_name=requirement.name,
+            framework_description=requirement.description,
+            parent_law_name=requirement.framework.name if requirement.framework else None,
+            version=None,
+        )
+    return None
+
+
+def _to_document_read(document: Document) -> DocumentRead:
+    doc_read = DocumentRead.model_validate(document)
+    doc_read.classification = _build_classification(document)
+    return doc_read
+
+
+def _format_sse(event: DocumentProgressEvent) -> str:
+    return f"event: progress\ndata: {event.model_dump_json()}\n\n"
+
+
+def _snapshot_event(document: Document, tenant_id: UUID) -> DocumentProgressEvent:
+    """Current state of a document, sent first so late subscribers are not left waiting."""
+    return DocumentProgressEvent(
+        document_id=document.id,
+        tenant_id=tenant_id,
+        status=document.status,
+        stage=document.status.value,
+    )
+
+
+async def _progress_stream(
+    request: Request,
+    stack: AsyncExitStack,
+    events: AsyncIterator[DocumentProgressEvent],
+    snapshot: List[DocumentProgressEvent],
+    close_on_terminal: bool,
+) -> AsyncIterator[str]:
+    """Relay progress events as SSE, with keepalive comments while the pipeline is quiet."""
+    next_event = None
+    async with stack:
+        for event in snapshot:
+            yield _format_sse(event)
+        if close_on_terminal and snapshot and all(e.is_terminal for e in snapshot):
+            return
+
+        try:
+            while not await request.is_disconnected():
+                if next_event is None:
+                    next_event = asyncio.ensure_future(events.__anext__())
+                done, _ = await asyncio.wait({next_event}, timeout=settings.SSE_KEEPALIVE_SECONDS)
+                if not done:
+                    yield ": keepalive\n\n"
+                    continue
+
+                event = next_event.result()
+                next_event = None
+                yield _format_sse(event)
+                if close_on_terminal and event.is_terminal:
+                    return
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+
+
+def _sse_response(body: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.post("/upload", response_model=DocumentUploadResponse, tags=["documents"])
 async def upload_document(
@@ -46,6 +142,7 @@ async def upload_document(
         filename=file.filename,
         storage_path=storage_path,
         user_id=current_user.id,
+        tenant_id=current_user.tenant_id,
     )
     print(f"DEBUG: Document created in DB: {document.id}")
 
@@ -83,43 +180,97 @@ async def upload_document(
 
 @router.get("", response_model=List[DocumentRead], tags=["documents"])
 async def list_documents(
-    db: AsyncSession = Depends(get_async_session),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; omit to list everything"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_read_session),
     current_user: UserModel = Depends(has_role(["admin", "bpo", "executive"])),
 ):
     """
     List all documents for the current user's tenant.
+
+    - Newest first; classification relationships are eager-loaded (constant query count)
+    - With `limit`, the `X-Next-Cursor` response header carries the cursor for the next page
     """
     print(f"DEBUG: Listing documents for User {current_user.id}, Tenant {current_user.tenant_id}")
     documents = await DocumentService.get_documents_by_user(
-        db=db, user_id=current_user.id, tenant_id=current_user.tenant_id
+        db=db,
+        user_id=current_user.id,
+        tenant_id=current_user.tenant_id,
+        limit=limit + 1 if limit else None,
+        cursor=cursor,
+    )
+    headers = {}
+    if limit and len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
+    print(f"DEBUG: Found {len(documents)} documents")
+    return _document_list_serializer.response(
+        [_to_document_read(document) for document in documents], headers=headers
+    )
+
+
+@router.get("/events", tags=["documents"])
+async def stream_tenant_progress(
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin", "bpo", "executive"])),
+):
+    """
+    Stream analysis progress for every document in the current user's tenant (Server-Sent Events).
+
+    - Starts with one snapshot event per document that is still pending or processing
+    - Stays open until the client disconnects
+    """
+    stack = AsyncExitStack()
+    # Subscribe before reading the snapshot so no transition can fall in between
+    events = await stack.enter_async_context(
+        subscribe_progress(tenant_channel(current_user.tenant_id))
+    )
+    try:
+        documents = await DocumentService.get_documents_by_user(
+            db=db, user_id=current_user.id, tenant_id=current_user.tenant_id
+        )
+    except BaseException:
+        await stack.aclose()
+        raise
+    snapshot = [
+        _snapshot_event(document, current_user.tenant_id)
+        for document in documents
+        if document.status in (DocumentStatus.pending, DocumentStatus.processing)
+    ]
+    return _sse_response(
+        _progress_stream(request, stack, events, snapshot, close_on_terminal=False)
+    )
+
+
+@router.get("/{document_id}/events", tags=["documents"])
+async def stream_document_progress(
+    document_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin", "bpo", "executive"])),
+):
+    """
+    Stream analysis progress for one document (Server-Sent Events).
+
+    - Starts with a snapshot of the current status
+    - Closes after the document reaches `completed` or `failed`
+    """
+    stack = AsyncExitStack()
+    events = await stack.enter_async_context(subscribe_progress(document_channel(document_id)))
+    try:
+        document = await DocumentService.get_document_by_id(
+            db=db, document_id=document_id, user_id=current_user.id, tenant_id=current_user.tenant_id
+        )
+    except BaseException:
+        await stack.aclose()
+        raise
+    snapshot = [_snapshot_event(document, current_user.tenant_id)]
+    return _sse_response(
+        _progress_stream(request, stack, events, snapshot, close_on_terminal=True)
     )
-    
-    documents_with_classification = []
-    for document in documents:
-        classification = None
-        if document.regulatory_framework:
-            classification = DocumentClassification(
-                document_type="Law",
-                framework_name=document.regulatory_framework.name,
-                framework_description=document.regulatory_framework.description,
-                parent_law_name=None,
-                version=document.regulatory_framework.version,
-            )
-        elif document.regulatory_requirement:
-            await db.refresh(document.regulatory_requirement, attribute_names=["framework"])
-            classification = DocumentClassification(
-                document_type="Regulation",
-                framework_name=document.regulatory_requirement.name,
-                framework_description=document.regulatory_requirement.description,
-                parent_law_name=document.regulatory_requirement.framework.name if document.regulatory_requirement.framework else None,
-                version=None,
-            )
-        doc_read = DocumentRead.model_validate(document)
-        doc_read.classification = classification
-        documents_with_classification.append(doc_read)
-
-    print(f"DEBUG: Found {len(documents_with_classification)} documents")
-    return documents_with_classification
 
 
 @router.get("/{document_id}", response_model=DocumentRead, tags=["documents"])
@@ -137,28 +288,7 @@ async def get_document(
     document = await DocumentService.get_document_by_id(
         db=db, document_id=document_id, user_id=current_user.id
     )
-    # Construct classification if available
-    classification = None
-    if document.regulatory_framework:
-        classification = DocumentClassification(
-            document_type="Law",
-            framework_name=document.regulatory_framework.name,
-            framework_description=document.regulatory_framework.description,
-            parent_law_name=None,
-            version=document.regulatory_framework.version,
-        )
-    elif document.regulatory_requirement:
-        classification = DocumentClassification(
-            document_type="Regulation",
-            framework_name=document.regulatory_requirement.name,
-            framework_description=document.regulatory_requirement.description,
-            parent_law_name=document.regulatory_requirement.framework.name if document.regulatory_requirement.framework else None,
-            version=None,
-        )
-
-    doc_read = DocumentRead.model_validate(document)
-    doc_read.classification = classification
-    return doc_read
+    return _to_document_read(document)
 
 
 @router.patch("/{document_id}/rename", response_model=DocumentRead, tags=["documents"])
@@ -240,7 +370,7 @@ async def manually_process_document(
 
     try:
         # Process document synchronously
-        await _process_document_async(document_id)
+        await _process_document_async(document_id, reprocess=True)
 
         # Re-fetch document to get updated status and relationships
         # Use force_refresh=True to bypass identity map and get fresh data from DB
@@ -252,28 +382,7 @@ async def manually_process_document(
             force_refresh=True
         )
 
-        # Construct classification if available
-        classification = None
-        if document.regulatory_framework:
-            classification = DocumentClassification(
-                document_type="Law",
-                framework_name=document.regulatory_framework.name,
-                framework_description=document.regulatory_framework.description,
-                parent_law_name=None,
-                version=document.regulatory_framework.version,
-            )
-        elif document.regulatory_requirement:
-            classification = DocumentClassification(
-                document_type="Regulation",
-                framework_name=document.regulatory_requirement.name,
-                framework_description=document.regulatory_requirement.description,
-                parent_law_name=document.regulatory_requirement.framework.name if document.regulatory_requirement.framework else None,
-                version=None,
-            )
-
-        doc_read = DocumentRead.model_validate(document)
-        doc_read.classification = classification
-        return doc_read
+        return _to_document_read(document)
     except Exception as e:
         logger.exception(f"Manual processing failed for document {document_id}: {str(e)}")
         raise HTTPException(
@@ -1,14 +1,13 @@
 from typing import List, Any
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from app.database import get_async_session
 from app.models.user import User
-from app.models.compliance import RegulatoryFramework
 from app.schemas.compliance import RegulatoryFrameworkTreeItem
+from app.core.cache import etag_matches
 from app.core.deps import has_role
+from app.services.framework_tree_service import FrameworkTreeService
 
 router = APIRouter()
 
@@ -16,17 +15,13 @@ router = APIRouter()
 async def get_regulatory_frameworks_tree(
     db: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(has_role(["admin", "bpo", "executive", "auditor"])),
+    if_none_match: str | None = Header(None),
 ) -> Any:
     """
     Get all regulatory frameworks with their requirements in a hierarchical tree structure.
     """
-    stmt = (
-        select(RegulatoryFramework)
-        .filter(RegulatoryFramework.tenant_id == current_user.tenant_id)
-        .options(selectinload(RegulatoryFramework.requirements))
-        .order_by(RegulatoryFramework.name)
-    )
-    result = await db.execute(stmt)
-    frameworks = result.scalars().all()
-    
-    return frameworks
+    tree = await FrameworkTreeService.get_tree(db, current_user.tenant_id)
+    headers = {"ETag": tree.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, tree.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=tree.body, media_type="application/json", headers=headers)
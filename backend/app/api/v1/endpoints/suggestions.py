@@ -6,16 +6,23 @@ from sqlalchemy.orm import joinedload
 from uuid import UUID
 from pydantic import BaseModel
 
-from app.database import get_async_session
+from app.database import get_async_session, get_read_session
 from app.models.user import User as UserModel
-from app.models.document import Document
 from app.models.suggestion import AISuggestion, SuggestionStatus, SuggestionType
 from app.models.compliance import Risk, Control, BusinessProcess
 from app.schemas import AISuggestionRead
+from app.schemas.suggestion import SuggestionTriageRequest, SuggestionTriageResponse
 from app.core.deps import has_role
+from app.core.responses import ResponseSerializer
+from app.services.audit_service import AuditService
+from app.services.compliance_summary_service import ComplianceSummaryService
+from app.services.notification_service import NotificationService
+from app.services.suggestion_service import SuggestionService
 
 router = APIRouter()
 
+_suggestion_list_serializer = ResponseSerializer(List[AISuggestionRead])
+
 class UpdateSuggestionStatusRequest(BaseModel):
     status: SuggestionStatus
     updated_content: Optional[dict[str, Any]] = None
@@ -24,32 +31,28 @@ class UpdateSuggestionStatusRequest(BaseModel):
 @router.get("", response_model=List[AISuggestionRead], tags=["suggestions"])
 async def list_suggestions(
     status: Optional[SuggestionStatus] = Query(None, description="Filter by status"),
-    db: AsyncSession = Depends(get_async_session),
+    db: AsyncSession = Depends(get_read_session),
     current_user: UserModel = Depends(has_role(["admin", "compliance_officer", "bpo"])),
 ):
     """
     List AI suggestions with optional status filtering.
-    Filtered by tenant - only shows suggestions from documents uploaded by users in the same tenant.
+    Filtered by tenant - only shows suggestions belonging to the current user's tenant.
+    Suggestions of documents still being analysed are left out until the analysis ends.
     """
+    # Suggestions carry their own tenant_id: served by the (tenant_id, status, created_at) index
     query = (
         select(AISuggestion)
-        .join(Document, AISuggestion.document_id == Document.id)
-        .join(UserModel, Document.uploaded_by == UserModel.id)
-        .filter(UserModel.tenant_id == current_user.tenant_id)
+        .filter(AISuggestion.tenant_id == current_user.tenant_id, SuggestionService.analysis_finished())
         .options(joinedload(AISuggestion.assigned_bpo))
     )
 
     if status:
         query = query.filter(AISuggestion.status == status)
 
-    # Order by creation time (implied by ID usually, or explicit if column existed)
-    # Fallback to ID desc for now
-    query = query.order_by(AISuggestion.id.desc())
+    query = query.order_by(AISuggestion.created_at.desc(), AISuggestion.id.desc())
 
     result = await db.execute(query)
-    return result.unique().scalars().all()
-
-from app.services.audit_service import AuditService
+    return _suggestion_list_serializer.response(result.unique().scalars().all())
 
 @router.patch("/{suggestion_id}/status", response_model=AISuggestionRead, tags=["suggestions"])
 async def update_suggestion_status(
@@ -67,7 +70,7 @@ async def update_suggestion_status(
     result = await db.execute(
         select(AISuggestion)
         .options(joinedload(AISuggestion.assigned_bpo))
-        .where(AISuggestion.id == suggestion_id)
+        .where(AISuggestion.id == suggestion_id, SuggestionService.analysis_finished())
     )
     suggestion = result.scalar_one_or_none()
     if not suggestion:
@@ -79,6 +82,8 @@ async def update_suggestion_status(
 
     # Prepare Audit Changes
     old_status = suggestion.status
+    scope = AISuggestion.id == suggestion.id
+    before = await ComplianceSummaryService.count(db, suggestion.tenant_id, suggestions=scope)
     
     # Update fields
     suggestion.status = request.status
@@ -103,21 +108,40 @@ async def update_suggestion_status(
         changes=changes
     )
 
-    # Mock Notification Trigger
+    # Notify the assigned BPO (delivered by the notification worker after commit)
     if request.status == SuggestionStatus.pending_review:
         if request.bpo_id:
-            # Send notification logic here (mocked)
-            print(f"Sending notification to BPO {request.bpo_id} for suggestion {suggestion_id}")
+            await NotificationService.enqueue_bpo_assignments(
+                db, suggestion.tenant_id, {request.bpo_id: [suggestion.id]}
+            )
         else:
              # If BPO assignment is mandatory for acceptance, raise error or auto-assign
              # For MVP, we log a warning if no BPO provided but proceed
              print(f"Warning: Suggestion accepted without BPO assignment.")
 
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, suggestion.tenant_id, before, suggestions=scope)
     await db.commit()
     await db.refresh(suggestion)
     return suggestion
 
 
+@router.post("/triage", response_model=SuggestionTriageResponse, tags=["suggestions"])
+async def triage_suggestions(
+    request: SuggestionTriageRequest,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserModel = Depends(has_role(["admin", "compliance_officer"])),
+):
+    """
+    Move many pending suggestions to pending_review (with BPO assignment) or rejected at once.
+    Suggestions that are missing or no longer pending are reported per item and left unchanged.
+    """
+    return await SuggestionService.triage(
+        db, request.items, actor_id=current_user.id, tenant_id=current_user.tenant_id
+    )
+
+
+
 class ApproveSuggestionRequest(BaseModel):
     name: str
     description: Optional[str] = None
@@ -156,7 +180,9 @@ async def approve_suggestion(
     # Determine owner: prefer assigned BPO, fallback to current user (approver)
     owner_id = suggestion.assigned_bpo_id or current_user.id
 
+    scope = AISuggestion.id == suggestion.id
     try:
+        before = await ComplianceSummaryService.count(db, current_user.tenant_id, suggestions=scope)
         if suggestion.type == SuggestionType.risk:
             new_entity = Risk(
                 name=request.name,
@@ -208,6 +234,14 @@ async def approve_suggestion(
             }
         )
 
+        await db.flush()
+        await ComplianceSummaryService.record_change(
+            db,
+            current_user.tenant_id,
+            before,
+            suggestions=scope,
+            risks=Risk.id == entity_id if suggestion.type == SuggestionType.risk else None,
+        )
         await db.commit()
         await db.refresh(suggestion)
 
@@ -5,7 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from app.database import get_async_session
-from app.models.user import User as UserModel
+from app.models.user import ROLE_BITS, User as UserModel
 from app.schemas import UserRead, UserUpdate, UserCreate
 from app.core.deps import has_role, get_current_active_user
 from app.services.user_service import user_service
@@ -93,9 +93,14 @@ async def list_users(
     query = select(UserModel).filter(UserModel.tenant_id == current_user.tenant_id)
 
     if role:
-        # Filter users whose roles array contains the specified role
-        # For PostgreSQL: WHERE role = ANY(roles)
-        query = query.filter(UserModel.roles.contains([role]))
+        if role not in ROLE_BITS:
+            return []
+        if db.bind.dialect.name == "postgresql":
+            # roles @> ARRAY[role], served by ix_user_roles_gin
+            query = query.filter(UserModel.roles.contains([role]))
+        else:
+            # JSON roles cannot be searched; test the bit from ix_user_tenant_role_mask
+            query = query.filter(UserModel.role_mask.op("&")(ROLE_BITS[role]) != 0)
 
     result = await db.execute(query)
     users = result.scalars().all()
@@ -12,6 +12,16 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///:memory:"
     TEST_DATABASE_URL: str | None = None
     EXPIRE_ON_COMMIT: bool = False
+    # Read replicas for read-only endpoints (comma-separated URLs); empty reads from the primary
+    DATABASE_REPLICA_URLS: str = ""
+    # Replicas further behind than this are skipped; lag is re-measured every REPLICA_LAG_CHECK_SECONDS
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_SECONDS: float = 5.0
+    # After a write, the same client reads from the primary for this long (read-your-writes)
+    READ_YOUR_WRITES_SECONDS: int = 10
+    # Drop the Python tenant_id predicate on RLS-protected tables and let the policy filter.
+    # Only enable when the app's database role is subject to RLS (not the table owner / BYPASSRLS).
+    TENANT_FILTER_VIA_RLS: bool = False
 
     # Supabase
     SUPABASE_URL: str | None = None
@@ -21,6 +31,64 @@ class Settings(BaseSettings):
 
     # AI
     OPENAI_API_KEY: str | None = None
+    # Two-stage analysis: a classification pass over the opening pages, then concurrent
+    # extraction passes per section. False runs the former single whole-document call.
+    AI_TWO_STAGE_ANALYSIS: bool = True
+    AI_CLASSIFY_MODEL: str = "gpt-4o-mini"
+    AI_EXTRACT_MODEL: str = "gpt-4o-mini"
+    # Classification input: the first pages (capped in chars) plus headings from the rest
+    AI_CLASSIFY_MAX_PAGES: int = 3
+    AI_CLASSIFY_MAX_CHARS: int = 12000
+    # Extraction input per call, and how many calls run at once
+    AI_SECTION_MAX_CHARS: int = 24000
+    AI_EXTRACTION_CONCURRENCY: int = 4
+
+    # Redis (pub/sub for progress events); in-memory fallback when unset
+    REDIS_URL: str | None = None
+    SSE_KEEPALIVE_SECONDS: int = 15
+    # Lifetime of cached per-tenant response bodies in Redis (app/core/cache.py)
+    TENANT_CACHE_TTL_SECONDS: int = 3600
+    # Without Redis each process caches on its own and misses invalidations from the
+    # others (Celery workers, other API processes), so bodies only live this long
+    TENANT_CACHE_LOCAL_TTL_SECONDS: int = 30
+
+    # Analysis processing leases (worker heartbeats + stuck-job reaper)
+    ANALYSIS_LEASE_SECONDS: int = 300
+    ANALYSIS_HEARTBEAT_SECONDS: int = 60
+    ANALYSIS_MAX_ATTEMPTS: int = 3
+    ANALYSIS_RETRY_BACKOFF_SECONDS: int = 60
+    ANALYSIS_RETRY_BACKOFF_MAX_SECONDS: int = 3600
+
+    # Compliance score: pending suggestions older than this count against the backlog
+    COMPLIANCE_BACKLOG_SLA_DAYS: int = 14
+
+    # Scheduled control assessments: occurrences are materialised this far ahead
+    ASSESSMENT_MATERIALIZE_HORIZON_DAYS: int = 30
+    ASSESSMENT_MATERIALIZE_BATCH_SIZE: int = 500
+
+    # Notification outbox: rows drained per run and delivery attempts before giving up
+    NOTIFICATION_DRAIN_BATCH_SIZE: int = 500
+    NOTIFICATION_MAX_ATTEMPTS: int = 5
+
+    # Background audit queue for non-critical events (AuditQueue); full queue drops events
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    AUDIT_QUEUE_BATCH_SIZE: int = 500
+
+    # audit_logs retention: months kept in the database before export to the archive
+    AUDIT_RETENTION_MONTHS: int = 24
+    AUDIT_PARTITION_PREMAKE_MONTHS: int = 3
+    # Local directory for audit archives; Supabase Storage is used when unset
+    AUDIT_ARCHIVE_DIR: str | None = None
+    AUDIT_ARCHIVE_PREFIX: str = "audit-archive"
+    # Widest since/until range the audit log API reads from the archive in one request
+    AUDIT_ARCHIVE_MAX_READ_DAYS: int = 366
+
+    # Metrics (/metrics, Prometheus text format)
+    METRICS_ENABLED: bool = True
+
+    # Per-request SQL profiler (X-DB-Query-* headers, N+1 warnings); off by default
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = 5
 
     # User
     ACCESS_SECRET_KEY: str
@@ -56,6 +124,10 @@ class Settings(BaseSettings):
             return {origin.strip() for origin in v.split(",") if origin.strip()}
         return v
 
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
@@ -0,0 +1,168 @@
+"""Per-tenant versioned response cache.
+
+Each cached resource (e.g. the regulatory framework tree) keeps a version counter
+per tenant. Writers bump the counter after committing; readers serve the stored
+pre-serialised body only when it was built at the current version, so a bump
+invalidates every process' copy at once. When ``settings.REDIS_URL`` is set the
+counters and bodies live in Redis and are shared between API processes and
+Celery workers; otherwise an in-memory store is used (tests, local dev). The
+in-memory store only sees invalidations from its own process, so its bodies
+expire after ``settings.TENANT_CACHE_LOCAL_TTL_SECONDS`` to bound how long a
+write made elsewhere (e.g. by an analysis worker) stays invisible.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from app.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    version: int
+    etag: str
+    body: bytes
+
+
+def compute_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class InMemoryTenantCache:
+    """Process-local store of version counters and bodies, which expire after ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._versions: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[float, CachedBody]] = {}
+
+    async def get(self, key: str) -> Tuple[int, Optional[CachedBody]]:
+        version = self._versions.get(key, 0)
+        expires_at, entry = self._entries.get(key, (0.0, None))
+        if entry is not None and (entry.version != version or expires_at <= time.monotonic()):
+            self._entries.pop(key, None)
+            entry = None
+        return version, entry
+
+    async def set(self, key: str, entry: CachedBody) -> None:
+        if entry.version == self._versions.get(key, 0):
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, entry)
+
+    async def bump(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+        self._entries.pop(key, None)
+
+
+class RedisTenantCache:
+    """Redis-backed store: ``<key>:version`` counter plus a ``<key>:body`` hash."""
+
+    def __init__(self, url: str, ttl_seconds: int):
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+        self._client_loop = None
+
+    def _get_client(self):
+        # Connections are bound to the event loop that opened them (see app.core.progress)
+        import redis.asyncio as redis
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(self.url)
+            self._client_loop = loop
+        return self._client
+
+    async def get(self, key: str) -> Tuple[int, Optional[CachedBody]]:
+        async with self._get_client().pipeline(transaction=False) as pipe:
+            pipe.get(f"{key}:version")
+            pipe.hgetall(f"{key}:body")
+            raw_version, fields = await pipe.execute()
+        version = int(raw_version or 0)
+        if not fields or int(fields[b"version"]) != version:
+            return version, None
+        return version, CachedBody(version, fields[b"etag"].decode(), fields[b"body"])
+
+    async def set(self, key: str, entry: CachedBody) -> None:
+        async with self._get_client().pipeline(transaction=True) as pipe:
+            pipe.hset(
+                f"{key}:body",
+                mapping={"version": entry.version, "etag": entry.etag, "body": entry.body},
+            )
+            pipe.expire(f"{key}:body", self.ttl_seconds)
+            await pipe.execute()
+
+    async def bump(self, key: str) -> None:
+        async with self._get_client().pipeline(transaction=True) as pipe:
+            pipe.incr(f"{key}:version")
+            pipe.delete(f"{key}:body")
+            await pipe.execute()
+
+
+_store = None
+
+
+def get_tenant_cache_store():
+    """Return the process-wide cache store (Redis if configured, else short-lived in-memory)."""
+    global _store
+    if _store is None:
+        if settings.REDIS_URL:
+            _store = RedisTenantCache(settings.REDIS_URL, settings.TENANT_CACHE_TTL_SECONDS)
+        else:
+            logger.warning(
+                "REDIS_URL is not set: tenant cache is per process and entries expire after %ss",
+                settings.TENANT_CACHE_LOCAL_TTL_SECONDS,
+            )
+            _store = InMemoryTenantCache(settings.TENANT_CACHE_LOCAL_TTL_SECONDS)
+    return _store
+
+
+def _cache_key(name: str, tenant_id: UUID) -> str:
+    return f"cache:{name}:{tenant_id}"
+
+
+async def get_cached(name: str, tenant_id: UUID) -> Tuple[int, Optional[CachedBody]]:
+    """Return the tenant's current version and the body cached at that version, if any.
+
+    A store outage is reported as a miss at version 0 so reads fall back to the DB.
+    """
+    try:
+        version, entry = await get_tenant_cache_store().get(_cache_key(name, tenant_id))
+    except Exception as e:
+        logger.warning(f"Cache lookup failed for {name}/{tenant_id}: {e}")
+        version, entry = 0, None
+    record_cache_lookup(name, entry is not None)
+    return version, entry
+
+
+async def store_cached(name: str, tenant_id: UUID, version: int, body: bytes) -> CachedBody:
+    """Cache ``body`` as built at ``version``; ignored if the version has moved on."""
+    entry = CachedBody(version, compute_etag(body), body)
+    try:
+        await get_tenant_cache_store().set(_cache_key(name, tenant_id), entry)
+    except Exception as e:
+        logger.warning(f"Cache store failed for {name}/{tenant_id}: {e}")
+    return entry
+
+
+async def invalidate(name: str, tenant_id: UUID) -> None:
+    """Bump the tenant's version for ``name``. Call after the write has committed."""
+    try:
+        await get_tenant_cache_store().bump(_cache_key(name, tenant_id))
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {name}/{tenant_id}: {e}")
@@ -22,7 +22,7 @@ celery_app = Celery(
     "worker",
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    include=["tasks.analysis"] # Explicitly include task modules
+    include=["tasks.analysis", "tasks.compliance", "tasks.notifications", "tasks.audit"] # Explicitly include task modules
 )
 
 celery_app.conf.update(
@@ -34,3 +34,38 @@ celery_app.conf.update(
     task_track_started=True,
     task_always_eager=CELERY_ALWAYS_EAGER,
 )
+
+# Reliability: a task is acknowledged only once it has finished, so a worker that
+# dies mid-analysis leaves the message to be redelivered after the visibility
+# timeout. Processing leases on the document (see tasks/analysis.py) keep such a
+# redelivery from running concurrently with a live attempt.
+celery_app.conf.update(
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    broker_transport_options={
+        "visibility_timeout": int(os.environ.get("CELERY_VISIBILITY_TIMEOUT", "3600")),
+    },
+    beat_schedule={
+        "reap-expired-analyses": {
+            "task": "reap_expired_analyses",
+            "schedule": float(os.environ.get("ANALYSIS_REAPER_INTERVAL_SECONDS", "60")),
+        },
+        "refresh-compliance-summaries": {
+            "task": "refresh_compliance_summaries",
+            "schedule": float(os.environ.get("COMPLIANCE_SUMMARY_REFRESH_SECONDS", "3600")),
+        },
+        "materialize-assessments": {
+            "task": "materialize_assessments",
+            "schedule": float(os.environ.get("ASSESSMENT_MATERIALIZE_INTERVAL_SECONDS", "3600")),
+        },
+        "deliver-notifications": {
+            "task": "deliver_notifications",
+            "schedule": float(os.environ.get("NOTIFICATION_DRAIN_INTERVAL_SECONDS", "60")),
+        },
+        "maintain-audit-logs": {
+            "task": "maintain_audit_logs",
+            "schedule": float(os.environ.get("AUDIT_MAINTENANCE_INTERVAL_SECONDS", "86400")),
+        },
+    },
+)
@@ -3,8 +3,9 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.database import get_async_session
-from app.models.user import User
+from app.models.user import ROLE_BITS, User, role_mask
 from app.core.security import get_current_user, UserToken
+from app.core.tenancy import set_tenant_context
 
 
 async def get_current_active_user(
@@ -58,12 +59,12 @@ async def get_current_active_user(
             detail="Inactive user",
         )
 
+    await set_tenant_context(db, user.tenant_id)
     return user
 
 
 async def get_current_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
-    # Check if "admin" is present in the user's roles list
-    if "admin" not in current_user.roles:
+    if not current_user.has_any_role(ROLE_BITS["admin"]):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The user doesn't have enough privileges",
@@ -72,13 +73,15 @@ async def get_current_admin_user(current_user: User = Depends(get_current_active
 
 
 def has_role(required_roles: List[str]) -> Callable:
+    unknown = set(required_roles) - ROLE_BITS.keys()
+    if unknown:
+        raise ValueError(f"Unknown roles: {sorted(unknown)}")
+    # Computed once per route; each request is a single AND against User.role_mask
+    required = role_mask(required_roles)
+
     async def role_checker(current_user: User = Depends(get_current_active_user)) -> User:
-        # Check if the user has ANY of the required roles (intersection check)
-        # current_user.roles is a list of strings
-        user_roles = set(current_user.roles)
-        required = set(required_roles)
-        
-        if not user_roles.intersection(required):
+        # Check if the user has ANY of the required roles
+        if not current_user.has_any_role(required):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"The user doesn't have enough privileges. Required one of: {required_roles}",
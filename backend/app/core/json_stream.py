@@ -0,0 +1,110 @@
+"""Incremental scanning of a JSON object that arrives in pieces (streamed LLM output).
+
+``JSONItemStream`` only tracks strings, escapes and bracket depth, so a value is
+handed out as raw JSON text as soon as its closing bracket arrives and the caller
+validates it on its own. Members of the root object named in ``array_keys`` are
+handed out element by element; those in ``value_keys`` as a whole. A value that
+turns out malformed does not affect the ones before it.
+"""
+
+import json
+import re
+from typing import Iterable, List, Optional, Tuple
+
+# Characters that can change the scanner state; everything else is skipped over
+_TOKEN_RE = re.compile(r'["\\{}\[\]:,]')
+
+
+class JSONItemStream:
+    def __init__(self, array_keys: Iterable[str] = (), value_keys: Iterable[str] = ()):
+        self.array_keys = frozenset(array_keys)
+        self.value_keys = frozenset(value_keys)
+        # True once the root object has closed; later input is ignored
+        self.complete = False
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        # Start of a string directly inside the root object (a candidate key)
+        self._string_start: Optional[int] = None
+        self._pending_key: Optional[str] = None
+        self._key: Optional[str] = None
+        self._array_key: Optional[str] = None
+        self._item_start: Optional[int] = None
+        self._item_key: Optional[str] = None
+        self._item_depth = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """Scan ``chunk`` and return ``(key, raw_json)`` for every value it completed."""
+        self._text += chunk
+        text, stack, items = self._text, self._stack, []
+        while not self.complete:
+            match = _TOKEN_RE.search(text, self._pos)
+            if match is None:
+                # Past an escape at the very end, _pos is already beyond the text
+                self._pos = max(self._pos, len(text))
+                break
+            index = match.start()
+            char = text[index]
+            self._pos = index + 1
+
+            if self._in_string:
+                if char == "\\":
+                    # Skip the escaped character, which may still be on its way
+                    self._pos = index + 2
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_start is not None:
+                        try:
+                            self._pending_key = json.loads(text[self._string_start:index + 1])
+                        except ValueError:
+                            self._pending_key = None
+                        self._string_start = None
+                continue
+
+            depth = len(stack)
+            if char == '"':
+                self._in_string = True
+                if depth == 1:
+                    self._string_start = index
+            elif char == ":":
+                if depth == 1:
+                    self._key = self._pending_key
+            elif char == ",":
+                if depth == 1:
+                    self._key = self._pending_key = None
+            elif char in "{[":
+                if self._item_start is None:
+                    if depth == 1 and char == "[" and self._key in self.array_keys:
+                        self._array_key = self._key
+                    elif depth == 1 and char == "{" and self._key in self.value_keys:
+                        self._item_start, self._item_key, self._item_depth = index, self._key, depth
+                    elif depth == 2 and self._array_key is not None:
+                        self._item_start, self._item_key, self._item_depth = index, self._array_key, depth
+                stack.append(char)
+            elif stack:
+                stack.pop()
+                depth = len(stack)
+                if self._item_start is not None and depth == self._item_depth:
+                    items.append((self._item_key, text[self._item_start:index + 1]))
+                    self._item_start = self._item_key = None
+                if depth == 1:
+                    self._array_key = None
+                elif depth == 0:
+                    self.complete = True
+        self._trim()
+        return items
+
+    def _trim(self) -> None:
+        """Drop scanned text that no open key or value still points into."""
+        start = min(
+            (index for index in (self._item_start, self._string_start) if index is not None),
+            default=min(self._pos, len(self._text)),
+        )
+        if start:
+            self._text = self._text[start:]
+            self._pos -= start
+            if self._item_start is not None:
+                self._item_start -= start
+            if self._string_start is not None:
+                self._string_start -= start
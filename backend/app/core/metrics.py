@@ -0,0 +1,421 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+A deliberately small subset of the Prometheus client model (counters, gauges and
+histograms with labels) so ``/metrics`` works locally without extra packages or
+external services. Metrics are per process: Celery workers keep their own
+registry, and cross-process pipeline history lives in ``analysis_jobs``.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SLOW_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def sum(self, **labels) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(key, (list(counts), total)) for key, (counts, total) in self._values.items()]
+        lines = self._header()
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Holds metrics plus collectors that refresh gauges right before a scrape."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                # A failing collector (e.g. broker unreachable) must not break the scrape
+                pass
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# --- HTTP ---
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route id.",
+    ("route", "method", "status"),
+))
+HTTP_REQUESTS_IN_PROGRESS = REGISTRY.register(Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+))
+
+# --- Database ---
+DB_QUERY_DURATION = REGISTRY.register(Histogram(
+    "db_query_duration_seconds",
+    "Duration of individual SQL statements.",
+))
+DB_QUERIES_PER_REQUEST = REGISTRY.register(Histogram(
+    "db_queries_per_request",
+    "Number of SQL statements executed while serving a request.",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+))
+DB_TIME_PER_REQUEST = REGISTRY.register(Histogram(
+    "db_time_per_request_seconds",
+    "Total SQL time spent while serving a request.",
+    ("route",),
+))
+DB_POOL_CHECKED_OUT = REGISTRY.register(Gauge(
+    "db_pool_connections_checked_out",
+    "Database connections currently checked out of the pool.",
+))
+DB_POOL_CONNECTS = REGISTRY.register(Counter(
+    "db_pool_connects_total",
+    "New DBAPI connections opened by the pool.",
+))
+
+# --- Celery ---
+CELERY_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "celery_queue_depth",
+    "Messages waiting in the Celery broker queue (Redis brokers only).",
+    ("queue",),
+))
+
+# --- Analysis pipeline ---
+ANALYSIS_STAGE_DURATION = REGISTRY.register(Histogram(
+    "analysis_stage_duration_seconds",
+    "Duration of each document analysis stage.",
+    ("stage",),
+    buckets=SLOW_BUCKETS,
+))
+ANALYSIS_JOBS = REGISTRY.register(Counter(
+    "analysis_jobs_total",
+    "Finished document analysis attempts by outcome.",
+    ("status",),
+))
+
+# --- LLM ---
+LLM_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "llm_request_duration_seconds",
+    "Latency of LLM completion calls.",
+    ("model", "outcome"),
+    buckets=SLOW_BUCKETS,
+))
+LLM_TIME_TO_FIRST_ITEM = REGISTRY.register(Histogram(
+    "llm_time_to_first_item_seconds",
+    "Time from sending a streamed LLM request to the first complete item parsed from its output.",
+    ("model",),
+    buckets=SLOW_BUCKETS,
+))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "llm_tokens_total",
+    "LLM tokens consumed.",
+    ("model", "kind"),
+))
+
+# --- Caches ---
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss).",
+    ("cache", "result"),
+))
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+# --- Per-request SQL accounting ---
+
+class RequestDBStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_db_stats: contextvars.ContextVar[Optional[RequestDBStats]] = contextvars.ContextVar(
+    "request_db_stats", default=None
+)
+
+
+# Called with (statement, seconds) after every statement; see add_query_observer
+_query_observers: List[Callable[[str, float], None]] = []
+_cursor_listeners_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start_time")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    for observer in _query_observers:
+        observer(statement, elapsed)
+
+
+def add_query_observer(observer: Callable[[str, float], None]) -> None:
+    """
+    Feed ``observer`` from the one pair of engine cursor listeners shared by the
+    metrics and the query profiler, installing the listeners on first use.
+    """
+    global _cursor_listeners_installed
+    if observer not in _query_observers:
+        _query_observers.append(observer)
+    if not _cursor_listeners_installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _cursor_listeners_installed = True
+
+
+def _record_query_metrics(statement: str, elapsed: float) -> None:
+    DB_QUERY_DURATION.observe(elapsed)
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    DB_POOL_CONNECTS.inc()
+
+
+_instrumented = False
+
+
+def instrument_sqlalchemy() -> None:
+    """Attach timing and pool listeners to every engine and pool (idempotent)."""
+    global _instrumented
+    if _instrumented:
+        return
+    add_query_observer(_record_query_metrics)
+    event.listen(Pool, "checkout", _on_checkout)
+    event.listen(Pool, "checkin", _on_checkin)
+    event.listen(Pool, "connect", _on_connect)
+    _instrumented = True
+
+
+def _collect_celery_queue_depth(queues: Iterable[str] = ("celery",)) -> None:
+    from app.core.celery_app import CELERY_BROKER_URL
+
+    if not CELERY_BROKER_URL.startswith(("redis://", "rediss://")):
+        return
+    import redis
+
+    client = redis.Redis.from_url(CELERY_BROKER_URL, socket_connect_timeout=0.5, socket_timeout=0.5)
+    try:
+        for queue in queues:
+            CELERY_QUEUE_DEPTH.set(client.llen(queue), queue=queue)
+    finally:
+        client.close()
+
+
+REGISTRY.add_collector(_collect_celery_queue_depth)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each request by the matched route's unique id.
+
+    Pure ASGI (not BaseHTTPMiddleware) so streaming responses are not buffered and
+    the per-request SQL counters share the handler's context.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = _request_db_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            _request_db_stats.reset(token)
+            route = scope.get("route")
+            route_id = getattr(route, "unique_id", None) or "unmatched"
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                route=route_id,
+                method=scope["method"],
+                status=str(status_code),
+            )
+            DB_QUERIES_PER_REQUEST.observe(stats.queries, route=route_id)
+            DB_TIME_PER_REQUEST.observe(stats.seconds, route=route_id)
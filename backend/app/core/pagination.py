@@ -0,0 +1,43 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor encodes the sort key of the last row on a page, ``(timestamp, id)`` -
+usually ``created_at`` - so the next page is fetched with a range predicate on an index instead of an
+OFFSET that rescans every earlier row.
+"""
+
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_after(created_at_column, id_column, cursor: str, descending: bool = True):
+    """Predicate selecting rows after ``cursor`` in ``created_at DESC, id DESC`` order
+    (``ASC, ASC`` with ``descending=False``)."""
+    created_at, row_id = decode_cursor(cursor)
+    if descending:
+        return or_(
+            created_at_column < created_at,
+            and_(created_at_column == created_at, id_column < row_id),
+        )
+    return or_(
+        created_at_column > created_at,
+        and_(created_at_column == created_at, id_column > row_id),
+    )
@@ -0,0 +1,144 @@
+"""Lightweight pub/sub for document analysis progress events.
+
+The analysis pipeline publishes a ``DocumentProgressEvent`` at every stage and
+the SSE endpoints in ``app/api/v1/endpoints/documents.py`` relay them to the
+browser. When ``settings.REDIS_URL`` is set, events travel over Redis pub/sub so
+that Celery workers and API processes can talk to each other; otherwise an
+in-memory broker is used (single process: tests, eager mode, local dev).
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Set
+from uuid import UUID
+
+from app.config import settings
+from app.schemas.progress import DocumentProgressEvent
+
+logger = logging.getLogger(__name__)
+
+
+def document_channel(document_id: UUID) -> str:
+    return f"progress:document:{document_id}"
+
+
+def tenant_channel(tenant_id: UUID) -> str:
+    return f"progress:tenant:{tenant_id}"
+
+
+class InMemoryProgressBroker:
+    """Process-local broker backed by one bounded asyncio.Queue per subscriber."""
+
+    QUEUE_SIZE = 100
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in list(self._subscribers.get(channel, ())):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow consumer: drop the event rather than block the pipeline
+                logger.warning(f"Dropping progress event for slow subscriber on {channel}")
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        """Register a subscriber immediately; yields an async iterator of messages."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._subscribers.setdefault(channel, set()).add(queue)
+
+        async def messages() -> AsyncIterator[str]:
+            while True:
+                yield await queue.get()
+
+        try:
+            yield messages()
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+
+class RedisProgressBroker:
+    """Redis pub/sub broker, shared between API processes and Celery workers."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._client = None
+        self._client_loop = None
+
+    def _get_client(self):
+        # Celery tasks run each job in a fresh event loop (asyncio.run), and redis
+        # connections are bound to the loop that opened them.
+        import redis.asyncio as redis
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = redis.from_url(self.url, decode_responses=True)
+            self._client_loop = loop
+        return self._client
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._get_client().publish(channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        """Subscribe before yielding so no event published afterwards is missed."""
+        pubsub = self._get_client().pubsub()
+        await pubsub.subscribe(channel)
+
+        async def messages() -> AsyncIterator[str]:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield message["data"]
+
+        try:
+            yield messages()
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+
+_broker = None
+
+
+def get_progress_broker():
+    """Return the process-wide progress broker (Redis if configured, else in-memory)."""
+    global _broker
+    if _broker is None:
+        if settings.REDIS_URL:
+            _broker = RedisProgressBroker(settings.REDIS_URL)
+        else:
+            _broker = InMemoryProgressBroker()
+    return _broker
+
+
+async def publish_progress(event: DocumentProgressEvent) -> None:
+    """Publish an event on the document and tenant channels.
+
+    Progress reporting is best-effort: a broker outage must never fail an analysis.
+    """
+    try:
+        broker = get_progress_broker()
+        message = event.model_dump_json()
+        await broker.publish(document_channel(event.document_id), message)
+        if event.tenant_id:
+            await broker.publish(tenant_channel(event.tenant_id), message)
+    except Exception as e:
+        logger.warning(f"Failed to publish progress event for document {event.document_id}: {e}")
+
+
+@asynccontextmanager
+async def subscribe_progress(channel: str):
+    """Subscribe to a progress channel, yielding an async iterator of events."""
+    async with get_progress_broker().subscribe(channel) as messages:
+
+        async def events() -> AsyncIterator[DocumentProgressEvent]:
+            async for message in messages:
+                yield DocumentProgressEvent.model_validate_json(message)
+
+        yield events()
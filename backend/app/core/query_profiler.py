@@ -0,0 +1,162 @@
+"""Opt-in SQL query profiler and N+1 detector.
+
+Counts and times every statement executed while serving a request (or inside a
+``capture_queries()`` block), grouping them by normalized shape so repeated
+statements - the signature of an N+1 loop - stand out. Enabled for HTTP requests
+with ``QUERY_PROFILER_ENABLED``; tests use it through the ``query_budget`` marker
+and fixture in ``tests/conftest.py``. Statements are timed by the engine listeners
+in ``app.core.metrics``, which feed this module as a query observer.
+"""
+
+import contextvars
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.metrics import add_query_observer
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NUMBERED_PARAM = re.compile(r"\$\d+")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|:\w+")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape: literals and bind parameters become ``?``."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBERED_PARAM.sub("?", shape)
+    shape = _NAMED_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PARAM_LIST.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class StatementStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+class QueryProfile:
+    """Statements observed in one request or capture block."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        shape = normalize_statement(statement)
+        with self._lock:
+            self.count += 1
+            self.seconds += elapsed
+            stats = self.shapes.setdefault(shape, StatementStats())
+            stats.count += 1
+            stats.seconds += elapsed
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first."""
+        return sorted(
+            ((shape, stats.count) for shape, stats in self.shapes.items() if stats.count >= threshold),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def summary(self, threshold: int) -> str:
+        lines = [f"{self.count} queries in {self.seconds * 1000:.1f} ms"]
+        for shape, count in self.repeated(threshold):
+            lines.append(f"  x{count}: {shape[:200]}")
+        return "\n".join(lines)
+
+
+_request_profile: contextvars.ContextVar[Optional[QueryProfile]] = contextvars.ContextVar(
+    "request_query_profile", default=None
+)
+# Process-wide captures (tests): see every statement regardless of task context
+_captures: List[QueryProfile] = []
+_captures_lock = threading.Lock()
+
+
+def _record_profiles(statement: str, elapsed: float) -> None:
+    profile = _request_profile.get()
+    if profile is not None:
+        profile.record(statement, elapsed)
+    if _captures:
+        with _captures_lock:
+            active = list(_captures)
+        for capture in active:
+            capture.record(statement, elapsed)
+
+
+def install() -> None:
+    """Start receiving statements from the shared engine listeners (idempotent)."""
+    add_query_observer(_record_profiles)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryProfile]:
+    """Record every statement executed in this process while the block runs."""
+    install()
+    profile = QueryProfile()
+    with _captures_lock:
+        _captures.append(profile)
+    try:
+        yield profile
+    finally:
+        with _captures_lock:
+            _captures.remove(profile)
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware adding per-request SQL counts to the response and the log.
+
+    Headers: ``X-DB-Query-Count``, ``X-DB-Query-Time-Ms`` and, when a statement
+    shape repeats ``repeat_threshold`` times or more, ``X-DB-Repeated-Queries``.
+    Statements issued after the response headers are sent (streaming bodies) are
+    only reflected in the log line.
+    """
+
+    def __init__(self, app, repeat_threshold: int = 5):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+        token = _request_profile.set(profile)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(profile.count).encode()))
+                headers.append((b"x-db-query-time-ms", f"{profile.seconds * 1000:.1f}".encode()))
+                repeated = profile.repeated(self.repeat_threshold)
+                if repeated:
+                    headers.append((b"x-db-repeated-queries", str(len(repeated)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_profile.reset(token)
+            route = scope.get("route")
+            route_id = getattr(route, "unique_id", None) or scope.get("path", "")
+            repeated = profile.repeated(self.repeat_threshold)
+            log = logger.warning if repeated else logger.info
+            log(
+                f"[QUERY PROFILE] {scope['method']} {route_id}: "
+                f"{profile.summary(self.repeat_threshold)}"
+            )
@@ -0,0 +1,66 @@
+"""Fast JSON responses.
+
+``FastJSONResponse`` is the app's default response class: it renders with orjson
+when installed and with pydantic-core's Rust serializer otherwise, instead of the
+standard ``json`` module. ``ResponseSerializer`` goes one step further for hot list
+endpoints: it is built once per response schema and turns ORM rows straight into
+JSON bytes (validation and serialisation both run in pydantic-core), bypassing
+FastAPI's ``response_model`` validation and ``jsonable_encoder`` pass. Endpoints
+keep their ``response_model`` for the OpenAPI schema.
+"""
+
+from typing import Any, Generic, Mapping, Optional, TypeVar
+
+import pydantic_core
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+T = TypeVar("T")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialise plain data (dicts, lists, UUIDs, datetimes, pydantic models) to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=pydantic_core.to_jsonable_python,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ResponseSerializer(Generic[T]):
+    """Precomputed validator/serializer pair for one response schema.
+
+        DOCUMENT_LIST = ResponseSerializer(List[DocumentRead])
+        return DOCUMENT_LIST.response(rows)
+    """
+
+    def __init__(self, schema: type[T]):
+        self.adapter: TypeAdapter[T] = TypeAdapter(schema)
+
+    def dump_json(self, obj: Any) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(obj, from_attributes=True))
+
+    def response(
+        self,
+        obj: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        return Response(
+            content=self.dump_json(obj),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
@@ -0,0 +1,63 @@
+"""Per-transaction tenant context for Postgres row-level security.
+
+Once a request's user is known, ``set_tenant_context`` tags its session with the
+tenant. Every transaction the session then begins runs
+``set_config('app.tenant_id', <tenant>, true)`` - the parametrisable form of
+``SET LOCAL`` - which the "App Tenant Context" policies (migration e6a8c0d2f457)
+compare against. The setting ends with the transaction, so pooled connections
+never carry a tenant over.
+
+``tenant_clause`` builds the ``tenant_id = :tenant`` predicate for queries on
+RLS-protected tables. With ``TENANT_FILTER_VIA_RLS`` enabled and the context set on
+a Postgres session, it returns no predicate and leaves filtering to the policy.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event, text, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+# Session.info key holding the tenant of the current request
+TENANT_KEY = "tenant_id"
+
+# Tables whose policies read app.tenant_id
+RLS_TABLES = ("risks", "controls", "business_processes", "regulatory_frameworks")
+
+_SET_TENANT_SQL = text("SELECT set_config('app.tenant_id', :tenant_id, true)")
+
+
+def _is_postgres(bind) -> bool:
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+async def set_tenant_context(db: AsyncSession, tenant_id: Optional[UUID]) -> None:
+    """Scope every transaction of ``db`` to ``tenant_id``, including one already open."""
+    if tenant_id is None or db.info.get(TENANT_KEY) == tenant_id:
+        return
+    db.info[TENANT_KEY] = tenant_id
+    if db.in_transaction() and _is_postgres(db.bind):
+        # after_begin has already run for the open transaction
+        await db.execute(_SET_TENANT_SQL, {"tenant_id": str(tenant_id)})
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_tenant_context(session: Session, transaction, connection) -> None:
+    tenant_id = session.info.get(TENANT_KEY)
+    if tenant_id is not None and _is_postgres(connection):
+        connection.execute(_SET_TENANT_SQL, {"tenant_id": str(tenant_id)})
+
+
+def tenant_clause(db: AsyncSession, column, tenant_id: UUID):
+    """``column == tenant_id``, or no predicate when RLS already enforces the same tenant."""
+    if (
+        settings.TENANT_FILTER_VIA_RLS
+        and column.table.name in RLS_TABLES
+        and db.info.get(TENANT_KEY) == tenant_id
+        and _is_postgres(db.bind)
+    ):
+        return true()
+    return column == tenant_id
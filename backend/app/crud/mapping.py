@@ -1,7 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
-from sqlalchemy import and_, delete
+from sqlalchemy import and_, delete, insert
 from uuid import UUID
 from app.models.mapping import ControlRegulatoryRequirement
 from app.models.compliance import Control, RegulatoryFramework
@@ -18,21 +18,41 @@ class MappingCRUD:
         requirement_id: UUID,
         tenant_id: UUID,
         created_by: UUID,
-    ) -> ControlRegulatoryRequirement:
+    ) -> MappingDetail:
         """
         Create a new control-to-requirement mapping.
-        Returns the created mapping record.
+        Returns the created mapping with control and requirement names, resolved
+        by the same INSERT ... RETURNING statement so the cost does not depend on
+        how many mappings the control already has.
         """
-        mapping = ControlRegulatoryRequirement(
-            control_id=control_id,
-            regulatory_requirement_id=requirement_id,
-            tenant_id=tenant_id,
-            created_by=created_by,
+        control_name = (
+            select(Control.name).where(Control.id == control_id).scalar_subquery()
         )
-        db.add(mapping)
-        await db.flush()
-        await db.refresh(mapping)
-        return mapping
+        requirement_name = (
+            select(RegulatoryFramework.name)
+            .where(RegulatoryFramework.id == requirement_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            insert(ControlRegulatoryRequirement)
+            .values(
+                control_id=control_id,
+                regulatory_requirement_id=requirement_id,
+                tenant_id=tenant_id,
+                created_by=created_by,
+            )
+            .returning(
+                ControlRegulatoryRequirement.id,
+                ControlRegulatoryRequirement.control_id,
+                ControlRegulatoryRequirement.regulatory_requirement_id,
+                ControlRegulatoryRequirement.created_at,
+                ControlRegulatoryRequirement.created_by,
+                control_name.label("control_name"),
+                requirement_name.label("requirement_name"),
+            )
+        )
+        result = await db.execute(stmt)
+        return MappingDetail.model_validate(result.mappings().one())
 
     @staticmethod
     async def get_mapping(
@@ -61,21 +81,25 @@ class MappingCRUD:
         control_id: UUID,
         requirement_id: UUID,
         tenant_id: UUID,
-    ) -> bool:
+    ) -> Optional[UUID]:
         """
         Delete a mapping.
-        Returns True if deleted, False if not found.
+        Returns the ID of the deleted mapping (via DELETE ... RETURNING),
+        or None if not found.
         """
-        stmt = delete(ControlRegulatoryRequirement).where(
-            and_(
-                ControlRegulatoryRequirement.control_id == control_id,
-                ControlRegulatoryRequirement.regulatory_requirement_id == requirement_id,
-                ControlRegulatoryRequirement.tenant_id == tenant_id,
+        stmt = (
+            delete(ControlRegulatoryRequirement)
+            .where(
+                and_(
+                    ControlRegulatoryRequirement.control_id == control_id,
+                    ControlRegulatoryRequirement.regulatory_requirement_id == requirement_id,
+                    ControlRegulatoryRequirement.tenant_id == tenant_id,
+                )
             )
+            .returning(ControlRegulatoryRequirement.id)
         )
         result = await db.execute(stmt)
-        await db.flush()
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
 
     @staticmethod
     async def get_mappings_for_control(
@@ -181,7 +205,7 @@ class MappingCRUD:
         """
         Check if a control exists in the tenant.
         """
-        stmt = select(Control).where(
+        stmt = select(Control.id).where(
             and_(Control.id == control_id, Control.tenant_id == tenant_id)
         )
         result = await db.execute(stmt)
@@ -194,7 +218,7 @@ class MappingCRUD:
         """
         Check if a regulatory requirement exists in the tenant.
         """
-        stmt = select(RegulatoryFramework).where(
+        stmt = select(RegulatoryFramework.id).where(
             and_(
                 RegulatoryFramework.id == requirement_id,
                 RegulatoryFramework.tenant_id == tenant_id,
@@ -1,41 +1,48 @@
-from typing import AsyncGenerator
+import logging
+import time
+from typing import AsyncGenerator, List, Optional
 from urllib.parse import urlparse
 
-from fastapi import Depends
+from fastapi import Depends, Request, Response
 from fastapi_users.db import SQLAlchemyUserDatabase
-from sqlalchemy import NullPool
+from sqlalchemy import NullPool, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from .config import settings
 from .models import Base, User
 
+logger = logging.getLogger(__name__)
 
-# Handle empty or invalid DATABASE_URL
-if not settings.DATABASE_URL or settings.DATABASE_URL.strip() == "":
-    # Use in-memory SQLite if DATABASE_URL is empty (for tests)
-    async_db_connection_url = "sqlite+aiosqlite:///:memory:"
-else:
-    parsed_db_url = urlparse(settings.DATABASE_URL)
+
+def _async_connection_url(url: Optional[str]) -> str:
+    """Map a configured database URL onto its async driver."""
+    # Handle empty or invalid DATABASE_URL
+    if not url or url.strip() == "":
+        # Use in-memory SQLite if DATABASE_URL is empty (for tests)
+        return "sqlite+aiosqlite:///:memory:"
+
+    parsed_db_url = urlparse(url)
 
     if parsed_db_url.scheme in ["postgresql", "postgres"]:
-        async_db_connection_url = (
+        return (
             f"postgresql+asyncpg://{parsed_db_url.username}:{parsed_db_url.password}@"
             f"{parsed_db_url.hostname}{':' + str(parsed_db_url.port) if parsed_db_url.port else ''}"
             f"{parsed_db_url.path}"
         )
     elif parsed_db_url.scheme == "sqlite":
-        async_db_connection_url = settings.DATABASE_URL.replace(
-            "sqlite://", "sqlite+aiosqlite://"
-        )
+        return url.replace("sqlite://", "sqlite+aiosqlite://")
     elif parsed_db_url.scheme in ["http", "https"]:
         # If DATABASE_URL is an HTTP(S) URL (like Supabase project URL), use in-memory SQLite
         # This happens when DATABASE_URL is misconfigured - it should be a PostgreSQL connection string
-        async_db_connection_url = "sqlite+aiosqlite:///:memory:"
+        return "sqlite+aiosqlite:///:memory:"
     elif not parsed_db_url.scheme:
         # Empty scheme means invalid URL, use in-memory SQLite
-        async_db_connection_url = "sqlite+aiosqlite:///:memory:"
-    else:
-        async_db_connection_url = settings.DATABASE_URL
+        return "sqlite+aiosqlite:///:memory:"
+    return url
+
+
+async_db_connection_url = _async_connection_url(settings.DATABASE_URL)
 
 # Disable connection pooling for serverless environments like Vercel
 engine = create_async_engine(async_db_connection_url, poolclass=NullPool)
@@ -44,14 +51,159 @@ async_session_maker = async_sessionmaker(
     engine, expire_on_commit=settings.EXPIRE_ON_COMMIT
 )
 
+# Cookie holding the time (epoch seconds) until which this client reads from the primary
+READ_PRIMARY_COOKIE = "db_read_primary_until"
+
+# Session.info keys used for read-your-writes stickiness
+_RESPONSE_KEY = "response"
+_WROTE_KEY = "wrote"
+_REPLICA_KEY = "replica"
+
+
+class ReplicaWriteError(RuntimeError):
+    """A write was attempted through a session bound to a read replica."""
+
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReplicaSet:
+    """
+    Read replicas chosen round-robin, skipping any whose replication lag exceeds
+    REPLICA_MAX_LAG_SECONDS or that cannot be reached. Each replica's health is
+    re-measured at most every REPLICA_LAG_CHECK_SECONDS.
+    """
+
+    def __init__(self, session_makers: List[async_sessionmaker]):
+        self.session_makers = session_makers
+        self._next = 0
+        self._health: dict[int, tuple[float, bool]] = {}
+
+    async def _lag_seconds(self, index: int) -> float:
+        async with self.session_makers[index]() as session:
+            if session.bind.dialect.name != "postgresql":
+                # No replication to measure (e.g. SQLite copies in local setups)
+                return 0.0
+            return float((await session.execute(REPLICA_LAG_SQL)).scalar() or 0)
+
+    async def _is_healthy(self, index: int) -> bool:
+        checked_at, healthy = self._health.get(index, (0.0, False))
+        if time.monotonic() - checked_at < settings.REPLICA_LAG_CHECK_SECONDS:
+            return healthy
+        try:
+            lag = await self._lag_seconds(index)
+            healthy = lag <= settings.REPLICA_MAX_LAG_SECONDS
+            if not healthy:
+                logger.warning(f"Replica {index} is {lag:.1f}s behind, reading from the primary")
+        except Exception as e:
+            logger.warning(f"Replica {index} unavailable, reading from the primary: {e}")
+            healthy = False
+        self._health[index] = (time.monotonic(), healthy)
+        return healthy
+
+    async def pick(self) -> Optional[async_sessionmaker]:
+        """Session factory of the next healthy replica, or None to use the primary."""
+        for _ in range(len(self.session_makers)):
+            index = self._next % len(self.session_makers)
+            self._next += 1
+            if await self._is_healthy(index):
+                return self.session_makers[index]
+        return None
+
+
+replicas = ReplicaSet(
+    [
+        async_sessionmaker(
+            create_async_engine(_async_connection_url(url), poolclass=NullPool),
+            expire_on_commit=settings.EXPIRE_ON_COMMIT,
+        )
+        for url in settings.replica_urls
+    ]
+)
+
+
+def _refuse_replica_write(session: Session) -> None:
+    # Fail loudly instead of with whatever error the read-only replica raises
+    if session.info.get(_REPLICA_KEY):
+        raise ReplicaWriteError("Read session is bound to a replica; write through get_async_session")
+
+
+@event.listens_for(Session, "before_flush")
+def _check_orm_write(session: Session, flush_context, instances) -> None:
+    _refuse_replica_write(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_orm_write(session: Session, flush_context) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _refuse_replica_write(orm_execute_state.session)
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _stick_to_primary(session: Session) -> None:
+    """After a request commits a write, keep that client's reads on the primary for a while."""
+    response = session.info.get(_RESPONSE_KEY)
+    if response is not None and session.info.pop(_WROTE_KEY, False):
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            str(int(time.time()) + settings.READ_YOUR_WRITES_SECONDS),
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+
 
 async def create_db_and_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_session(response: Response = None) -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
+        if response is not None:
+            session.info[_RESPONSE_KEY] = response
+        yield session
+
+
+def _reads_pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(
+    request: Request, primary: AsyncSession = Depends(get_async_session)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only endpoints (dashboards, reports, listings).
+
+    Uses a healthy replica when DATABASE_REPLICA_URLS is set, and the primary
+    otherwise, when every replica lags, or when this client wrote recently. The
+    primary session is only connected if it is actually used. Writes through a
+    replica session raise ``ReplicaWriteError``.
+    """
+    session_maker = None
+    if replicas.session_makers and not _reads_pinned_to_primary(request):
+        session_maker = await replicas.pick()
+    if session_maker is None:
+        yield primary
+        return
+    async with session_maker() as session:
+        session.info[_REPLICA_KEY] = True
         yield session
 
 
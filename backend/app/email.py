@@ -1,6 +1,9 @@
+from email.message import EmailMessage
 from pathlib import Path
+from typing import Optional
 import urllib.parse
 
+import aiosmtplib
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from .config import settings
 from .models import User
@@ -39,3 +42,60 @@ async def send_reset_password_email(user: User, token: str):
 
     fm = FastMail(conf)
     await fm.send_message(message, template_name="password_reset.html")
+
+
+class SMTPMailer:
+    """SMTP client that keeps one connection open for every message sent in its ``async with`` block.
+
+    Used by the notification worker so a drain run pays the connect/TLS/login cost once
+    rather than once per message as ``FastMail.send_message`` does.
+    """
+
+    def __init__(
+        self,
+        hostname: Optional[str] = None,
+        port: Optional[int] = None,
+        start_tls: Optional[bool] = None,
+        use_tls: Optional[bool] = None,
+        use_credentials: Optional[bool] = None,
+    ):
+        self.hostname = hostname or settings.MAIL_SERVER
+        self.port = port or settings.MAIL_PORT
+        self.start_tls = settings.MAIL_STARTTLS if start_tls is None else start_tls
+        self.use_tls = settings.MAIL_SSL_TLS if use_tls is None else use_tls
+        self.use_credentials = settings.USE_CREDENTIALS if use_credentials is None else use_credentials
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+
+    async def _connect(self) -> None:
+        self._smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            validate_certs=settings.VALIDATE_CERTS,
+        )
+        await self._smtp.connect()
+        if self.use_credentials:
+            await self._smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+
+    async def __aenter__(self) -> "SMTPMailer":
+        await self._connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._smtp and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except aiosmtplib.SMTPException:
+                self._smtp.close()
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        message = EmailMessage()
+        message["From"] = f"{settings.MAIL_FROM_NAME} <{settings.MAIL_FROM}>"
+        message["To"] = to
+        message["Subject"] = subject
+        message.set_content(body)
+        # Reconnect once if the server dropped an idle connection
+        if not self._smtp.is_connected:
+            await self._connect()
+        await self._smtp.send_message(message)
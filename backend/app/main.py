@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
@@ -10,17 +12,34 @@ from app.api.v1.endpoints.dashboard import router as dashboard_router
 from app.api.v1.endpoints.assessments import router as assessments_router
 from app.api.v1.endpoints.mapping import router as mapping_router
 from app.api.v1.endpoints.reports import router as reports_router
+from app.api.v1.endpoints.analysis_jobs import router as analysis_jobs_router
+from app.api.v1.endpoints.control_assessments import router as control_assessments_router
 from app.config import settings
+from app.core.metrics import MetricsMiddleware, instrument_sqlalchemy
+from app.core.query_profiler import QueryProfilerMiddleware
+from app.core.responses import FastJSONResponse
 from app.routes.compliance import router as compliance_router
 from app.routes.items import router as items_router
+from app.routes.metrics import router as metrics_router
+from app.services.audit_service import audit_queue
 
 from .schemas import UserCreate, UserRead, UserUpdate
 from .users import AUTH_URL_PATH, auth_backend, fastapi_users
 from .utils import simple_generate_unique_route_id
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Write out queued non-critical audit events before the process exits
+    await audit_queue.close()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     generate_unique_id_function=simple_generate_unique_route_id,
     openapi_url=settings.OPENAPI_URL,
+    default_response_class=FastJSONResponse,
 )
 
 # Middleware for CORS configuration
@@ -30,8 +49,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset-paginated lists return the next page's cursor in this header
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Request latency and per-request SQL counters, exposed on /metrics
+if settings.METRICS_ENABLED:
+    instrument_sqlalchemy()
+    app.add_middleware(MetricsMiddleware)
+
+# Opt-in SQL profiler for hunting N+1 queries
+if settings.QUERY_PROFILER_ENABLED:
+    app.add_middleware(
+        QueryProfilerMiddleware, repeat_threshold=settings.QUERY_PROFILER_REPEAT_THRESHOLD
+    )
+
 # Include authentication and user management routes
 app.include_router(
     fastapi_users.get_auth_router(auth_backend),
@@ -59,6 +91,8 @@ app.include_router(
     tags=["users"],
 )
 
+app.include_router(metrics_router)
+
 # Include items routes
 app.include_router(items_router, prefix="/items")
 app.include_router(compliance_router, prefix="/api/v1")
@@ -70,5 +104,7 @@ app.include_router(dashboard_router, prefix="/api/v1/dashboard", tags=["dashboar
 app.include_router(assessments_router, prefix="/api/v1/assessments", tags=["assessments"])
 app.include_router(mapping_router, prefix="/api/v1/mappings", tags=["mappings"])
 app.include_router(reports_router, prefix="/api/v1/reports", tags=["reports"])
+app.include_router(analysis_jobs_router, prefix="/api/v1/analysis-jobs", tags=["analysis-jobs"])
+app.include_router(control_assessments_router, prefix="/api/v1/control-assessments", tags=["control-assessments"])
 
 add_pagination(app)
@@ -13,4 +13,15 @@ from .mapping import (
     ControlRegulatoryRequirement as ControlRegulatoryRequirement,
 )
 from .suggestion import AISuggestion as AISuggestion, SuggestionStatus as SuggestionStatus, SuggestionType as SuggestionType
-from .audit_log import AuditLog as AuditLog
\ No newline at end of file
+from .audit_log import AuditLog as AuditLog, AuditLogArchive as AuditLogArchive
+from .analysis_job import AnalysisJob as AnalysisJob, AnalysisJobStatus as AnalysisJobStatus
+from .compliance_summary import (
+    TenantComplianceSummary as TenantComplianceSummary,
+    TenantActivityCounter as TenantActivityCounter,
+)
+from .assessment_schedule import (
+    AssessmentRecurrence as AssessmentRecurrence,
+    AssessmentSchedule as AssessmentSchedule,
+    ControlAssessment as ControlAssessment,
+)
+from .notification import NotificationOutbox as NotificationOutbox
@@ -0,0 +1,54 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, JSON, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from app.models.guid import GUID
+from datetime import datetime
+import uuid
+import enum
+
+from app.models.base import Base
+
+
+class AnalysisJobStatus(str, enum.Enum):
+    """Lifecycle of a single analysis attempt."""
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class AnalysisJob(Base):
+    """One attempt at analysing a document, with timing and resource usage."""
+    __tablename__ = "analysis_jobs"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    document_id = Column(GUID, ForeignKey("documents.id"), nullable=False, index=True)
+    tenant_id = Column(GUID, nullable=True)
+    status = Column(SQLEnum(AnalysisJobStatus), default=AnalysisJobStatus.running, nullable=False)
+    attempt = Column(Integer, default=1, nullable=False)
+    celery_task_id = Column(String, nullable=True)
+    worker_id = Column(String, nullable=True)
+    current_stage = Column(String, nullable=True)
+
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    stage_durations = Column(JSON, nullable=True)  # {"downloading": 120, "extracting": 950, ...}
+
+    file_bytes = Column(Integer, nullable=True)
+    page_count = Column(Integer, nullable=True)
+    text_chars = Column(Integer, nullable=True)
+    suggestions_count = Column(Integer, nullable=True)
+
+    llm_model = Column(String, nullable=True)
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    total_tokens = Column(Integer, nullable=True)
+
+    error_class = Column(String, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    document = relationship("Document")
+
+    __table_args__ = (
+        Index("ix_analysis_jobs_tenant_started", "tenant_id", "started_at"),
+        Index("ix_analysis_jobs_status", "status"),
+    )
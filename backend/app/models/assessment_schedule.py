@@ -0,0 +1,78 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint, Enum as SQLEnum, text
+from sqlalchemy.orm import relationship
+from app.models.guid import GUID
+from datetime import datetime
+import uuid
+import enum
+
+from app.models.base import Base
+
+
+class AssessmentRecurrence(str, enum.Enum):
+    monthly = "monthly"
+    quarterly = "quarterly"
+    semiannual = "semiannual"
+    annual = "annual"
+
+
+RECURRENCE_MONTHS = {
+    AssessmentRecurrence.monthly: 1,
+    AssessmentRecurrence.quarterly: 3,
+    AssessmentRecurrence.semiannual: 6,
+    AssessmentRecurrence.annual: 12,
+}
+
+
+class AssessmentSchedule(Base):
+    """Recurring assessment of a control; occurrences are materialised ahead of time."""
+    __tablename__ = "assessment_schedules"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(GUID, nullable=False)
+    control_id = Column(GUID, ForeignKey("controls.id", ondelete="CASCADE"), nullable=False, index=True)
+    owner_id = Column(GUID, ForeignKey("user.id"), nullable=False)
+    recurrence = Column(SQLEnum(AssessmentRecurrence), nullable=False)
+    # Occurrence n is due add_months(first_due_at, n * months), so month-end anchors
+    # do not drift to the shortest month's last day
+    first_due_at = Column(DateTime, nullable=False)
+    occurrences = Column(Integer, default=0, nullable=False)
+    # Due date of the next occurrence not yet materialised
+    next_due_at = Column(DateTime, nullable=False)
+    active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    control = relationship("Control")
+
+    __table_args__ = (
+        # Materialiser: active schedules whose next occurrence falls inside the horizon
+        Index("ix_assessment_schedules_active_next_due", "active", "next_due_at"),
+    )
+
+
+class ControlAssessment(Base):
+    """One due occurrence of a scheduled control assessment."""
+    __tablename__ = "control_assessments"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(GUID, nullable=False)
+    schedule_id = Column(GUID, ForeignKey("assessment_schedules.id", ondelete="CASCADE"), nullable=False)
+    control_id = Column(GUID, ForeignKey("controls.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(GUID, ForeignKey("user.id"), nullable=False)
+    due_at = Column(DateTime, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    completed_by = Column(GUID, ForeignKey("user.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    control = relationship("Control")
+
+    __table_args__ = (
+        # Overdue queue: open assessments for an owner, oldest due first (one range scan)
+        Index(
+            "ix_control_assessments_tenant_owner_due",
+            "tenant_id", "owner_id", "due_at",
+            postgresql_where=text("completed_at IS NULL"),
+            sqlite_where=text("completed_at IS NULL"),
+        ),
+        # One row per occurrence; materialising one twice fails with an IntegrityError
+        UniqueConstraint("schedule_id", "due_at", name="uq_control_assessments_schedule_due"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, String, ForeignKey, DateTime, Date, Index, Integer, JSON
 from app.models.guid import GUID
 from datetime import datetime
 import uuid
@@ -6,6 +6,12 @@ import uuid
 from app.models.base import Base
 
 class AuditLog(Base):
+    """Audit trail entry.
+
+    On Postgres the table is range-partitioned by month on created_at (one
+    audit_logs_yYYYYmMM partition per month, see AuditArchiveService); the
+    primary key there is (id, created_at).
+    """
     __tablename__ = "audit_logs"
 
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
@@ -14,4 +20,20 @@ class AuditLog(Base):
     entity_id = Column(GUID, nullable=False)
     actor_id = Column(GUID, ForeignKey("user.id"), nullable=False)
     changes = Column(JSON, nullable=True) # JSON diff for updates
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Newest-first listings and retention (month ranges)
+        Index("ix_audit_logs_created_at", "created_at"),
+    )
+
+
+class AuditLogArchive(Base):
+    """One month of audit_logs exported to object storage and removed from the database."""
+    __tablename__ = "audit_log_archives"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    month = Column(Date, nullable=False, unique=True)  # First day of the archived month
+    object_path = Column(String, nullable=False)  # gzip-compressed NDJSON, one entry per line
+    row_count = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index, Text
 from app.models.guid import GUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -28,6 +28,11 @@ class BusinessProcess(Base):
     risks = relationship("Risk", back_populates="process", cascade="all, delete-orphan")
     controls = relationship("Control", back_populates="process", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Overview keyset pagination: tenant_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_business_processes_tenant_created", "tenant_id", "created_at", "id"),
+    )
+
 
 class Risk(Base):
     __tablename__ = "risks"
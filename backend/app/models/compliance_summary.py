@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, Date, DateTime
+from app.models.guid import GUID
+from datetime import datetime
+
+from app.models.base import Base
+
+
+class TenantComplianceSummary(Base):
+    """Pre-aggregated compliance inputs and score for one tenant (one row per tenant).
+
+    Maintained by ComplianceSummaryService with per-write deltas on mapping, requirement,
+    risk and suggestion writes (and recomputed hourly), so the executive dashboard reads
+    a single row.
+    """
+    __tablename__ = "tenant_compliance_summary"
+
+    tenant_id = Column(GUID, primary_key=True)
+
+    # Mapping coverage across all frameworks
+    requirements_total = Column(Integer, default=0, nullable=False)
+    requirements_mapped = Column(Integer, default=0, nullable=False)
+
+    # Residual risk: risks by residual-risk category (Risk.category low/medium/high)
+    risks_total = Column(Integer, default=0, nullable=False)
+    risks_high = Column(Integer, default=0, nullable=False)
+    risks_medium = Column(Integer, default=0, nullable=False)
+    risks_low = Column(Integer, default=0, nullable=False)
+
+    # Suggestion backlog (pending + pending_review) and the part older than the SLA
+    suggestions_backlog = Column(Integer, default=0, nullable=False)
+    suggestions_stale = Column(Integer, default=0, nullable=False)
+
+    compliance_score = Column(Integer, nullable=True)  # 0-100; None until there is data to score
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class TenantActivityCounter(Base):
+    """Compliance activity events per tenant per day (suggestions, reviews, mappings, risks)."""
+    __tablename__ = "tenant_activity_counters"
+
+    tenant_id = Column(GUID, primary_key=True)
+    bucket_date = Column(Date, primary_key=True)
+    events = Column(Integer, default=0, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from app.models.guid import GUID
 from sqlalchemy.orm import relationship, Mapped
 from typing import Optional
@@ -26,10 +26,23 @@ class Document(Base):
     status = Column(SQLEnum(DocumentStatus), default=DocumentStatus.pending, nullable=False)
     # Using GUID for uploaded_by for better type safety and consistency
     uploaded_by = Column(GUID, ForeignKey("user.id"), nullable=False)
+    # Denormalised from the uploader so tenant checks are part of the WHERE clause
+    tenant_id = Column(GUID, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     archived_at = Column(DateTime, nullable=True)
 
+    # Processing lease: the analysis attempt that owns the document while it is
+    # `processing`, renewed by worker heartbeats and reclaimed by the reaper on expiry
+    lease_owner = Column(GUID, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    next_attempt_at = Column(DateTime, nullable=True)
+
     # Relationships
     user = relationship("User", back_populates="documents")
     regulatory_framework: Mapped[Optional["RegulatoryFramework"]] = relationship(back_populates="document")
-    regulatory_requirement: Mapped[Optional["RegulatoryRequirement"]] = relationship(back_populates="document")
\ No newline at end of file
+    regulatory_requirement: Mapped[Optional["RegulatoryRequirement"]] = relationship(back_populates="document")
+
+    __table_args__ = (
+        Index("ix_documents_status_lease", "status", "lease_expires_at"),
+        Index("ix_documents_tenant_archived_created", "tenant_id", "archived_at", "created_at"),
+    )
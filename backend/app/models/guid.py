@@ -1,22 +1,69 @@
 from typing import Any
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy.types import TypeDecorator, BINARY, BLOB, CHAR
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
+_UUID = uuid.UUID
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+
+
+def _uuid_to_bytes(value: Any):
+    if value is None or type(value) is bytes:
+        return value
+    if type(value) is not _UUID:
+        value = _UUID(str(value))
+    return value.bytes
+
+
+def _uuid_from_bytes(value: Any):
+    if type(value) is bytes:
+        # uuid.UUID(bytes=...) re-validates its arguments; build the (immutable) instance directly
+        result = _new_object(_UUID)
+        _set_attribute(result, "int", int.from_bytes(value, "big"))
+        _set_attribute(result, "is_safe", _SAFE_UNKNOWN)
+        return result
+    if value is None or type(value) is _UUID:
+        return value
+    # Legacy CHAR(32) hex rows
+    return _UUID(value)
+
+
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
 
-    Uses PostgreSQL's UUID type for PostgreSQL, otherwise uses
-    CHAR(32), storing as stringified hex values.
+    Uses PostgreSQL's UUID type for PostgreSQL, otherwise stores the 16 raw
+    bytes (BLOB on SQLite, BINARY(16) elsewhere). Values that are already
+    ``uuid.UUID`` instances are converted without re-parsing.
+
+    Databases created with the former CHAR(32) hex storage are converted by
+    migration f7b9d1e3a568; hex strings are still read correctly until then.
     """
+    # The storage type comes from load_dialect_impl. CHAR keeps the type affinity of
+    # fastapi-users' GUID (user.id), so many-to-one loads of User still resolve from
+    # the identity map instead of emitting a lazy SELECT
     impl = CHAR
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == "postgresql":
             return dialect.type_descriptor(UUID())
+        elif dialect.name == "sqlite":
+            return dialect.type_descriptor(BLOB())
         else:
-            return dialect.type_descriptor(CHAR(32))
+            return dialect.type_descriptor(BINARY(16))
+
+    def bind_processor(self, dialect):
+        if dialect.name == "postgresql":
+            return super().bind_processor(dialect)
+        # Called once per value: skip the TypeDecorator wrapper around process_bind_param
+        return _uuid_to_bytes
+
+    def result_processor(self, dialect, coltype):
+        if dialect.name == "postgresql":
+            return super().result_processor(dialect, coltype)
+        return _uuid_from_bytes
 
     def process_bind_param(self, value, dialect):
         if value is None:
@@ -24,16 +71,12 @@ class GUID(TypeDecorator):
         elif dialect.name == "postgresql":
             return str(value)
         else:
-            if not isinstance(value, uuid.UUID):
-                return "%.32x" % uuid.UUID(value).int
-            else:
-                # hexstring
-                return "%.32x" % value.int
+            return _uuid_to_bytes(value)
 
     def process_result_value(self, value, dialect):
-        if value is None:
+        if value is None or isinstance(value, uuid.UUID):
             return value
+        elif dialect.name == "postgresql":
+            return uuid.UUID(value)
         else:
-            if not isinstance(value, uuid.UUID):
-                value = uuid.UUID(value)
-            return value
+            return _uuid_from_bytes(value)
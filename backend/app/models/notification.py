@@ -0,0 +1,35 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, text
+from app.models.guid import GUID
+from datetime import datetime
+import uuid
+
+from app.models.base import Base
+
+
+class NotificationOutbox(Base):
+    """Notification waiting for delivery.
+
+    Written in the same transaction as the change it announces and delivered later
+    by the ``deliver_notifications`` task, which coalesces rows per recipient.
+    """
+    __tablename__ = "notification_outbox"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(GUID, nullable=False)
+    recipient_id = Column(GUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(50), nullable=False)  # e.g. bpo_assignment
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # Drain scan: undelivered rows, oldest first
+        Index(
+            "ix_notification_outbox_pending",
+            "created_at",
+            postgresql_where=text("sent_at IS NULL"),
+            sqlite_where=text("sent_at IS NULL"),
+        ),
+    )
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, ForeignKey, Enum as SQLAlchemyEnum, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index, Enum as SQLAlchemyEnum, Text
 from sqlalchemy.orm import relationship
 from app.models.guid import GUID
 from sqlalchemy.types import JSON
+from datetime import datetime
 import uuid
 import enum
 
@@ -31,13 +32,15 @@ class AISuggestion(Base):
     source_reference = Column(Text, nullable=False)
     status = Column(SQLAlchemyEnum(SuggestionStatus), default=SuggestionStatus.pending, nullable=False)
     assigned_bpo_id = Column(GUID, ForeignKey("user.id"), nullable=True)  # BPO assigned to review
-    
-    # Timestamps are handled by Base model if configured, but Base usually only has id/uuid.
-    # Adding created_at manually if Base doesn't provide it or if it is not a TimestampMixin
-    # Checking Base definition first would be ideal, but standard practice:
-    # Assuming Base is declarative_base() and doesn't imply fields.
-    # Adding created_at if not present in Base (safest to check first, but will add for now)
-    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
     # Relationships
     document = relationship("Document", backref="suggestions")
-    assigned_bpo = relationship("User", foreign_keys=[assigned_bpo_id])
\ No newline at end of file
+    assigned_bpo = relationship("User", foreign_keys=[assigned_bpo_id])
+
+    __table_args__ = (
+        # Tenant listings filtered by status, newest first
+        Index("ix_ai_suggestions_tenant_status_created", "tenant_id", "status", "created_at"),
+        # BPO review queue
+        Index("ix_ai_suggestions_tenant_bpo_status", "tenant_id", "assigned_bpo_id", "status"),
+    )
\ No newline at end of file
@@ -1,11 +1,30 @@
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import String, Column
+from typing import Iterable
+from sqlalchemy import Index, Integer, String, Column
 from app.models.guid import GUID
 from app.models.arrays import StringList
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from .base import Base
 import uuid
 
+# One bit per known role for User.role_mask. Append new roles; never renumber.
+ROLE_BITS = {
+    "admin": 1 << 0,
+    "bpo": 1 << 1,
+    "executive": 1 << 2,
+    "general_user": 1 << 3,
+    "compliance_officer": 1 << 4,
+    "auditor": 1 << 5,
+}
+
+
+def role_mask(roles: Iterable[str]) -> int:
+    """Bitmask of ``roles``; unknown role names contribute nothing."""
+    mask = 0
+    for role in roles or ():
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
 
 class User(SQLAlchemyBaseUserTableUUID, Base):
     items = relationship("Item", back_populates="user", cascade="all, delete-orphan")
@@ -14,6 +33,9 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     # New fields for Story 2.5 (Multi-Role)
     # role is deprecated, replaced by roles
     roles = Column(StringList, default=["general_user"], nullable=False)
+    # Derived from roles (see set_roles); on Postgres a trigger also keeps it in sync for
+    # rows written outside the ORM, e.g. the Supabase handle_new_user trigger
+    role_mask = Column(Integer, default=ROLE_BITS["general_user"], nullable=False)
     
     full_name = Column(String(100), nullable=True)
     # tenant_id is required, but we might need to generate one or assign one.
@@ -21,3 +43,18 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     # We will default to a random UUID for now if not provided, or leave nullable=True temporarily
     # until tenant creation logic is solid.
     tenant_id = Column(GUID, default=uuid.uuid4, nullable=False)
+
+    __table_args__ = (
+        # Role filters within a tenant (list_users) read the mask from the index
+        Index("ix_user_tenant_role_mask", "tenant_id", "role_mask"),
+        # roles @> ARRAY[...] lookups on Postgres
+        Index("ix_user_roles_gin", "roles", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    @validates("roles")
+    def set_roles(self, key, roles):
+        self.role_mask = role_mask(roles)
+        return roles
+
+    def has_any_role(self, mask: int) -> bool:
+        return bool(self.role_mask & mask)
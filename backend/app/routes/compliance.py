@@ -1,11 +1,10 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import apaginate
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from app.database import User, get_async_session
 from app.models.compliance import Control, Risk, BusinessProcess, RegulatoryFramework, RegulatoryRequirement
@@ -27,7 +26,10 @@ from app.schemas import (
     RegulatoryRequirementRead,
 )
 from app.schemas.compliance import RegulatoryFrameworkTreeItem
+from app.core.cache import etag_matches
 from app.core.deps import get_current_active_user as current_active_user
+from app.services.compliance_summary_service import ComplianceSummaryService
+from app.services.framework_tree_service import FrameworkTreeService
 
 router = APIRouter()
 
@@ -46,6 +48,7 @@ async def create_control(
 
     db_control = Control(**control.model_dump(), tenant_id=tenant_id, owner_id=user.id)
     db.add(db_control)
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
     await db.refresh(db_control)
     return db_control
@@ -102,6 +105,7 @@ async def update_control(
     for key, value in control_update.model_dump(exclude_unset=True).items():
         setattr(control, key, value)
 
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
     await db.refresh(control)
     return control
@@ -123,7 +127,14 @@ async def delete_control(
             status_code=404, detail="Control not found or access denied"
         )
 
+    # The control's mappings go with it; recount the requirements they covered
+    covered = RegulatoryRequirement.id.in_(
+        await ComplianceSummaryService.requirements_mapped_by_controls(db, tenant_id, [control.id])
+    )
+    before = await ComplianceSummaryService.count(db, tenant_id, requirements=covered)
     await db.delete(control)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=covered)
     await db.commit()
     return
 
@@ -140,6 +151,8 @@ async def create_risk(
     tenant_id = user.tenant_id
     db_risk = Risk(**risk.model_dump(), tenant_id=tenant_id, owner_id=user.id)
     db.add(db_risk)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, risks=Risk.id == db_risk.id)
     await db.commit()
     await db.refresh(db_risk)
     return db_risk
@@ -189,9 +202,12 @@ async def update_risk(
     if not risk:
         raise HTTPException(status_code=404, detail="Risk not found or access denied")
 
+    before = await ComplianceSummaryService.count(db, tenant_id, risks=Risk.id == risk.id)
     for key, value in risk_update.model_dump(exclude_unset=True).items():
         setattr(risk, key, value)
 
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, risks=Risk.id == risk.id)
     await db.commit()
     await db.refresh(risk)
     return risk
@@ -211,7 +227,10 @@ async def delete_risk(
     if not risk:
         raise HTTPException(status_code=404, detail="Risk not found or access denied")
 
+    before = await ComplianceSummaryService.count(db, tenant_id, risks=Risk.id == risk.id)
     await db.delete(risk)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, risks=Risk.id == risk.id)
     await db.commit()
     return
 
@@ -235,6 +254,7 @@ async def create_business_process(
         **process.model_dump(), tenant_id=tenant_id, owner_id=user.id
     )
     db.add(db_process)
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
     await db.refresh(db_process)
     return db_process
@@ -307,6 +327,7 @@ async def update_business_process(
     for key, value in process_update.model_dump(exclude_unset=True).items():
         setattr(process, key, value)
 
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
     await db.refresh(process)
     return process
@@ -332,7 +353,17 @@ async def delete_business_process(
             status_code=404, detail="Business Process not found or access denied"
         )
 
+    # Risks and controls (with their mappings) are deleted along with the process
+    risks = Risk.process_id == process.id
+    covered = RegulatoryRequirement.id.in_(
+        await ComplianceSummaryService.requirements_mapped_by_controls(
+            db, tenant_id, select(Control.id).where(Control.process_id == process.id)
+        )
+    )
+    before = await ComplianceSummaryService.count(db, tenant_id, requirements=covered, risks=risks)
     await db.delete(process)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=covered, risks=risks)
     await db.commit()
     return
 
@@ -354,7 +385,9 @@ async def create_regulatory_framework(
     tenant_id = user.tenant_id
     db_framework = RegulatoryFramework(**framework.model_dump(), tenant_id=tenant_id)
     db.add(db_framework)
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     await db.refresh(db_framework)
     return db_framework
 
@@ -386,19 +419,19 @@ async def read_regulatory_frameworks(
 async def get_regulatory_frameworks_tree(
     db: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
+    if_none_match: str | None = Header(None),
 ):
     """
     Get all regulatory frameworks with their requirements in a hierarchical tree structure.
+
+    Served from a per-tenant cache invalidated by framework and requirement writes;
+    supports ``If-None-Match`` revalidation against the returned ``ETag``.
     """
-    stmt = (
-        select(RegulatoryFramework)
-        .filter(RegulatoryFramework.tenant_id == user.tenant_id)
-        .options(selectinload(RegulatoryFramework.requirements))
-        .order_by(RegulatoryFramework.name)
-    )
-    result = await db.execute(stmt)
-    frameworks = result.scalars().all()
-    return frameworks
+    tree = await FrameworkTreeService.get_tree(db, user.tenant_id)
+    headers = {"ETag": tree.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, tree.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=tree.body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -453,7 +486,9 @@ async def update_regulatory_framework(
     for key, value in framework_update.model_dump(exclude_unset=True).items():
         setattr(framework, key, value)
 
+    await ComplianceSummaryService.record_activity(db, tenant_id)
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     await db.refresh(framework)
     return framework
 
@@ -481,8 +516,14 @@ async def delete_regulatory_framework(
             status_code=404, detail="Regulatory Framework not found or access denied"
         )
 
+    # Its requirements are deleted with it
+    requirements = RegulatoryRequirement.framework_id == framework.id
+    before = await ComplianceSummaryService.count(db, tenant_id, requirements=requirements)
     await db.delete(framework)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=requirements)
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     return
 
 
@@ -515,7 +556,12 @@ async def create_regulatory_requirement(
 
     db_requirement = RegulatoryRequirement(**requirement.model_dump(), tenant_id=tenant_id)
     db.add(db_requirement)
+    await db.flush()
+    await ComplianceSummaryService.record_change(
+        db, tenant_id, requirements=RegulatoryRequirement.id == db_requirement.id
+    )
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     await db.refresh(db_requirement)
     return db_requirement
 
@@ -604,10 +650,16 @@ async def update_regulatory_requirement(
                 status_code=404, detail="Regulatory Framework not found or access denied"
             )
 
+    # Moving to another framework can change whether a framework-level mapping covers it
+    scope = RegulatoryRequirement.id == requirement.id
+    before = await ComplianceSummaryService.count(db, tenant_id, requirements=scope)
     for key, value in requirement_update.model_dump(exclude_unset=True).items():
         setattr(requirement, key, value)
 
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=scope)
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     await db.refresh(requirement)
     return requirement
 
@@ -635,6 +687,11 @@ async def delete_regulatory_requirement(
             status_code=404, detail="Regulatory Requirement not found or access denied"
         )
 
+    scope = RegulatoryRequirement.id == requirement.id
+    before = await ComplianceSummaryService.count(db, tenant_id, requirements=scope)
     await db.delete(requirement)
+    await db.flush()
+    await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=scope)
     await db.commit()
+    await FrameworkTreeService.invalidate(tenant_id)
     return
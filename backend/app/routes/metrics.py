@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.core.metrics import CONTENT_TYPE_LATEST, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus text exposition of this process's metrics.
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    # Collectors may do blocking I/O (broker queue depth), keep it off the event loop
+    body = await run_in_threadpool(REGISTRY.render)
+    return Response(content=body, media_type=CONTENT_TYPE_LATEST)
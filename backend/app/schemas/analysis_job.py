@@ -0,0 +1,62 @@
+"""Schemas for analysis job history and capacity-planning statistics."""
+
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.analysis_job import AnalysisJobStatus
+
+
+class AnalysisJobRead(BaseModel):
+    id: UUID
+    document_id: UUID
+    tenant_id: Optional[UUID] = None
+    status: AnalysisJobStatus
+    attempt: int
+    celery_task_id: Optional[str] = None
+    worker_id: Optional[str] = None
+    current_stage: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+    stage_durations: Optional[Dict[str, int]] = None
+    file_bytes: Optional[int] = None
+    page_count: Optional[int] = None
+    text_chars: Optional[int] = None
+    suggestions_count: Optional[int] = None
+    llm_model: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    error_class: Optional[str] = None
+    error_message: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class DurationStats(BaseModel):
+    """Percentiles over a set of durations, in milliseconds."""
+    count: int = 0
+    p50_ms: Optional[float] = None
+    p90_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    max_ms: Optional[int] = None
+
+
+class TokenTotals(BaseModel):
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+class AnalysisJobStats(BaseModel):
+    """Aggregated view over finished analysis jobs in a time window."""
+    since: datetime = Field(..., description="Start of the aggregation window (UTC)")
+    jobs: int = Field(..., description="Number of jobs started in the window")
+    by_status: Dict[str, int] = Field(default_factory=dict)
+    error_classes: Dict[str, int] = Field(default_factory=dict)
+    duration: DurationStats = Field(default_factory=DurationStats, description="End-to-end duration of succeeded jobs")
+    stages: Dict[str, DurationStats] = Field(default_factory=dict, description="Per-stage durations of succeeded jobs")
+    tokens: TokenTotals = Field(default_factory=TokenTotals)
@@ -1,7 +1,7 @@
 """Assessment schemas for BPO review and approval of AI suggestions."""
 
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -43,6 +43,18 @@ class AssessmentRequest(BaseModel):
         description="Edited business process name (overrides AI suggestion if provided)"
     )
 
+    def edits(self) -> Optional[Dict[str, Optional[str]]]:
+        """Edited field values keyed as AssessmentService expects, or None if nothing was edited."""
+        if not (self.edited_risk_description or
+                self.edited_control_description or
+                self.edited_business_process):
+            return None
+        return {
+            "edited_risk_description": self.edited_risk_description,
+            "edited_control_description": self.edited_control_description,
+            "edited_business_process": self.edited_business_process
+        }
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -170,3 +182,38 @@ class PendingReviewsResponse(BaseModel):
                 "size": 20
             }
         }
+
+
+class BulkAssessmentItem(AssessmentRequest):
+    """One assessment action within a bulk request."""
+    suggestion_id: UUID = Field(..., description="ID of the suggestion to assess")
+
+
+class BulkAssessmentRequest(BaseModel):
+    """Request payload for assessing many suggestions in one transaction."""
+    items: List[BulkAssessmentItem] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Assessment actions, at most one per suggestion"
+    )
+
+
+class BulkAssessmentItemResult(BaseModel):
+    """Outcome of one item of a bulk assessment."""
+    suggestion_id: UUID = Field(..., description="ID of the assessed suggestion")
+    success: bool = Field(..., description="Whether the action was applied")
+    message: str = Field(..., description="Success message or the reason the item was skipped")
+    updated_status: Optional[str] = Field(None, description="'active' or 'archived' when applied")
+    audit_log_id: Optional[UUID] = Field(None, description="Audit log entry for this item when applied")
+    active_record_ids: Optional[Dict[str, UUID]] = Field(
+        None,
+        description="IDs of created active records (business_process_id, risk_id, control_id) if approved"
+    )
+
+
+class BulkAssessmentResponse(BaseModel):
+    """Per-item outcomes of a bulk assessment, in request order."""
+    results: List[BulkAssessmentItemResult] = Field(..., description="One outcome per requested item")
+    succeeded: int = Field(..., description="Number of items applied")
+    failed: int = Field(..., description="Number of items skipped")
@@ -0,0 +1,42 @@
+"""Schemas for recurring control assessments and the overdue queue."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.assessment_schedule import AssessmentRecurrence
+
+
+class AssessmentScheduleCreate(BaseModel):
+    control_id: UUID
+    recurrence: AssessmentRecurrence
+    first_due_at: datetime = Field(..., description="Due date of the first assessment")
+    owner_id: Optional[UUID] = Field(None, description="Defaults to the control owner")
+
+
+class AssessmentScheduleRead(BaseModel):
+    id: UUID
+    tenant_id: UUID
+    control_id: UUID
+    owner_id: UUID
+    recurrence: AssessmentRecurrence
+    first_due_at: datetime
+    next_due_at: datetime
+    active: bool
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ControlAssessmentRead(BaseModel):
+    id: UUID
+    schedule_id: UUID
+    control_id: UUID
+    owner_id: UUID
+    due_at: datetime
+    completed_at: Optional[datetime] = None
+    completed_by: Optional[UUID] = None
+
+    model_config = {"from_attributes": True}
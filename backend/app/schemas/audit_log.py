@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -7,7 +7,8 @@ class AuditLogBase(BaseModel):
     action: str
     entity_type: str
     entity_id: UUID
-    changes: Optional[Dict[str, Any]] = None
+    # Field diff dict, or a list of JSON Patch operations (AuditService.json_patch)
+    changes: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None
 
 class AuditLogRead(AuditLogBase):
     id: UUID
@@ -0,0 +1,29 @@
+"""Schemas for document analysis progress events (streamed over SSE)."""
+
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.document import DocumentStatus
+
+
+class DocumentProgressEvent(BaseModel):
+    """Structured progress update published by the analysis pipeline."""
+    document_id: UUID
+    tenant_id: Optional[UUID] = None
+    status: DocumentStatus = Field(..., description="Document status at the time of the event")
+    stage: str = Field(..., description="Pipeline stage, e.g. 'downloading', 'extracting', 'analysing'")
+    pages_extracted: int = 0
+    chunks_analysed: int = 0
+    suggestions_saved: int = 0
+    # From the classification pass, available before extraction finishes
+    document_type: Optional[str] = Field(None, description="'Law' or 'Regulation'")
+    framework_name: Optional[str] = None
+    message: Optional[str] = None
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in (DocumentStatus.completed, DocumentStatus.failed)
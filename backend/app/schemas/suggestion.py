@@ -1,6 +1,6 @@
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict
-from typing import TYPE_CHECKING, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import TYPE_CHECKING, Optional, Any, List
 from app.models.suggestion import SuggestionStatus, SuggestionType
 
 # Use TYPE_CHECKING to avoid circular import with schemas.__init__
@@ -34,3 +34,37 @@ class AISuggestionRead(AISuggestionBase):
     assigned_bpo: Optional["UserRead"] = None  # String annotation for TYPE_CHECKING
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Statuses a compliance officer can move a pending suggestion to
+TRIAGE_STATUSES = (SuggestionStatus.pending_review, SuggestionStatus.rejected)
+
+
+class SuggestionTriageItem(BaseModel):
+    suggestion_id: UUID
+    status: SuggestionStatus
+    bpo_id: Optional[UUID] = None
+
+    @field_validator("status")
+    @classmethod
+    def check_triage_status(cls, value: SuggestionStatus) -> SuggestionStatus:
+        if value not in TRIAGE_STATUSES:
+            raise ValueError("Triage can only move suggestions to pending_review or rejected")
+        return value
+
+
+class SuggestionTriageRequest(BaseModel):
+    items: List[SuggestionTriageItem] = Field(..., min_length=1, max_length=500)
+
+
+class SuggestionTriageItemResult(BaseModel):
+    suggestion_id: UUID
+    success: bool
+    status: Optional[SuggestionStatus] = None
+    message: str
+
+
+class SuggestionTriageResponse(BaseModel):
+    results: List[SuggestionTriageItemResult]
+    updated: int
+    skipped: int
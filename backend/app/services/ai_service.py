@@ -1,12 +1,20 @@
+import asyncio
+import logging
 import os
+import re
+import time
 import uuid
-from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Literal, Sequence, Tuple
+from pydantic import BaseModel, Field, ValidationError
 import openai
 from app.config import settings
+from app.core.json_stream import JSONItemStream
+from app.core.metrics import LLM_REQUEST_DURATION, LLM_TIME_TO_FIRST_ITEM, LLM_TOKENS
 from app.models.suggestion import SuggestionType, SuggestionStatus
 from app.schemas.suggestion import AISuggestionCreate
 
+logger = logging.getLogger(__name__)
+
 # --- Schema Definitions ---
 # Define Pydantic models that structure the expected LLM output.
 # This will be used for JSON mode or Function Calling validation.
@@ -24,9 +32,144 @@ class Suggestion(BaseModel):
     rationale: str = Field(..., description="Reasoning for why this is a risk or control.")
     source_reference: str = Field(..., description="Verbatim reference or clear pointer to the source text (e.g., 'Section 4.2').")
 
+class TokenUsage(BaseModel):
+    model: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+    @classmethod
+    def combine(cls, usages: Sequence[Optional["TokenUsage"]]) -> Optional["TokenUsage"]:
+        """Totals of several calls; ``model`` lists the distinct models used."""
+        usages = [usage for usage in usages if usage is not None]
+        if not usages:
+            return None
+        models = list(dict.fromkeys(usage.model for usage in usages if usage.model))
+        return cls(
+            model=",".join(models) or None,
+            prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+            completion_tokens=sum(usage.completion_tokens for usage in usages),
+            total_tokens=sum(usage.total_tokens for usage in usages),
+        )
+
 class AnalysisResult(BaseModel):
     classification: Optional[DocumentClassification] = Field(None, description="Document classification details.")
     suggestions: List[Suggestion] = Field(..., description="List of identified risks and controls.")
+    # Filled in by AIService from the API response, never by the LLM itself
+    usage: Optional[TokenUsage] = Field(None, exclude=True)
+
+class ClassificationResult(BaseModel):
+    classification: Optional[DocumentClassification] = Field(None, description="Document classification details.")
+    usage: Optional[TokenUsage] = Field(None, exclude=True)
+
+
+SuggestionCallback = Callable[[Suggestion], Awaitable[None]]
+
+
+class _AnalysisParser:
+    """
+    Validates an analysis response piece by piece: every suggestion as soon as its
+    object closes, so a malformed element (or a truncated tail) only loses itself.
+    """
+
+    def __init__(self, model: str, on_suggestion: Optional[SuggestionCallback] = None):
+        self.model = model
+        self.on_suggestion = on_suggestion
+        self.classification: Optional[DocumentClassification] = None
+        self.suggestions: List[Suggestion] = []
+        self.rejected = 0
+        self._received = False
+        self._items = JSONItemStream(array_keys=("suggestions",), value_keys=("classification",))
+        self._started = time.perf_counter()
+
+    async def feed(self, chunk: str) -> None:
+        self._received = True
+        for key, raw in self._items.feed(chunk):
+            if key == "classification":
+                try:
+                    self.classification = DocumentClassification.model_validate_json(raw)
+                except ValidationError as e:
+                    logger.warning(f"Discarding invalid classification: {e}")
+                continue
+            try:
+                suggestion = Suggestion.model_validate_json(raw)
+            except ValidationError as e:
+                self.rejected += 1
+                logger.warning(f"Skipping invalid suggestion: {e}")
+                continue
+            if not self.suggestions:
+                LLM_TIME_TO_FIRST_ITEM.observe(time.perf_counter() - self._started, model=self.model)
+            self.suggestions.append(suggestion)
+            if self.on_suggestion is not None:
+                await self.on_suggestion(suggestion)
+
+    def close(self) -> None:
+        if self._received and not self._items.complete:
+            logger.warning(
+                f"LLM output ended before the JSON object closed; kept {len(self.suggestions)} suggestions"
+            )
+        if self.rejected:
+            logger.warning(f"Skipped {self.rejected} invalid suggestions, kept {len(self.suggestions)}")
+
+
+# --- Document slicing for the two-stage pipeline ---
+
+# Lines that open a new part of a legal text: "Article 5", "Section 4.2", "CHAPTER III", "Part 2", ...
+_HEADING_RE = re.compile(
+    r"^\s*(?:(?:article|art\.|section|chapter|part|title|schedule|annex|appendix)\s+[\w.\-]+|§\s*\d+)",
+    re.IGNORECASE,
+)
+_MAX_HEADINGS = 200
+
+
+def _is_heading(line: str) -> bool:
+    line = line.strip()
+    if not line or len(line) > 120:
+        return False
+    return bool(_HEADING_RE.match(line)) or (line.isupper() and len(line.split()) <= 12)
+
+
+def classification_excerpt(
+    pages: Sequence[str], max_pages: Optional[int] = None, max_chars: Optional[int] = None
+) -> str:
+    """The opening pages (capped at ``max_chars``) followed by the headings of the remaining pages."""
+    max_pages = settings.AI_CLASSIFY_MAX_PAGES if max_pages is None else max_pages
+    max_chars = settings.AI_CLASSIFY_MAX_CHARS if max_chars is None else max_chars
+    excerpt = "\n".join(pages[:max_pages])[:max_chars]
+    headings = [
+        line.strip() for page in pages[max_pages:] for line in page.splitlines() if _is_heading(line)
+    ][:_MAX_HEADINGS]
+    if headings:
+        excerpt += "\n\nHEADINGS FROM THE REST OF THE DOCUMENT:\n" + "\n".join(headings)
+    return excerpt
+
+
+def split_sections(pages: Sequence[str], max_chars: Optional[int] = None) -> List[str]:
+    """
+    Cut the document into sections of at most ``max_chars`` for the extraction passes.
+
+    Sections end at a heading once they are at least half full, so an article is
+    rarely split across two calls; anything longer than ``max_chars`` is cut hard.
+    """
+    max_chars = settings.AI_SECTION_MAX_CHARS if max_chars is None else max_chars
+    sections, current, size = [], [], 0
+    for line in "\n".join(pages).splitlines(keepends=True):
+        if current and (
+            (size + len(line) > max_chars and len(line) <= max_chars)
+            or (size >= max_chars // 2 and _is_heading(line))
+        ):
+            sections.append("".join(current))
+            current, size = [], 0
+        while size + len(line) > max_chars:
+            # A line longer than a whole section: fill this one and carry on in the next
+            room = max_chars - size
+            sections.append("".join(current) + line[:room])
+            current, size, line = [], 0, line[room:]
+        current.append(line)
+        size += len(line)
+    if "".join(current).strip():
+        sections.append("".join(current))
+    return [section for section in sections if section.strip()]
 
 class AIService:
     """Service for analyzing documents using OpenAI LLM."""
@@ -75,6 +218,54 @@ IMPORTANT:
 - If "document_type" is "Regulation", "parent_law_name" is REQUIRED (e.g., if analyzing "GDPR Article 32", parent is "GDPR").
 - "suggestions" list must contain "type", "content", "rationale", and "source_reference" exactly as specified.
 
+Output MUST be valid JSON matching this exact structure.
+    """
+
+    CLASSIFY_PROMPT = """
+You are an expert AI Legal Specialist in Risk and Compliance.
+You receive the opening pages of a regulatory document and the headings of the rest.
+CLASSIFY the document as a "Law" (a main law) or a "Regulation" (made under a law).
+
+Return a JSON object with exactly this structure:
+{
+  "classification": {
+    "document_type": "Law" | "Regulation",
+    "framework_name": "Name of the law or regulation",
+    "framework_description": "Brief description",
+    "parent_law_name": "Name of parent Law (if Regulation, else null)",
+    "version": "Version/Year string"
+  }
+}
+
+If "document_type" is "Regulation", "parent_law_name" is REQUIRED.
+Output MUST be valid JSON matching this exact structure.
+    """
+
+    EXTRACT_PROMPT = """
+You are an expert AI Legal Specialist in Risk and Compliance.
+You receive ONE SECTION of a regulatory document. IDENTIFY the Business Processes,
+Risks, and Controls that this section mentions or implies: compliance, operational and
+legal risks, and the controls that address them. A typical section yields 2-6 items;
+return an empty list if the section has none (e.g. definitions or a table of contents).
+
+Return a JSON object with exactly this structure:
+{
+  "suggestions": [
+    {
+      "type": "risk" | "control" | "business_process",
+      "content": {
+        "name": "Short, clear title (5-10 words)",
+        "description": "Detailed description of the item",
+        "severity": "Low|Medium|High" (for risks only),
+        "impact": "Potential impact description" (for risks only),
+        "control_type": "Preventive|Detective|Corrective" (for controls only)
+      },
+      "rationale": "Clear explanation of why this is a risk, control, or process and its significance",
+      "source_reference": "Specific citation from the section (e.g., 'Section 4.2', 'Article 18(3)')"
+    }
+  ]
+}
+
 Output MUST be valid JSON matching this exact structure.
     """
 
@@ -88,56 +279,224 @@ Output MUST be valid JSON matching this exact structure.
         else:
             self.client = None
 
-    async def analyze_document(self, text: str) -> AnalysisResult:
-        """
-        Analyzes the provided text using GPT-4 to identify risks and controls.
-        
-        Args:
-            text: The extracted text from the document.
-            
-        Returns:
-            AnalysisResult: Structured list of suggestions.
-        """
+    def _ensure_client(self) -> None:
         if not self.client and not settings.OPENAI_API_KEY:
              # For development/testing without a key, we might want to return a dummy response
              # or raise an error. Raising error is safer for production.
              raise ValueError("OPENAI_API_KEY is not set.")
-        
+
         if not self.client:
              self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-        # Chunking logic (simplified for MVP)
-        # A real implementation would need robust token counting and chunking.
-        # For now, we'll truncate if too long, but standard GPT-4o-mini has 128k context, 
-        # which covers most regulatory docs.
-        # Let's assume the text fits for MVP.
-        
+    async def _complete(
+        self, model: str, system_prompt: str, user_content: str
+    ) -> Tuple[Optional[str], Optional[TokenUsage]]:
+        """One JSON-mode chat completion; returns its content and token usage."""
+        started = time.perf_counter()
+        completion = None
         try:
             completion = await self.client.chat.completions.create(
-                model="gpt-4o-mini", # Use a cost-effective but capable model
+                model=model,
                 messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": f"Analyze the following text:\n\n{text}"}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
                 ],
                 response_format={"type": "json_object"}, # Force JSON output
                 temperature=0.0 # Deterministic output
             )
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, model=model, outcome="ok")
+        except Exception:
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, model=model, outcome="error")
+            raise
 
-            content = completion.choices[0].message.content
-            if not content:
-                return AnalysisResult(suggestions=[])
+        usage = self._record_usage(model, completion.model, completion.usage)
+        return completion.choices[0].message.content, usage
 
-            # Log raw AI response for debugging
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"[AI RESPONSE RAW] {content[:500]}...")
+    async def _complete_streamed(
+        self,
+        model: str,
+        system_prompt: str,
+        user_content: str,
+        on_content: Callable[[str], Awaitable[None]],
+    ) -> Optional[TokenUsage]:
+        """Streamed ``_complete``: ``on_content`` is awaited with each piece of content as it arrives."""
+        started = time.perf_counter()
+        response_model, raw_usage = None, None
+        try:
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.0,
+                stream=True,
+                stream_options={"include_usage": True},  # usage arrives in a final, choice-less chunk
+            )
+            async for chunk in stream:
+                response_model = chunk.model or response_model
+                if chunk.usage is not None:
+                    raw_usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    await on_content(chunk.choices[0].delta.content)
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, model=model, outcome="ok")
+        except Exception:
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, model=model, outcome="error")
+            raise
+        return self._record_usage(model, response_model, raw_usage)
+
+    @staticmethod
+    def _record_usage(model: str, response_model: Optional[str], raw_usage: Any) -> Optional[TokenUsage]:
+        if not isinstance(raw_usage, openai.types.CompletionUsage):
+            return None
+        usage = TokenUsage(
+            model=response_model,
+            prompt_tokens=raw_usage.prompt_tokens,
+            completion_tokens=raw_usage.completion_tokens,
+            total_tokens=raw_usage.total_tokens,
+        )
+        LLM_TOKENS.inc(usage.prompt_tokens, model=model, kind="prompt")
+        LLM_TOKENS.inc(usage.completion_tokens, model=model, kind="completion")
+        return usage
 
-            # Parse and validate with Pydantic
-            # Using model_validate_json is cleaner than json.loads
-            return AnalysisResult.model_validate_json(content)
+    async def _parse_analysis(
+        self,
+        model: str,
+        system_prompt: str,
+        user_content: str,
+        on_suggestion: Optional[SuggestionCallback] = None,
+        stream: bool = False,
+    ) -> Tuple[_AnalysisParser, Optional[TokenUsage]]:
+        """Run an analysis prompt, streamed or not, and parse the response incrementally."""
+        parser = _AnalysisParser(model, on_suggestion)
+        if stream:
+            usage = await self._complete_streamed(model, system_prompt, user_content, parser.feed)
+        else:
+            content, usage = await self._complete(model, system_prompt, user_content)
+            if content:
+                # Log raw AI response for debugging
+                logger.info(f"[AI RESPONSE RAW] {content[:500]}...")
+                await parser.feed(content)
+        parser.close()
+        return parser, usage
+
+    async def analyze_document(
+        self, text: str, on_suggestion: Optional[SuggestionCallback] = None
+    ) -> AnalysisResult:
+        """
+        Analyzes the provided text using GPT-4 to identify risks and controls.
+
+        Single call over the whole document; the analysis pipeline uses
+        ``classify_document`` and ``extract_suggestions`` unless
+        AI_TWO_STAGE_ANALYSIS is disabled.
+
+        Args:
+            text: The extracted text from the document.
+            on_suggestion: If given, the completion is streamed and this is awaited
+                with each suggestion as soon as it has been generated and validated.
+
+        Returns:
+            AnalysisResult: Structured list of suggestions. Invalid suggestions are
+            skipped; a truncated response keeps the ones completed before the cut.
+        """
+        self._ensure_client()
+
+        # standard GPT-4o-mini has 128k context, which covers most regulatory docs
+        try:
+            parsed, usage = await self._parse_analysis(
+                settings.AI_EXTRACT_MODEL,
+                self.SYSTEM_PROMPT,
+                f"Analyze the following text:\n\n{text}",
+                on_suggestion=on_suggestion,
+                stream=on_suggestion is not None,
+            )
+            return AnalysisResult(
+                classification=parsed.classification, suggestions=parsed.suggestions, usage=usage
+            )
 
         except Exception as e:
             # Log the error
             print(f"AI Analysis failed: {e}")
             # Re-raise or return empty depending on desired resilience
             raise e
+
+    async def classify_document(self, pages: Sequence[str]) -> ClassificationResult:
+        """
+        Fast first pass: classify the document from its opening pages and headings
+        only, so the framework can be recorded long before extraction finishes.
+        """
+        self._ensure_client()
+        content, usage = await self._complete(
+            settings.AI_CLASSIFY_MODEL,
+            self.CLASSIFY_PROMPT,
+            f"Classify the following document:\n\n{classification_excerpt(pages)}",
+        )
+        if not content:
+            return ClassificationResult(usage=usage)
+        result = ClassificationResult.model_validate_json(content)
+        result.usage = usage
+        return result
+
+    async def extract_suggestions(
+        self,
+        sections: Sequence[str],
+        classification: Optional[DocumentClassification] = None,
+        on_section_done: Optional[Callable[[int], Awaitable[None]]] = None,
+        on_suggestion: Optional[SuggestionCallback] = None,
+    ) -> AnalysisResult:
+        """
+        Second pass: one extraction call per section, at most AI_EXTRACTION_CONCURRENCY
+        at a time. Suggestions are grouped by section in document order; an item with
+        the same type and name as one already received from another section is dropped.
+
+        ``on_section_done`` is awaited with the number of sections finished so far.
+        With ``on_suggestion`` the calls are streamed and it is awaited with each
+        (deduplicated) suggestion as soon as it is complete.
+        """
+        self._ensure_client()
+        context = ""
+        if classification:
+            context = f"Document: {classification.framework_name} ({classification.document_type})\n"
+        semaphore = asyncio.Semaphore(max(1, settings.AI_EXTRACTION_CONCURRENCY))
+        done = 0
+        seen = set()
+
+        async def extract(index: int, section: str) -> Tuple[List[Suggestion], Optional[TokenUsage]]:
+            nonlocal done
+            accepted = []
+
+            async def accept(suggestion: Suggestion) -> None:
+                key = (suggestion.type, str(suggestion.content.get("name", "")).strip().lower())
+                if key[1] and key in seen:
+                    return
+                seen.add(key)
+                accepted.append(suggestion)
+                if on_suggestion is not None:
+                    await on_suggestion(suggestion)
+
+            async with semaphore:
+                _, usage = await self._parse_analysis(
+                    settings.AI_EXTRACT_MODEL,
+                    self.EXTRACT_PROMPT,
+                    f"{context}Section {index + 1} of {len(sections)}:\n\n{section}",
+                    on_suggestion=accept,
+                    stream=on_suggestion is not None,
+                )
+            done += 1
+            if on_section_done is not None:
+                await on_section_done(done)
+            return accepted, usage
+
+        # A failed section cancels the others; the job is retried as a whole
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(extract(index, section)) for index, section in enumerate(sections)]
+        except ExceptionGroup as errors:
+            # Re-raise the section's own error (e.g. an OpenAI error or LeaseLostError) for the caller
+            raise errors.exceptions[0]
+
+        return AnalysisResult(
+            suggestions=[suggestion for task in tasks for suggestion in task.result()[0]],
+            usage=TokenUsage.combine([task.result()[1] for task in tasks]),
+        )
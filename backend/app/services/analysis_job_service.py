@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analysis_job import AnalysisJob, AnalysisJobStatus
+from app.schemas.analysis_job import AnalysisJobStats, DurationStats, TokenTotals
+
+
+def _percentile(sorted_values: Sequence[int], q: float) -> Optional[float]:
+    """Linear-interpolated percentile (same definition as Postgres percentile_cont)."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction)
+
+
+def _duration_stats(values: List[int]) -> DurationStats:
+    values = sorted(values)
+    return DurationStats(
+        count=len(values),
+        p50_ms=_percentile(values, 0.50),
+        p90_ms=_percentile(values, 0.90),
+        p99_ms=_percentile(values, 0.99),
+        max_ms=values[-1] if values else None,
+    )
+
+
+class AnalysisJobService:
+    """Read side of the analysis job table: history listing and aggregated statistics."""
+
+    @staticmethod
+    async def list_jobs(
+        db: AsyncSession,
+        tenant_id: UUID,
+        status: Optional[AnalysisJobStatus] = None,
+        document_id: Optional[UUID] = None,
+        running_longer_than_minutes: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[AnalysisJob]:
+        """List jobs for a tenant, newest first.
+
+        ``running_longer_than_minutes`` narrows the list to jobs still marked running
+        that started before the cut-off, i.e. candidates for being stuck.
+        """
+        query = select(AnalysisJob).filter(AnalysisJob.tenant_id == tenant_id)
+        if status:
+            query = query.filter(AnalysisJob.status == status)
+        if document_id:
+            query = query.filter(AnalysisJob.document_id == document_id)
+        if running_longer_than_minutes is not None:
+            cutoff = datetime.utcnow() - timedelta(minutes=running_longer_than_minutes)
+            query = query.filter(
+                AnalysisJob.status == AnalysisJobStatus.running,
+                AnalysisJob.started_at < cutoff,
+            )
+        query = query.order_by(AnalysisJob.started_at.desc()).limit(limit)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_stats(
+        db: AsyncSession,
+        tenant_id: UUID,
+        since: datetime,
+        min_pages: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AnalysisJobStats:
+        """Aggregate jobs started since ``since``.
+
+        Percentiles are computed in Python over the projected columns so the same
+        code runs on Postgres and SQLite; a window holds at most a few thousand rows.
+        """
+        query = select(
+            AnalysisJob.status,
+            AnalysisJob.duration_ms,
+            AnalysisJob.stage_durations,
+            AnalysisJob.error_class,
+            AnalysisJob.prompt_tokens,
+            AnalysisJob.completion_tokens,
+            AnalysisJob.total_tokens,
+        ).filter(AnalysisJob.tenant_id == tenant_id, AnalysisJob.started_at >= since)
+        if min_pages is not None:
+            query = query.filter(AnalysisJob.page_count >= min_pages)
+        if max_pages is not None:
+            query = query.filter(AnalysisJob.page_count <= max_pages)
+
+        rows = (await db.execute(query)).all()
+
+        by_status: Dict[str, int] = {}
+        error_classes: Dict[str, int] = {}
+        durations: List[int] = []
+        stage_values: Dict[str, List[int]] = {}
+        tokens = TokenTotals()
+
+        for row in rows:
+            by_status[row.status.value] = by_status.get(row.status.value, 0) + 1
+            if row.error_class:
+                error_classes[row.error_class] = error_classes.get(row.error_class, 0) + 1
+            tokens.prompt_tokens += row.prompt_tokens or 0
+            tokens.completion_tokens += row.completion_tokens or 0
+            tokens.total_tokens += row.total_tokens or 0
+
+            if row.status != AnalysisJobStatus.succeeded:
+                continue
+            if row.duration_ms is not None:
+                durations.append(row.duration_ms)
+            for stage, elapsed_ms in (row.stage_durations or {}).items():
+                stage_values.setdefault(stage, []).append(elapsed_ms)
+
+        return AnalysisJobStats(
+            since=since,
+            jobs=len(rows),
+            by_status=by_status,
+            error_classes=error_classes,
+            duration=_duration_stats(durations),
+            stages={stage: _duration_stats(values) for stage, values in stage_values.items()},
+            tokens=tokens,
+        )
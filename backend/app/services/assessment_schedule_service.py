@@ -0,0 +1,229 @@
+import calendar
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.pagination import encode_cursor, keyset_after
+from app.models.assessment_schedule import (
+    RECURRENCE_MONTHS,
+    AssessmentSchedule,
+    ControlAssessment,
+)
+from app.models.compliance import Control
+from app.models.user import User
+from app.schemas.assessment_schedule import AssessmentScheduleCreate
+from app.services.audit_service import AuditService
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Same day-of-month ``months`` later, clamped to the end of shorter months."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
+
+
+def _naive_utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+def _materialize_horizon() -> datetime:
+    return datetime.utcnow() + timedelta(days=settings.ASSESSMENT_MATERIALIZE_HORIZON_DAYS)
+
+
+class AssessmentScheduleService:
+    """Recurring control assessments: schedules, materialised occurrences and the overdue queue."""
+
+    @staticmethod
+    async def create_schedule(
+        db: AsyncSession, data: AssessmentScheduleCreate, tenant_id: UUID, actor_id: UUID
+    ) -> AssessmentSchedule:
+        """Create a schedule and materialise its occurrences inside the horizon right away."""
+        control = (
+            await db.execute(
+                select(Control).where(Control.id == data.control_id, Control.tenant_id == tenant_id)
+            )
+        ).scalar_one_or_none()
+        if not control:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Control not found or access denied"
+            )
+        if data.owner_id:
+            owner = (
+                await db.execute(
+                    select(User.id).where(User.id == data.owner_id, User.tenant_id == tenant_id)
+                )
+            ).scalar_one_or_none()
+            if not owner:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Owner not found or access denied"
+                )
+
+        first_due_at = _naive_utc(data.first_due_at)
+        schedule = AssessmentSchedule(
+            tenant_id=tenant_id,
+            control_id=control.id,
+            owner_id=data.owner_id or control.owner_id,
+            recurrence=data.recurrence,
+            first_due_at=first_due_at,
+            occurrences=0,
+            next_due_at=first_due_at,
+        )
+        db.add(schedule)
+        await db.flush()
+        await AssessmentScheduleService._materialize(db, [schedule], _materialize_horizon())
+
+        await AuditService.log_action(
+            db=db,
+            actor_id=actor_id,
+            action="create_assessment_schedule",
+            entity_type="assessment_schedules",
+            entity_id=schedule.id,
+            changes={"control_id": str(control.id), "recurrence": data.recurrence.value},
+        )
+        return schedule
+
+    @staticmethod
+    async def _materialize(
+        db: AsyncSession, schedules: Sequence[AssessmentSchedule], horizon: datetime
+    ) -> int:
+        """Insert every occurrence due before ``horizon`` and advance ``next_due_at`` past it."""
+        rows = []
+        for schedule in schedules:
+            months = RECURRENCE_MONTHS[schedule.recurrence]
+            while schedule.next_due_at <= horizon:
+                rows.append(
+                    {
+                        "tenant_id": schedule.tenant_id,
+                        "schedule_id": schedule.id,
+                        "control_id": schedule.control_id,
+                        "owner_id": schedule.owner_id,
+                        "due_at": schedule.next_due_at,
+                    }
+                )
+                # Always from the anchor: Jan 31 gives Feb 28, then Mar 31 (not Mar 28)
+                schedule.occurrences += 1
+                schedule.next_due_at = add_months(schedule.first_due_at, schedule.occurrences * months)
+        if rows:
+            await db.execute(insert(ControlAssessment), rows)
+        return len(rows)
+
+    @staticmethod
+    async def materialize_due(
+        db: AsyncSession, horizon: Optional[datetime] = None, batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Materialise upcoming occurrences for all tenants, one committed batch of
+        schedules at a time. Locked rows are skipped so concurrent runs split the work.
+
+        Returns:
+            Number of assessments created
+        """
+        horizon = horizon or _materialize_horizon()
+        batch_size = batch_size or settings.ASSESSMENT_MATERIALIZE_BATCH_SIZE
+        created = 0
+        while True:
+            schedules = (
+                await db.execute(
+                    select(AssessmentSchedule)
+                    .where(AssessmentSchedule.active.is_(True), AssessmentSchedule.next_due_at <= horizon)
+                    .order_by(AssessmentSchedule.next_due_at)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).scalars().all()
+            if not schedules:
+                return created
+            created += await AssessmentScheduleService._materialize(db, schedules, horizon)
+            await db.commit()
+            if len(schedules) < batch_size:
+                return created
+
+    @staticmethod
+    def _overdue_filters(tenant_id: UUID, owner_id: UUID, now: datetime):
+        # Matches ix_control_assessments_tenant_owner_due (partial on completed_at IS NULL)
+        return (
+            ControlAssessment.tenant_id == tenant_id,
+            ControlAssessment.owner_id == owner_id,
+            ControlAssessment.completed_at.is_(None),
+            ControlAssessment.due_at < now,
+        )
+
+    @staticmethod
+    async def count_overdue(db: AsyncSession, tenant_id: UUID, owner_id: UUID) -> int:
+        result = await db.execute(
+            select(func.count(ControlAssessment.id)).where(
+                *AssessmentScheduleService._overdue_filters(tenant_id, owner_id, datetime.utcnow())
+            )
+        )
+        return result.scalar() or 0
+
+    @staticmethod
+    async def list_overdue(
+        db: AsyncSession,
+        tenant_id: UUID,
+        owner_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ControlAssessment], Optional[str]]:
+        """Overdue assessments for an owner, most overdue first, keyset-paginated on (due_at, id)."""
+        query = (
+            select(ControlAssessment)
+            .where(*AssessmentScheduleService._overdue_filters(tenant_id, owner_id, datetime.utcnow()))
+            .order_by(ControlAssessment.due_at, ControlAssessment.id)
+            .limit(limit + 1)
+        )
+        if cursor:
+            query = query.where(
+                keyset_after(ControlAssessment.due_at, ControlAssessment.id, cursor, descending=False)
+            )
+        assessments = list((await db.execute(query)).scalars().all())
+
+        next_cursor = None
+        if len(assessments) > limit:
+            assessments = assessments[:limit]
+            next_cursor = encode_cursor(assessments[-1].due_at, assessments[-1].id)
+        return assessments, next_cursor
+
+    @staticmethod
+    async def complete_assessment(
+        db: AsyncSession, assessment_id: UUID, tenant_id: UUID, actor_id: UUID, is_admin: bool = False
+    ) -> ControlAssessment:
+        """Mark an assessment done; only its owner or a tenant admin may complete it."""
+        assessment = (
+            await db.execute(
+                select(ControlAssessment).where(
+                    ControlAssessment.id == assessment_id, ControlAssessment.tenant_id == tenant_id
+                )
+            )
+        ).scalar_one_or_none()
+        if not assessment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found or access denied"
+            )
+        if assessment.owner_id != actor_id and not is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admins can complete another owner's assessments",
+            )
+        if assessment.completed_at is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Assessment already completed"
+            )
+
+        assessment.completed_at = datetime.utcnow()
+        assessment.completed_by = actor_id
+        await AuditService.log_action(
+            db=db,
+            actor_id=actor_id,
+            action="complete_control_assessment",
+            entity_type="control_assessments",
+            entity_id=assessment.id,
+            changes={"due_at": assessment.due_at.isoformat()},
+        )
+        return assessment
@@ -1,16 +1,72 @@
 """Service for BPO assessment actions on AI suggestions."""
 
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
-from uuid import UUID
-from typing import Dict, Optional, Any
+from uuid import UUID, uuid4
+from typing import Dict, List, Optional, Any, Tuple
 import json
 
 from app.models.compliance import BusinessProcess, Risk, Control
-from app.models.suggestion import AISuggestion
-from app.services.audit_service import AuditService
-from app.schemas.assessment import ResidualRisk, AssessmentResponse
+from app.models.suggestion import AISuggestion, SuggestionStatus
+from app.services.audit_service import AuditService, AuditWriter
+from app.services.compliance_summary_service import ComplianceSummaryService
+from app.schemas.assessment import (
+    AssessmentAction,
+    AssessmentResponse,
+    BulkAssessmentItem,
+    BulkAssessmentItemResult,
+    BulkAssessmentResponse,
+    ResidualRisk,
+)
+
+
+def _approval_values(
+    suggestion: AISuggestion, edits: Optional[Dict[str, str]]
+) -> Tuple[Dict[str, Any], str, str, str]:
+    """AI content plus the process name and risk/control descriptions to register.
+
+    Edits, when provided, override the AI-suggested values.
+    """
+    ai_content = suggestion.content if isinstance(suggestion.content, dict) else {}
+    business_process_name = (
+        edits.get("edited_business_process") if edits
+        else ai_content.get("business_process_name", "Unnamed Process")
+    )
+    risk_description = (
+        edits.get("edited_risk_description") if edits
+        else ai_content.get("risk_description", suggestion.rationale)
+    )
+    control_description = (
+        edits.get("edited_control_description") if edits
+        else ai_content.get("control_description", suggestion.rationale)
+    )
+    return ai_content, business_process_name, risk_description, control_description
+
+
+def _edit_diff(ai_content: Dict[str, Any], edits: Optional[Dict[str, str]]) -> Dict[str, Any]:
+    """Old/new values for each field the BPO changed, for the audit trail."""
+    if not edits:
+        return {}
+    original_values = {
+        "business_process": ai_content.get("business_process_name"),
+        "risk_description": ai_content.get("risk_description"),
+        "control_description": ai_content.get("control_description")
+    }
+    edited_values = {
+        "business_process": edits.get("edited_business_process"),
+        "risk_description": edits.get("edited_risk_description"),
+        "control_description": edits.get("edited_control_description")
+    }
+    diff = {}
+    for key in ["business_process", "risk_description", "control_description"]:
+        if edited_values.get(key) and edited_values[key] != original_values.get(key):
+            diff[key] = {
+                "old": original_values.get(key),
+                "new": edited_values[key]
+            }
+    return diff
 
 
 class AssessmentService:
@@ -71,22 +127,12 @@ class AssessmentService:
                     f"Suggestion {suggestion_id} has status '{suggestion.status}', "
                     "expected 'pending_review'. Cannot approve."
                 )
+            scope = AISuggestion.id == suggestion_id
+            before = await ComplianceSummaryService.count(db, tenant_id, suggestions=scope)
 
-            # Extract AI-suggested data from suggestion.content (JSON field)
-            ai_content = suggestion.content if isinstance(suggestion.content, dict) else {}
-
-            # Apply edits if provided, otherwise use AI-suggested values
-            business_process_name = (
-                edits.get("edited_business_process") if edits
-                else ai_content.get("business_process_name", "Unnamed Process")
-            )
-            risk_description = (
-                edits.get("edited_risk_description") if edits
-                else ai_content.get("risk_description", suggestion.rationale)
-            )
-            control_description = (
-                edits.get("edited_control_description") if edits
-                else ai_content.get("control_description", suggestion.rationale)
+            # Extract AI-suggested data, with edits applied if provided
+            ai_content, business_process_name, risk_description, control_description = (
+                _approval_values(suggestion, edits)
             )
 
             # Create active records
@@ -140,27 +186,9 @@ class AssessmentService:
             }
 
             # Add edits to audit log if provided
-            if edits:
-                original_values = {
-                    "business_process": ai_content.get("business_process_name"),
-                    "risk_description": ai_content.get("risk_description"),
-                    "control_description": ai_content.get("control_description")
-                }
-                edited_values = {
-                    "business_process": edits.get("edited_business_process"),
-                    "risk_description": edits.get("edited_risk_description"),
-                    "control_description": edits.get("edited_control_description")
-                }
-                # Calculate diff
-                diff = {}
-                for key in ["business_process", "risk_description", "control_description"]:
-                    if edited_values.get(key) and edited_values[key] != original_values.get(key):
-                        diff[key] = {
-                            "old": original_values.get(key),
-                            "new": edited_values[key]
-                        }
-                if diff:
-                    audit_changes["edits"] = diff
+            diff = _edit_diff(ai_content, edits)
+            if diff:
+                audit_changes["edits"] = diff
 
             # Log to audit trail (atomic transaction - if this fails, entire transaction rolls back)
             audit_entry = await AuditService.log_action(
@@ -172,6 +200,11 @@ class AssessmentService:
                 changes=audit_changes
             )
 
+            await db.flush()
+            await ComplianceSummaryService.record_change(
+                db, tenant_id, before, suggestions=scope, risks=Risk.id == risk.id
+            )
+
             # Commit transaction
             await db.commit()
 
@@ -235,6 +268,8 @@ class AssessmentService:
                     f"Suggestion {suggestion_id} has status '{suggestion.status}', "
                     "expected 'pending_review'. Cannot discard."
                 )
+            scope = AISuggestion.id == suggestion_id
+            before = await ComplianceSummaryService.count(db, tenant_id, suggestions=scope)
 
             # Update suggestion status to "archived"
             old_status = suggestion.status
@@ -260,6 +295,9 @@ class AssessmentService:
                 changes=audit_changes
             )
 
+            await db.flush()
+            await ComplianceSummaryService.record_change(db, tenant_id, before, suggestions=scope)
+
             # Commit transaction
             await db.commit()
 
@@ -277,3 +315,187 @@ class AssessmentService:
         except Exception as e:
             await db.rollback()
             raise
+
+    @staticmethod
+    async def bulk_assess(
+        db: AsyncSession,
+        items: List[BulkAssessmentItem],
+        actor_id: UUID,
+        tenant_id: UUID
+    ) -> BulkAssessmentResponse:
+        """Approve or discard many suggestions in a single transaction.
+
+        The selected suggestions are locked with one ``SELECT ... FOR UPDATE SKIP LOCKED``,
+        so rows another BPO is assessing right now are reported as unavailable instead
+        of blocking. Every item still gets the per-item checks of ``approve_suggestion``
+        and ``discard_suggestion``; items failing them are reported and skipped while
+        the rest are registered. Active records are bulk-inserted, audit entries are
+        buffered by AuditWriter, and the transaction commits once.
+
+        Args:
+            db: Database session
+            items: Assessment actions, one per suggestion
+            actor_id: UUID of the BPO performing the assessment
+            tenant_id: Tenant ID for multi-tenancy isolation
+
+        Returns:
+            BulkAssessmentResponse with one outcome per item, in request order
+
+        Raises:
+            RuntimeError: If the database operation fails (nothing is committed)
+        """
+        try:
+            result = await db.execute(
+                select(AISuggestion)
+                .where(
+                    AISuggestion.id.in_({item.suggestion_id for item in items}),
+                    AISuggestion.tenant_id == tenant_id
+                )
+                .with_for_update(skip_locked=True)
+            )
+            suggestions = {suggestion.id: suggestion for suggestion in result.scalars().all()}
+
+            results: List[BulkAssessmentItemResult] = []
+            processes, risks, controls = [], [], []
+            new_status: Dict[UUID, SuggestionStatus] = {}
+            seen = set()
+
+            for item in items:
+                suggestion_id = item.suggestion_id
+                suggestion = suggestions.get(suggestion_id)
+                error = None
+                # Only the first action per suggestion is considered, even if it fails
+                if suggestion_id in seen:
+                    error = f"Suggestion {suggestion_id} appears more than once in this request"
+                elif not suggestion:
+                    error = f"Suggestion {suggestion_id} not found, not accessible or being assessed"
+                elif suggestion.assigned_bpo_id != actor_id:
+                    error = f"Suggestion {suggestion_id} is not assigned to you"
+                # Optimistic locking: verify suggestion is still pending_review
+                elif suggestion.status != "pending_review":
+                    error = (
+                        f"Suggestion {suggestion_id} has status '{suggestion.status.value}', "
+                        f"expected 'pending_review'. Cannot {item.action.value}."
+                    )
+                elif item.action == AssessmentAction.APPROVE and not item.residual_risk:
+                    error = "Residual risk is required for approve action"
+                seen.add(suggestion_id)
+                if error:
+                    results.append(
+                        BulkAssessmentItemResult(suggestion_id=suggestion_id, success=False, message=error)
+                    )
+                    continue
+
+                if item.action == AssessmentAction.APPROVE:
+                    edits = item.edits()
+                    ai_content, business_process_name, risk_description, control_description = (
+                        _approval_values(suggestion, edits)
+                    )
+                    record_ids = {
+                        "business_process_id": uuid4(),
+                        "risk_id": uuid4(),
+                        "control_id": uuid4()
+                    }
+                    processes.append({
+                        "id": record_ids["business_process_id"],
+                        "tenant_id": tenant_id,
+                        "name": business_process_name,
+                        "description": f"Business process for {business_process_name}",
+                        "owner_id": actor_id
+                    })
+                    risks.append({
+                        "id": record_ids["risk_id"],
+                        "tenant_id": tenant_id,
+                        "name": ai_content.get("risk_name", "Unnamed Risk"),
+                        "description": risk_description,
+                        "category": item.residual_risk.value,
+                        "owner_id": actor_id
+                    })
+                    controls.append({
+                        "id": record_ids["control_id"],
+                        "tenant_id": tenant_id,
+                        "name": ai_content.get("control_name", "Unnamed Control"),
+                        "description": control_description,
+                        "type": ai_content.get("control_type", "Preventive"),
+                        "owner_id": actor_id
+                    })
+                    updated_status = SuggestionStatus.active
+                    audit_changes = {
+                        "action": "approve",
+                        "residual_risk": item.residual_risk.value,
+                        "suggestion_id": str(suggestion_id),
+                        "created_records": {key: str(value) for key, value in record_ids.items()},
+                        "status_change": {"old": "pending_review", "new": "active"}
+                    }
+                    diff = _edit_diff(ai_content, edits)
+                    if diff:
+                        audit_changes["edits"] = diff
+                    message = "Successfully added to register"
+                else:
+                    record_ids = None
+                    updated_status = SuggestionStatus.archived
+                    audit_changes = {
+                        "action": "discard",
+                        "suggestion_id": str(suggestion_id),
+                        "status_change": {"old": "pending_review", "new": "archived"}
+                    }
+                    message = "Item discarded"
+
+                new_status[suggestion_id] = updated_status
+                # Buffered; written with the other entries as one INSERT at commit
+                audit_log_id = AuditWriter.record(
+                    db,
+                    actor_id=actor_id,
+                    action=f"{item.action.value}_suggestion",
+                    entity_type="ai_suggestion",
+                    entity_id=suggestion_id,
+                    changes=audit_changes
+                )
+                results.append(
+                    BulkAssessmentItemResult(
+                        suggestion_id=suggestion_id,
+                        success=True,
+                        message=message,
+                        updated_status=updated_status.value,
+                        audit_log_id=audit_log_id,
+                        active_record_ids=record_ids
+                    )
+                )
+
+            if new_status:
+                scope = AISuggestion.id.in_(list(new_status))
+                before = await ComplianceSummaryService.count(db, tenant_id, suggestions=scope)
+                for model, rows in ((BusinessProcess, processes), (Risk, risks), (Control, controls)):
+                    if rows:
+                        await db.execute(insert(model), rows)
+                for status_value in set(new_status.values()):
+                    await db.execute(
+                        update(AISuggestion)
+                        .where(AISuggestion.id.in_(
+                            [sid for sid, value in new_status.items() if value == status_value]
+                        ))
+                        .values(status=status_value)
+                    )
+                await ComplianceSummaryService.record_change(
+                    db,
+                    tenant_id,
+                    before,
+                    events=len(new_status),
+                    suggestions=scope,
+                    risks=Risk.id.in_([row["id"] for row in risks]) if risks else None,
+                )
+
+            # Commit once (also releases the row locks when nothing was assessed)
+            await db.commit()
+
+            succeeded = len(new_status)
+            return BulkAssessmentResponse(
+                results=results, succeeded=succeeded, failed=len(results) - succeeded
+            )
+
+        except SQLAlchemyError as e:
+            await db.rollback()
+            raise RuntimeError(f"Database error during bulk assessment: {str(e)}")
+        except Exception:
+            await db.rollback()
+            raise
@@ -0,0 +1,294 @@
+import gzip
+import io
+import json
+import logging
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.responses import dumps
+from app.core.supabase import supabase_client
+from app.models.audit_log import AuditLog, AuditLogArchive
+
+logger = logging.getLogger(__name__)
+
+# Partitions are named audit_logs_yYYYYmMM (see migration d5f7b9c1e346)
+PARTITION_PREFIX = "audit_logs_y"
+# Catches inserts for months without a partition (maintenance fell behind)
+DEFAULT_PARTITION = "audit_logs_default"
+
+EXPORT_COLUMNS = ("id", "action", "entity_type", "entity_id", "actor_id", "changes", "created_at")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def shift_month(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year:04d}m{month.month:02d}"
+
+
+def _month_from_partition(name: str) -> Optional[date]:
+    try:
+        return date(int(name[len(PARTITION_PREFIX):len(PARTITION_PREFIX) + 4]), int(name[-2:]), 1)
+    except ValueError:
+        return None
+
+
+class ArchiveStore(Protocol):
+    def put(self, path: str, data: bytes) -> None: ...
+
+    def get(self, path: str) -> bytes: ...
+
+
+class SupabaseArchiveStore:
+    """Archives in the Supabase Storage bucket used for documents."""
+
+    def __init__(self, bucket: str = settings.SUPABASE_STORAGE_BUCKET):
+        if not supabase_client:
+            raise RuntimeError("Supabase storage is not configured; set AUDIT_ARCHIVE_DIR to archive locally")
+        self.bucket = supabase_client.storage.from_(bucket)
+
+    def put(self, path: str, data: bytes) -> None:
+        self.bucket.upload(path, data, {"content-type": "application/gzip", "upsert": "true"})
+
+    def get(self, path: str) -> bytes:
+        return self.bucket.download(path)
+
+
+class LocalArchiveStore:
+    """Archives in a local directory (development, tests, mounted volumes)."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def put(self, path: str, data: bytes) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+    def get(self, path: str) -> bytes:
+        return (self.root / path).read_bytes()
+
+
+def get_archive_store() -> ArchiveStore:
+    if settings.AUDIT_ARCHIVE_DIR:
+        return LocalArchiveStore(settings.AUDIT_ARCHIVE_DIR)
+    return SupabaseArchiveStore()
+
+
+class AuditArchiveService:
+    """
+    Monthly partitions, retention and cold archive for audit_logs.
+
+    On Postgres audit_logs is partitioned by month: ``ensure_partitions`` creates
+    upcoming partitions and ``archive_expired`` exports each partition past the
+    retention window to object storage as gzip-compressed NDJSON, then detaches and
+    drops it. Rows that landed in the DEFAULT partition are moved into their month's
+    partition when it is created, and months held only by DEFAULT are archived and
+    deleted like any other. On other databases (SQLite) the same export runs on month
+    ranges of the plain table and the rows are deleted instead. ``read_archived``
+    reads exported months back for the audit log API.
+    """
+
+    @staticmethod
+    def _is_postgres(db: AsyncSession) -> bool:
+        return db.bind.dialect.name == "postgresql"
+
+    @staticmethod
+    async def ensure_partitions(db: AsyncSession, months_ahead: Optional[int] = None) -> List[str]:
+        """Create partitions from the current month through ``months_ahead`` months ahead."""
+        if not AuditArchiveService._is_postgres(db):
+            return []
+        months_ahead = settings.AUDIT_PARTITION_PREMAKE_MONTHS if months_ahead is None else months_ahead
+        current = month_start(datetime.utcnow().date())
+        existing = set(await AuditArchiveService._partitions(db))
+        created = []
+        for offset in range(months_ahead + 1):
+            month = shift_month(current, offset)
+            name = partition_name(month)
+            if name in existing:
+                continue
+            if await AuditArchiveService._create_partition(db, month):
+                created.append(name)
+        await db.commit()
+        return created
+
+    @staticmethod
+    async def _create_partition(db: AsyncSession, month: date) -> bool:
+        """
+        Create the month's partition; False if a concurrent run already did. Postgres
+        refuses a partition whose range has rows in DEFAULT, so those rows are moved
+        into a new table that is then attached; DEFAULT stays locked until commit so
+        no new ones arrive meanwhile.
+        """
+        name = partition_name(month)
+        bounds = f"FROM ('{month.isoformat()}') TO ('{shift_month(month, 1).isoformat()}')"
+        in_range = f"created_at >= '{month.isoformat()}' AND created_at < '{shift_month(month, 1).isoformat()}'"
+        await db.execute(text(f"LOCK TABLE {DEFAULT_PARTITION} IN EXCLUSIVE MODE"))
+        if (await db.execute(text("SELECT to_regclass(:name)"), {"name": name})).scalar():
+            return False
+        stranded = (
+            await db.execute(text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"))
+        ).scalar()
+        if not stranded:
+            await db.execute(text(f"CREATE TABLE {name} PARTITION OF audit_logs FOR VALUES {bounds}"))
+            return True
+
+        await db.execute(text(f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        await db.execute(text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        await db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        await db.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {name} FOR VALUES {bounds}"))
+        logger.warning(f"Moved audit entries for {month:%Y-%m} out of {DEFAULT_PARTITION}")
+        return True
+
+    @staticmethod
+    async def _partitions(db: AsyncSession) -> List[str]:
+        result = await db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'audit_logs'::regclass"
+            )
+        )
+        return [name for name in result.scalars().all() if name.startswith(PARTITION_PREFIX)]
+
+    @staticmethod
+    async def _expired_months(db: AsyncSession, cutoff: date) -> List[date]:
+        """Months entirely before ``cutoff`` that are still in the database."""
+        if AuditArchiveService._is_postgres(db):
+            months = {_month_from_partition(name) for name in await AuditArchiveService._partitions(db)}
+            # Months without a partition whose entries sit in DEFAULT
+            result = await db.execute(
+                text(
+                    f"SELECT DISTINCT date_trunc('month', created_at)::date FROM {DEFAULT_PARTITION} "
+                    "WHERE created_at < :cutoff"
+                ),
+                {"cutoff": cutoff},
+            )
+            months.update(result.scalars().all())
+            return sorted(month for month in months if month and month < cutoff)
+
+        oldest = (
+            await db.execute(
+                select(func.min(AuditLog.created_at)).where(
+                    AuditLog.created_at < datetime.combine(cutoff, datetime.min.time())
+                )
+            )
+        ).scalar()
+        if oldest is None:
+            return []
+        months, month = [], month_start(oldest)
+        while month < cutoff:
+            months.append(month)
+            month = shift_month(month, 1)
+        return months
+
+    @staticmethod
+    async def archive_month(db: AsyncSession, store: ArchiveStore, month: date) -> int:
+        """
+        Export one month to ``store``, record it in audit_log_archives and remove it
+        from the database, in that order, so a failure never loses entries.
+
+        Returns:
+            Number of entries archived
+        """
+        start = datetime.combine(month, datetime.min.time())
+        end = datetime.combine(shift_month(month, 1), datetime.min.time())
+        buffer = io.BytesIO()
+        row_count = 0
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as archive:
+            rows = await db.stream(
+                select(*(getattr(AuditLog, column) for column in EXPORT_COLUMNS))
+                .where(AuditLog.created_at >= start, AuditLog.created_at < end)
+                .order_by(AuditLog.created_at)
+                .execution_options(yield_per=1000)
+            )
+            async for row in rows:
+                archive.write(dumps(dict(row._mapping)) + b"\n")
+                row_count += 1
+
+        object_path = f"{settings.AUDIT_ARCHIVE_PREFIX}/{month.year:04d}/{month.month:02d}.ndjson.gz"
+        if row_count:
+            store.put(object_path, buffer.getvalue())
+            # Re-running a month (e.g. after a failed detach) replaces its manifest entry
+            existing = (
+                await db.execute(select(AuditLogArchive).where(AuditLogArchive.month == month))
+            ).scalar_one_or_none()
+            if existing:
+                existing.object_path, existing.row_count = object_path, row_count
+                existing.archived_at = datetime.utcnow()
+            else:
+                db.add(AuditLogArchive(month=month, object_path=object_path, row_count=row_count))
+
+        name = partition_name(month)
+        if AuditArchiveService._is_postgres(db) and name in await AuditArchiveService._partitions(db):
+            await db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+            await db.execute(text(f"DROP TABLE {name}"))
+        else:
+            # SQLite, or a month whose entries are in DEFAULT
+            await db.execute(
+                AuditLog.__table__.delete().where(AuditLog.created_at >= start, AuditLog.created_at < end)
+            )
+        await db.commit()
+        return row_count
+
+    @staticmethod
+    async def archive_expired(
+        db: AsyncSession, store: ArchiveStore, retention_months: Optional[int] = None
+    ) -> Dict[date, int]:
+        """Archive every month older than the retention window; returns entries per month."""
+        retention_months = settings.AUDIT_RETENTION_MONTHS if retention_months is None else retention_months
+        cutoff = shift_month(month_start(datetime.utcnow().date()), -retention_months)
+        archived = {}
+        for month in await AuditArchiveService._expired_months(db, cutoff):
+            archived[month] = await AuditArchiveService.archive_month(db, store, month)
+            logger.info(f"Archived {archived[month]} audit entries for {month:%Y-%m}")
+        return archived
+
+    @staticmethod
+    async def read_archived(
+        db: AsyncSession,
+        store: ArchiveStore,
+        since: datetime,
+        until: datetime,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[UUID] = None,
+        actor_id: Optional[UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Archived entries matching the filters, read from the months overlapping
+        [since, until). Each month is decompressed in memory, so the range is required.
+        """
+        query = (
+            select(AuditLogArchive)
+            .where(
+                AuditLogArchive.month >= month_start(since.date()),
+                AuditLogArchive.month <= until.date(),
+            )
+            .order_by(AuditLogArchive.month)
+        )
+        archives = (await db.execute(query)).scalars().all()
+
+        filters = {"entity_type": entity_type, "entity_id": entity_id, "actor_id": actor_id}
+        filters = {key: str(value) for key, value in filters.items() if value is not None}
+        entries = []
+        for archive in archives:
+            for line in gzip.decompress(store.get(archive.object_path)).splitlines():
+                entry = json.loads(line)
+                if any(entry[key] != value for key, value in filters.items()):
+                    continue
+                created_at = datetime.fromisoformat(entry["created_at"])
+                if created_at < since or created_at >= until:
+                    continue
+                entries.append(entry)
+        return entries
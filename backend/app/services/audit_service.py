@@ -1,9 +1,48 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+from datetime import datetime
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
+from sqlalchemy.orm import Session
 from uuid import UUID
+from app.config import settings
+from app.database import async_session_maker
 from app.models.audit_log import AuditLog
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 import json
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding audit rows buffered by AuditWriter
+_AUDIT_BUFFER_KEY = "audit_buffer"
+# Session.info key mapping each open savepoint to the buffer length when it began
+_AUDIT_SAVEPOINTS_KEY = "audit_savepoints"
+
+
+def _audit_row(
+    actor_id: UUID,
+    action: str,
+    entity_type: str,
+    entity_id: UUID,
+    changes: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]],
+) -> Dict[str, Any]:
+    return {
+        "id": uuid.uuid4(),
+        "actor_id": actor_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "changes": changes,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def _pointer(path: str, key: Any) -> str:
+    """Append ``key`` to a JSON pointer, escaping per RFC 6901."""
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
 
 class AuditService:
     @staticmethod
@@ -26,17 +65,27 @@ class AuditService:
             changes=changes
         )
         db.add(audit_entry)
-        # We usually commit in the caller (service/endpoint), but for audit logs 
+        # We usually commit in the caller (service/endpoint), but for audit logs
         # sometimes we want to ensure it persists even if main transaction logic varies.
         # However, standard practice is to join the main transaction.
         # Caller must commit.
         return audit_entry
 
     @staticmethod
-    def calculate_diff(old_obj: Any, new_data: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_diff(
+        old_obj: Any, new_data: Dict[str, Any], as_patch: bool = False
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Calculate simple diff between an SQLAlchemy object and new data dictionary.
+
+        With ``as_patch`` the diff is a JSON Patch (RFC 6902) instead: only new values
+        are stored, and nested dicts are diffed key by key rather than stored whole.
         """
+        if as_patch:
+            old_values = {key: getattr(old_obj, key) for key in new_data if hasattr(old_obj, key)}
+            return AuditService.json_patch(
+                old_values, {key: value for key, value in new_data.items() if key in old_values}
+            )
         diff = {}
         for key, value in new_data.items():
             if hasattr(old_obj, key):
@@ -44,3 +93,165 @@ class AuditService:
                 if old_val != value:
                     diff[key] = {"old": old_val, "new": value}
         return diff
+
+    @staticmethod
+    def json_patch(old: Dict[str, Any], new: Dict[str, Any], path: str = "") -> List[Dict[str, Any]]:
+        """
+        JSON Patch operations turning ``old`` into ``new``.
+        """
+        ops = [{"op": "remove", "path": _pointer(path, key)} for key in old if key not in new]
+        for key, value in new.items():
+            pointer = _pointer(path, key)
+            if key not in old:
+                ops.append({"op": "add", "path": pointer, "value": value})
+            elif isinstance(old[key], dict) and isinstance(value, dict):
+                ops.extend(AuditService.json_patch(old[key], value, pointer))
+            elif old[key] != value:
+                ops.append({"op": "replace", "path": pointer, "value": value})
+        return ops
+
+
+class AuditWriter:
+    """
+    Buffers the audit entries of a unit of work and writes them as one multi-row
+    INSERT when the session commits; a rollback discards them with the rest of the
+    transaction, and a rolled-back savepoint discards the entries recorded inside it.
+    ``record`` returns the entry id right away, before anything is written.
+
+    Prefer it over ``AuditService.log_action`` when a request writes many entries.
+    """
+
+    @staticmethod
+    def record(
+        db: AsyncSession,
+        actor_id: UUID,
+        action: str,
+        entity_type: str,
+        entity_id: UUID,
+        changes: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ) -> UUID:
+        row = _audit_row(actor_id, action, entity_type, entity_id, changes)
+        if not db.in_transaction():
+            # Open the (lazy, connection-less) transaction so a rollback() fires the discard hook
+            db.sync_session.begin()
+        db.info.setdefault(_AUDIT_BUFFER_KEY, []).append(row)
+        return row["id"]
+
+
+@event.listens_for(Session, "before_commit")
+def _write_buffered_audit_entries(session: Session) -> None:
+    rows = session.info.pop(_AUDIT_BUFFER_KEY, None)
+    if rows:
+        session.execute(insert(AuditLog), rows)
+
+
+@event.listens_for(Session, "after_transaction_create")
+def _mark_audit_savepoint(session: Session, transaction) -> None:
+    if transaction.nested:
+        buffered = len(session.info.get(_AUDIT_BUFFER_KEY, ()))
+        session.info.setdefault(_AUDIT_SAVEPOINTS_KEY, {})[transaction] = buffered
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_audit_savepoints(session: Session, transaction) -> None:
+    # Fires before after_soft_rollback, so savepoint marks live until the outer transaction ends
+    if transaction.parent is None:
+        session.info.pop(_AUDIT_SAVEPOINTS_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_buffered_audit_entries(session: Session, previous_transaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_AUDIT_BUFFER_KEY, None)
+        return
+    # Savepoint rollback: keep only what was buffered before the savepoint began
+    mark = session.info.get(_AUDIT_SAVEPOINTS_KEY, {}).get(previous_transaction)
+    if mark is not None and _AUDIT_BUFFER_KEY in session.info:
+        del session.info[_AUDIT_BUFFER_KEY][mark:]
+
+
+class AuditQueue:
+    """
+    Bounded in-process queue for non-critical audit events, written in batches by a
+    background task with its own session so the request never waits on the insert.
+
+    Events are dropped (and counted in ``dropped``) when the queue is full or the
+    process dies before a flush; anything that must be recorded goes through
+    ``AuditWriter`` or ``AuditService.log_action`` inside the request's transaction.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        batch_size: int,
+        session_factory: Optional[async_sessionmaker] = None,
+    ):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.session_factory = session_factory or async_session_maker
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def put(
+        self,
+        actor_id: UUID,
+        action: str,
+        entity_type: str,
+        entity_id: UUID,
+        changes: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ) -> bool:
+        """Queue an event without waiting; returns False if it was dropped."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(_audit_row(actor_id, action, entity_type, entity_id, changes))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Audit queue full, dropped {action} on {entity_type} {entity_id}")
+            return False
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The queue and its worker belong to one event loop
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            rows = [await self._queue.get()]
+            while len(rows) < self.batch_size and not self._queue.empty():
+                rows.append(self._queue.get_nowait())
+            try:
+                await self._write(rows)
+            except Exception:
+                logger.exception(f"Failed to write {len(rows)} queued audit entries")
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        async with self.session_factory() as db:
+            await db.execute(insert(AuditLog), rows)
+            await db.commit()
+
+
+audit_queue = AuditQueue(
+    maxsize=settings.AUDIT_QUEUE_MAX_SIZE, batch_size=settings.AUDIT_QUEUE_BATCH_SIZE
+)
@@ -0,0 +1,292 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, true, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.compliance import RegulatoryRequirement, Risk
+from app.models.compliance_summary import TenantActivityCounter, TenantComplianceSummary
+from app.models.mapping import ControlRegulatoryRequirement
+from app.models.suggestion import AISuggestion, SuggestionStatus
+
+# Relative weight of each score component; components without data are left out
+COVERAGE_WEIGHT = 0.5
+RISK_WEIGHT = 0.3
+BACKLOG_WEIGHT = 0.2
+
+# Share of a risk that counts as exposure, by residual-risk category (Risk.category)
+RESIDUAL_RISK_EXPOSURE = {"high": 1.0, "medium": 0.5, "low": 0.0}
+
+BACKLOG_STATUSES = (SuggestionStatus.pending, SuggestionStatus.pending_review)
+
+COUNTERS = (
+    "requirements_total",
+    "requirements_mapped",
+    "risks_total",
+    "risks_high",
+    "risks_medium",
+    "risks_low",
+    "suggestions_backlog",
+    "suggestions_stale",
+)
+
+
+def compute_compliance_score(
+    requirements_total: int,
+    requirements_mapped: int,
+    risks_high: int,
+    risks_medium: int,
+    risks_low: int,
+    suggestions_backlog: int,
+    suggestions_stale: int,
+) -> Optional[int]:
+    """Weighted 0-100 score from mapping coverage, residual-risk categories and backlog freshness.
+
+    Risks without a low/medium/high category are not rated and do not count.
+    Returns None when the tenant has nothing to score yet.
+    """
+    components = []
+    if requirements_total:
+        components.append((COVERAGE_WEIGHT, requirements_mapped / requirements_total))
+    rated = risks_high + risks_medium + risks_low
+    if rated:
+        exposure = (
+            RESIDUAL_RISK_EXPOSURE["high"] * risks_high
+            + RESIDUAL_RISK_EXPOSURE["medium"] * risks_medium
+            + RESIDUAL_RISK_EXPOSURE["low"] * risks_low
+        )
+        components.append((RISK_WEIGHT, 1 - exposure / rated))
+    if suggestions_backlog:
+        components.append((BACKLOG_WEIGHT, 1 - suggestions_stale / suggestions_backlog))
+    if not components:
+        return None
+    total_weight = sum(weight for weight, _ in components)
+    return round(100 * sum(weight * value for weight, value in components) / total_weight)
+
+
+def _score(counters) -> Optional[int]:
+    return compute_compliance_score(**{key: counters[key] for key in COUNTERS if key != "risks_total"})
+
+
+def _insert_for(db: AsyncSession, table):
+    """INSERT supporting ON CONFLICT for the session's dialect (Postgres, SQLite in tests)."""
+    dialect = db.bind.dialect.name
+    return (postgresql.insert if dialect == "postgresql" else sqlite.insert)(table)
+
+
+def _risk_category(category: str):
+    return func.count(Risk.id).filter(func.lower(Risk.category) == category)
+
+
+class ComplianceSummaryService:
+    """Maintains tenant_compliance_summary and the daily activity counters.
+
+    Writes apply deltas: the writer counts the rows it is about to touch (``count``
+    with a scope), writes, and ``record_change`` adds the difference to the summary
+    row with one ``UPDATE ... SET col = col + :n``. Scopes that select rows through
+    a relationship the write changes (e.g. mappings of a deleted control) must be
+    materialised as ids first. Call it inside the writing transaction, before its
+    commit. The hourly beat task recomputes every summary from scratch with
+    ``refresh``, which also ages the backlog.
+    """
+
+    @staticmethod
+    async def count(
+        db: AsyncSession,
+        tenant_id: UUID,
+        requirements=None,
+        risks=None,
+        suggestions=None,
+    ) -> Dict[str, int]:
+        """
+        Summary counters over the requirements, risks and suggestions matching the
+        given where-clauses, in one query. A scope left as None is not counted.
+        """
+        columns = []
+        if requirements is not None:
+            # Mappings target either the requirement itself or its whole framework
+            mapped = (
+                select(ControlRegulatoryRequirement.id)
+                .where(
+                    ControlRegulatoryRequirement.tenant_id == tenant_id,
+                    ControlRegulatoryRequirement.regulatory_requirement_id.in_(
+                        [RegulatoryRequirement.id, RegulatoryRequirement.framework_id]
+                    ),
+                )
+                .exists()
+            )
+            scope = and_(RegulatoryRequirement.tenant_id == tenant_id, requirements)
+            columns += [
+                select(func.count(RegulatoryRequirement.id)).where(scope).scalar_subquery()
+                .label("requirements_total"),
+                select(func.count(RegulatoryRequirement.id)).where(scope, mapped).scalar_subquery()
+                .label("requirements_mapped"),
+            ]
+        if risks is not None:
+            risk_counts = (
+                select(
+                    func.count(Risk.id).label("total"),
+                    _risk_category("high").label("high"),
+                    _risk_category("medium").label("medium"),
+                    _risk_category("low").label("low"),
+                )
+                .where(Risk.tenant_id == tenant_id, risks)
+                .subquery()
+            )
+            columns += [
+                risk_counts.c.total.label("risks_total"),
+                risk_counts.c.high.label("risks_high"),
+                risk_counts.c.medium.label("risks_medium"),
+                risk_counts.c.low.label("risks_low"),
+            ]
+        if suggestions is not None:
+            stale_before = datetime.utcnow() - timedelta(days=settings.COMPLIANCE_BACKLOG_SLA_DAYS)
+            backlog = and_(
+                AISuggestion.tenant_id == tenant_id,
+                AISuggestion.status.in_(BACKLOG_STATUSES),
+                suggestions,
+            )
+            columns += [
+                select(func.count(AISuggestion.id)).where(backlog).scalar_subquery()
+                .label("suggestions_backlog"),
+                select(func.count(AISuggestion.id))
+                .where(backlog, AISuggestion.created_at < stale_before)
+                .scalar_subquery()
+                .label("suggestions_stale"),
+            ]
+        if not columns:
+            return {}
+        row = (await db.execute(select(*columns))).one()
+        return {key: value or 0 for key, value in row._mapping.items()}
+
+    @staticmethod
+    async def record_change(
+        db: AsyncSession,
+        tenant_id: UUID,
+        before: Optional[Dict[str, int]] = None,
+        events: int = 1,
+        requirements=None,
+        risks=None,
+        suggestions=None,
+    ) -> None:
+        """
+        Count a compliance write: recount the scopes ``before`` was taken over (new
+        rows need no ``before``), add the differences to the summary and ``events``
+        to today's activity bucket.
+        """
+        after = await ComplianceSummaryService.count(
+            db, tenant_id, requirements=requirements, risks=risks, suggestions=suggestions
+        )
+        before = before or {}
+        deltas = {key: after.get(key, 0) - before.get(key, 0) for key in after.keys() | before.keys()}
+        await ComplianceSummaryService.apply_delta(db, tenant_id, deltas)
+        await ComplianceSummaryService.record_activity(db, tenant_id, events)
+
+    @staticmethod
+    async def apply_delta(db: AsyncSession, tenant_id: UUID, deltas: Dict[str, int]) -> None:
+        """Add ``deltas`` to the tenant's counters and rescore; builds the row on first use."""
+        deltas = {key: value for key, value in deltas.items() if value}
+        if not deltas:
+            return
+        summary = TenantComplianceSummary.__table__.c
+        result = await db.execute(
+            update(TenantComplianceSummary)
+            .where(TenantComplianceSummary.tenant_id == tenant_id)
+            .values(
+                updated_at=datetime.utcnow(),
+                **{key: summary[key] + value for key, value in deltas.items()},
+            )
+            .returning(*(summary[key] for key in COUNTERS), summary.compliance_score)
+        )
+        row = result.one_or_none()
+        if row is None:
+            # No summary for the tenant yet: the one full count includes this write
+            await ComplianceSummaryService.refresh(db, tenant_id)
+            return
+        score = _score(row._mapping)
+        if score != row.compliance_score:
+            await db.execute(
+                update(TenantComplianceSummary)
+                .where(TenantComplianceSummary.tenant_id == tenant_id)
+                .values(compliance_score=score)
+            )
+
+    @staticmethod
+    async def refresh(db: AsyncSession, tenant_id: UUID) -> None:
+        """Recompute the tenant's summary row from all of its rows (beat task, first write)."""
+        values = await ComplianceSummaryService.count(
+            db, tenant_id, requirements=true(), risks=true(), suggestions=true()
+        )
+        values["compliance_score"] = _score(values)
+        values["updated_at"] = datetime.utcnow()
+
+        stmt = _insert_for(db, TenantComplianceSummary).values(tenant_id=tenant_id, **values)
+        await db.execute(
+            stmt.on_conflict_do_update(index_elements=["tenant_id"], set_=values)
+        )
+
+    @staticmethod
+    async def record_activity(db: AsyncSession, tenant_id: UUID, events: int = 1) -> None:
+        """Add ``events`` to today's (UTC) activity bucket for the tenant."""
+        if not events:
+            return
+        stmt = _insert_for(db, TenantActivityCounter).values(
+            tenant_id=tenant_id, bucket_date=datetime.utcnow().date(), events=events
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["tenant_id", "bucket_date"],
+                set_={"events": TenantActivityCounter.events + stmt.excluded.events},
+            )
+        )
+
+    @staticmethod
+    async def requirements_mapped_by_controls(
+        db: AsyncSession, tenant_id: UUID, control_ids
+    ) -> List[UUID]:
+        """Ids of the requirements mapped (directly or via their framework) by the controls."""
+        targets = select(ControlRegulatoryRequirement.regulatory_requirement_id).where(
+            ControlRegulatoryRequirement.tenant_id == tenant_id,
+            ControlRegulatoryRequirement.control_id.in_(control_ids),
+        )
+        result = await db.execute(
+            select(RegulatoryRequirement.id).where(
+                RegulatoryRequirement.tenant_id == tenant_id,
+                or_(RegulatoryRequirement.id.in_(targets), RegulatoryRequirement.framework_id.in_(targets)),
+            )
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def recent_activity_query(tenant_id: UUID, days: int = 7):
+        """Activity events of the last ``days`` UTC days, today included."""
+        since = datetime.utcnow().date() - timedelta(days=days - 1)
+        return select(func.coalesce(func.sum(TenantActivityCounter.events), 0)).where(
+            TenantActivityCounter.tenant_id == tenant_id,
+            TenantActivityCounter.bucket_date >= since,
+        )
+
+    @staticmethod
+    def executive_summary_query(tenant_id: UUID, days: int = 7):
+        """Single-row read for the executive card: summary columns plus recent activity."""
+        recent_activity = ComplianceSummaryService.recent_activity_query(tenant_id, days).scalar_subquery()
+        return select(
+            TenantComplianceSummary.risks_total,
+            TenantComplianceSummary.compliance_score,
+            recent_activity.label("recent_activity"),
+        ).where(TenantComplianceSummary.tenant_id == tenant_id)
+
+    @staticmethod
+    async def compute_executive_summary(db: AsyncSession, tenant_id: UUID, days: int = 7) -> Dict[str, int]:
+        """Read-only fallback for ``executive_summary_query`` while the tenant has no summary row."""
+        values = await ComplianceSummaryService.count(
+            db, tenant_id, requirements=true(), risks=true(), suggestions=true()
+        )
+        return dict(
+            risks_total=values["risks_total"],
+            compliance_score=_score(values),
+            recent_activity=await db.scalar(ComplianceSummaryService.recent_activity_query(tenant_id, days)),
+        )
@@ -1,14 +1,20 @@
 """Dashboard service for aggregating role-specific metrics."""
 
+from types import SimpleNamespace
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func
 from uuid import UUID
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from app.core.pagination import encode_cursor, keyset_after
+from app.core.tenancy import tenant_clause
 from app.schemas.dashboard import DashboardCard, DashboardMetrics
 from app.models.suggestion import AISuggestion, SuggestionStatus
 from app.models.compliance import Risk, Control, BusinessProcess
+from app.services.assessment_schedule_service import AssessmentScheduleService
+from app.services.compliance_summary_service import ComplianceSummaryService
 
 
 class DashboardService:
@@ -50,22 +56,23 @@ class DashboardService:
         # Admin sees: Overview, User Management, Analyze New Document
 
         # Count total active risks
-        risk_count_query = select(func.count(Risk.id)).where(Risk.tenant_id == tenant_id)
+        risk_count_query = select(func.count(Risk.id)).where(tenant_clause(db, Risk.tenant_id, tenant_id))
         risk_count_result = await db.execute(risk_count_query)
         total_risks = risk_count_result.scalar() or 0
 
         # Count total active controls
-        control_count_query = select(func.count(Control.id)).where(Control.tenant_id == tenant_id)
+        control_count_query = select(func.count(Control.id)).where(tenant_clause(db, Control.tenant_id, tenant_id))
         control_count_result = await db.execute(control_count_query)
         total_controls = control_count_result.scalar() or 0
 
         # Count total business processes
-        process_count_query = select(func.count(BusinessProcess.id)).where(BusinessProcess.tenant_id == tenant_id)
+        process_count_query = select(func.count(BusinessProcess.id)).where(tenant_clause(db, BusinessProcess.tenant_id, tenant_id))
         process_count_result = await db.execute(process_count_query)
         total_processes = process_count_result.scalar() or 0
 
         # Count pending suggestions (for triage)
         pending_suggestions_query = select(func.count(AISuggestion.id)).where(
+            AISuggestion.tenant_id == tenant_id,
             AISuggestion.status == SuggestionStatus.pending
         )
         pending_result = await db.execute(pending_suggestions_query)
@@ -106,22 +113,23 @@ class DashboardService:
 
         # Count pending reviews assigned to this BPO
         pending_reviews_query = select(func.count(AISuggestion.id)).where(
-            AISuggestion.status == SuggestionStatus.pending_review,
-            AISuggestion.assigned_bpo_id == user_id
+            AISuggestion.tenant_id == tenant_id,
+            AISuggestion.assigned_bpo_id == user_id,
+            AISuggestion.status == SuggestionStatus.pending_review
         )
         pending_reviews_result = await db.execute(pending_reviews_query)
         pending_reviews = pending_reviews_result.scalar() or 0
 
         # Count controls owned by this BPO
         my_controls_query = select(func.count(Control.id)).where(
-            Control.tenant_id == tenant_id,
+            tenant_clause(db, Control.tenant_id, tenant_id),
             Control.owner_id == user_id
         )
         my_controls_result = await db.execute(my_controls_query)
         my_controls = my_controls_result.scalar() or 0
 
-        # Overdue assessments (placeholder - would require assessment_due_date field)
-        overdue_assessments = 0  # TODO: Implement when assessment scheduling is added
+        # Open scheduled assessments past due (range scan on the owner's due-date index)
+        overdue_assessments = await AssessmentScheduleService.count_overdue(db, tenant_id, user_id)
 
         return [
             DashboardCard(
@@ -156,20 +164,17 @@ class DashboardService:
     async def _get_executive_cards(db: AsyncSession, tenant_id: UUID) -> List[DashboardCard]:
         """Generate executive-specific dashboard cards."""
         # Executive sees: Risk Overview, Compliance Status, Recent Activity
+        # All three come from the maintained summary row plus daily activity counters
+        summary_query = ComplianceSummaryService.executive_summary_query(tenant_id)
+        summary = (await db.execute(summary_query)).one_or_none()
+        if summary is None:
+            # Tenant not summarised yet: count read-only; the next write or the hourly
+            # refresh creates the row
+            summary = SimpleNamespace(**await ComplianceSummaryService.compute_executive_summary(db, tenant_id))
 
-        # Count high-priority risks (assuming category field can indicate priority)
-        # For MVP, counting all risks as proxy
-        total_risks_query = select(func.count(Risk.id)).where(Risk.tenant_id == tenant_id)
-        total_risks_result = await db.execute(total_risks_query)
-        total_risks = total_risks_result.scalar() or 0
-
-        # Compliance status (placeholder - would require compliance scoring logic)
-        compliance_score = 85  # TODO: Implement actual compliance calculation
-
-        # Recent activity (placeholder - count of recent suggestions)
-        recent_activity_query = select(func.count(AISuggestion.id))
-        recent_activity_result = await db.execute(recent_activity_query)
-        recent_activity = recent_activity_result.scalar() or 0
+        total_risks = summary.risks_total
+        compliance_score = summary.compliance_score or 0
+        recent_activity = summary.recent_activity or 0
 
         return [
             DashboardCard(
@@ -203,11 +208,11 @@ class DashboardService:
         """Generate general user dashboard cards (read-only informational)."""
         # General user sees: Total Risks, Total Controls (read-only)
 
-        total_risks_query = select(func.count(Risk.id)).where(Risk.tenant_id == tenant_id)
+        total_risks_query = select(func.count(Risk.id)).where(tenant_clause(db, Risk.tenant_id, tenant_id))
         total_risks_result = await db.execute(total_risks_query)
         total_risks = total_risks_result.scalar() or 0
 
-        total_controls_query = select(func.count(Control.id)).where(Control.tenant_id == tenant_id)
+        total_controls_query = select(func.count(Control.id)).where(tenant_clause(db, Control.tenant_id, tenant_id))
         total_controls_result = await db.execute(total_controls_query)
         total_controls = total_controls_result.scalar() or 0
 
@@ -229,3 +234,82 @@ class DashboardService:
                 action_link="/dashboard/controls"
             )
         ]
+
+    @staticmethod
+    async def get_overview_page(
+        db: AsyncSession,
+        tenant_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of the process -> controls/risks hierarchy, newest process first.
+
+        Only the columns the overview shows are selected (no ORM instances), in three
+        queries per page: processes, then their controls and risks by process id.
+
+        Returns:
+            (processes, next_cursor) - processes as plain dicts ready for
+            OverviewProcess; next_cursor is None on the last page
+        """
+        query = (
+            select(
+                BusinessProcess.id,
+                BusinessProcess.name,
+                BusinessProcess.description,
+                BusinessProcess.created_at,
+            )
+            .where(tenant_clause(db, BusinessProcess.tenant_id, tenant_id))
+            .order_by(BusinessProcess.created_at.desc(), BusinessProcess.id.desc())
+        )
+        if cursor:
+            query = query.where(keyset_after(BusinessProcess.created_at, BusinessProcess.id, cursor))
+        if limit:
+            query = query.limit(limit + 1)
+        rows = (await db.execute(query)).all()
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        processes = {
+            row.id: {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "controls": [],
+                "risks": [],
+            }
+            for row in rows
+        }
+        if processes:
+            controls = await db.execute(
+                select(Control.process_id, Control.id, Control.name, Control.description, Control.type)
+                .where(tenant_clause(db, Control.tenant_id, tenant_id), Control.process_id.in_(list(processes)))
+            )
+            for row in controls:
+                processes[row.process_id]["controls"].append(row)
+            risks = await db.execute(
+                select(Risk.process_id, Risk.id, Risk.name, Risk.description, Risk.category)
+                .where(tenant_clause(db, Risk.tenant_id, tenant_id), Risk.process_id.in_(list(processes)))
+            )
+            for row in risks:
+                processes[row.process_id]["risks"].append(row)
+
+        return list(processes.values()), next_cursor
+
+    @staticmethod
+    async def iter_overview(
+        db: AsyncSession, tenant_id: UUID, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every overview process, fetching ``batch_size`` processes at a time."""
+        cursor = None
+        while True:
+            processes, cursor = await DashboardService.get_overview_page(
+                db, tenant_id, limit=batch_size, cursor=cursor
+            )
+            for process in processes:
+                yield process
+            if cursor is None:
+                return
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import UUID
 import uuid
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import re
 import os
@@ -125,7 +125,7 @@ class DocumentService:
 
     @staticmethod
     async def create_document(
-        db: AsyncSession, filename: str, storage_path: str, user_id: UUID
+        db: AsyncSession, filename: str, storage_path: str, user_id: UUID, tenant_id: UUID
     ) -> Document:
         """Create document record in database."""
         doc_create = DocumentCreate(
@@ -141,6 +141,7 @@ class DocumentService:
             storage_path=doc_create.storage_path,
             status=doc_create.status,
             uploaded_by=str(doc_create.uploaded_by),
+            tenant_id=tenant_id,
         )
 
         db.add(document)
@@ -150,39 +151,58 @@ class DocumentService:
 
     @staticmethod
     async def get_documents_by_user(
-        db: AsyncSession, user_id: UUID, tenant_id: UUID
+        db: AsyncSession,
+        user_id: UUID,
+        tenant_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Document]:
-        """Get all non-archived documents uploaded by users in the same tenant."""
-        # Join with User table to filter by tenant_id
-        # Assuming Document has relationship to User (uploaded_by)
-        # And User has tenant_id
-        from app.models.user import User
+        """Get non-archived documents uploaded by users in the same tenant, newest first.
+
+        Classification relationships (framework, requirement and the requirement's
+        parent framework) are eager-loaded, so the number of queries does not grow
+        with the number of documents. ``limit``/``cursor`` give keyset pagination.
+        """
+        from app.models.compliance import RegulatoryRequirement
+        from app.core.pagination import keyset_after
         from sqlalchemy.orm import selectinload
 
-        result = await db.execute(
+        query = (
             select(Document)
-            .join(User, Document.uploaded_by == User.id)
-            .filter(User.tenant_id == tenant_id)
+            .filter(Document.tenant_id == tenant_id)
             .filter(Document.archived_at.is_(None))
             .options(
                 selectinload(Document.regulatory_framework),
-                selectinload(Document.regulatory_requirement)
+                selectinload(Document.regulatory_requirement).selectinload(RegulatoryRequirement.framework),
             )
-            .order_by(Document.created_at.desc())
+            .order_by(Document.created_at.desc(), Document.id.desc())
         )
+        if cursor:
+            query = query.filter(keyset_after(Document.created_at, Document.id, cursor))
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await db.execute(query)
         return result.scalars().all()
 
     @staticmethod
     async def get_document_by_id(
         db: AsyncSession, document_id: UUID, user_id: UUID, tenant_id: UUID = None, force_refresh: bool = False
     ) -> Document:
-        """Get a specific document by ID, eagerly loading classification relationships."""
-        from app.models.user import User
+        """Get a specific document by ID, eagerly loading classification relationships.
+
+        Access is checked in the same query: by tenant when ``tenant_id`` is given,
+        otherwise by uploader. A document outside the caller's scope is a 404.
+        """
         from app.models.compliance import RegulatoryRequirement
         from sqlalchemy.orm import selectinload
 
         stmt = select(Document).filter(Document.id == document_id)
-        
+        if tenant_id is not None:
+            stmt = stmt.filter(Document.tenant_id == tenant_id)
+        else:
+            stmt = stmt.filter(Document.uploaded_by == user_id)
+
         if force_refresh:
             stmt = stmt.execution_options(populate_existing=True)
 
@@ -199,25 +219,6 @@ class DocumentService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
             )
 
-        # If tenant_id provided, verify user has access via tenant
-        if tenant_id is not None:
-            # Get document uploader's tenant
-            uploader_result = await db.execute(
-                select(User).filter(User.id == document.uploaded_by)
-            )
-            uploader = uploader_result.scalars().first()
-
-            if not uploader or uploader.tenant_id != tenant_id:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
-                )
-        else:
-            # Verify user has access to this document
-            if document.uploaded_by != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
-                )
-
         return document
 
     @staticmethod
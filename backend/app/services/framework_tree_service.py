@@ -0,0 +1,49 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core import cache
+from app.core.cache import CachedBody
+from app.models.compliance import RegulatoryFramework
+from app.schemas.compliance import RegulatoryFrameworkTreeItem
+
+FRAMEWORK_TREE_CACHE = "framework_tree"
+
+_tree_adapter = TypeAdapter(List[RegulatoryFrameworkTreeItem])
+
+
+class FrameworkTreeService:
+    """Serves the tenant's framework/requirement hierarchy from a versioned cache."""
+
+    @staticmethod
+    async def get_tree(db: AsyncSession, tenant_id: UUID) -> CachedBody:
+        """Return the serialised tree, building and caching it only on a version miss."""
+        version, entry = await cache.get_cached(FRAMEWORK_TREE_CACHE, tenant_id)
+        if entry is not None:
+            return entry
+
+        stmt = (
+            select(RegulatoryFramework)
+            .filter(RegulatoryFramework.tenant_id == tenant_id)
+            .options(selectinload(RegulatoryFramework.requirements))
+            .order_by(RegulatoryFramework.name)
+            # The body outlives this session: never serialise stale identity-map state
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        frameworks = result.scalars().all()
+        body = _tree_adapter.dump_json(
+            _tree_adapter.validate_python(frameworks, from_attributes=True)
+        )
+        # Stored under the version read before the query: a write committed in the
+        # meantime has already bumped it, so this body is never served as current.
+        return await cache.store_cached(FRAMEWORK_TREE_CACHE, tenant_id, version, body)
+
+    @staticmethod
+    async def invalidate(tenant_id: UUID) -> None:
+        """Call after committing any framework or requirement write for the tenant."""
+        await cache.invalidate(FRAMEWORK_TREE_CACHE, tenant_id)
@@ -1,12 +1,20 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
+from sqlalchemy import or_
 from app.crud.mapping import MappingCRUD
+from app.models.compliance import RegulatoryRequirement
 from app.services.audit_service import AuditService
+from app.services.compliance_summary_service import ComplianceSummaryService
 from app.schemas.mapping import MappingDetail, MappingListResponse
 from typing import List
 from fastapi import HTTPException, status
 
 
+def _covered_requirements(requirement_id: UUID):
+    """Requirements a mapping to ``requirement_id`` covers: the requirement, or all of a framework's."""
+    return or_(RegulatoryRequirement.id == requirement_id, RegulatoryRequirement.framework_id == requirement_id)
+
+
 class MappingService:
     @staticmethod
     async def create_mapping(
@@ -47,7 +55,10 @@ class MappingService:
                 detail="Mapping already exists"
             )
 
-        # Create mapping
+        covered = _covered_requirements(requirement_id)
+        before = await ComplianceSummaryService.count(db, tenant_id, requirements=covered)
+
+        # Create mapping (names are resolved by the INSERT ... RETURNING itself)
         mapping = await MappingCRUD.create_mapping(
             db, control_id, requirement_id, tenant_id, user_id
         )
@@ -64,19 +75,9 @@ class MappingService:
                 "regulatory_requirement_id": str(requirement_id),
             },
         )
+        await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=covered)
 
-        # Fetch full details for response
-        mappings = await MappingCRUD.get_mappings_for_control(db, control_id, tenant_id)
-        # Find the newly created mapping in the results
-        for m in mappings:
-            if m.id == mapping.id:
-                return m
-
-        # Fallback (shouldn't happen, but for safety)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Mapping created but could not retrieve details"
-        )
+        return mapping
 
     @staticmethod
     async def delete_mapping(
@@ -95,35 +96,33 @@ class MappingService:
         Raises:
             HTTPException 404: If mapping doesn't exist
         """
-        # Get existing mapping for audit log
-        existing = await MappingCRUD.get_mapping(
-            db, control_id, requirement_id, tenant_id
-        )
+        covered = _covered_requirements(requirement_id)
+        before = await ComplianceSummaryService.count(db, tenant_id, requirements=covered)
 
-        # Delete mapping
-        deleted = await MappingCRUD.delete_mapping(
+        # Delete mapping; the deleted row's ID comes back from DELETE ... RETURNING
+        deleted_id = await MappingCRUD.delete_mapping(
             db, control_id, requirement_id, tenant_id
         )
 
-        if not deleted:
+        if deleted_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Mapping not found"
             )
 
         # Log deletion to audit trail
-        if existing:
-            await AuditService.log_action(
-                db=db,
-                actor_id=user_id,
-                action="delete_mapping",
-                entity_type="controls_regulatory_requirements",
-                entity_id=existing.id,
-                changes={
-                    "control_id": str(control_id),
-                    "regulatory_requirement_id": str(requirement_id),
-                },
-            )
+        await AuditService.log_action(
+            db=db,
+            actor_id=user_id,
+            action="delete_mapping",
+            entity_type="controls_regulatory_requirements",
+            entity_id=deleted_id,
+            changes={
+                "control_id": str(control_id),
+                "regulatory_requirement_id": str(requirement_id),
+            },
+        )
+        await ComplianceSummaryService.record_change(db, tenant_id, before, requirements=covered)
 
         return True
 
@@ -0,0 +1,138 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Protocol
+from uuid import UUID
+
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.notification import NotificationOutbox
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+BPO_ASSIGNMENT = "bpo_assignment"
+
+
+class Mailer(Protocol):
+    async def send(self, to: str, subject: str, body: str) -> None: ...
+
+
+def _render_digest(rows: List[NotificationOutbox]) -> tuple[str, str]:
+    """Subject and plain-text body for one recipient's pending notifications."""
+    links = [
+        f"- {settings.FRONTEND_URL}/assessments/{row.payload['suggestion_id']}"
+        for row in rows
+        if row.kind == BPO_ASSIGNMENT
+    ]
+    count = len(links)
+    subject = f"{count} suggestion{'s' if count != 1 else ''} awaiting your review"
+    body = "The following suggestions have been assigned to you for review:\n\n" + "\n".join(links)
+    return subject, body
+
+
+class NotificationService:
+    """Transactional outbox for user notifications.
+
+    Producers ``enqueue`` inside their own transaction, so a notification exists exactly
+    when the change it announces was committed; ``drain`` delivers them out of band.
+    """
+
+    @staticmethod
+    async def enqueue_bpo_assignments(
+        db: AsyncSession, tenant_id: UUID, assignments: Dict[UUID, List[UUID]]
+    ) -> None:
+        """Queue one notification per suggestion newly assigned to each BPO (one INSERT)."""
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "recipient_id": bpo_id,
+                "kind": BPO_ASSIGNMENT,
+                "payload": {"suggestion_id": str(suggestion_id)},
+            }
+            for bpo_id, suggestion_ids in assignments.items()
+            for suggestion_id in suggestion_ids
+        ]
+        if rows:
+            await db.execute(insert(NotificationOutbox), rows)
+
+    @staticmethod
+    def _pending():
+        return (
+            NotificationOutbox.sent_at.is_(None),
+            NotificationOutbox.attempts < settings.NOTIFICATION_MAX_ATTEMPTS,
+        )
+
+    @staticmethod
+    async def has_pending(db: AsyncSession) -> bool:
+        """Whether ``drain`` has anything to deliver; checked before connecting to the mail server."""
+        return bool(await db.scalar(select(exists().where(*NotificationService._pending()))))
+
+    @staticmethod
+    async def drain(db: AsyncSession, mailer: Mailer, batch_size: Optional[int] = None) -> int:
+        """
+        Deliver pending notifications as one digest per recipient, a committed batch at a time.
+
+        Rows are claimed with SKIP LOCKED so concurrent workers split the outbox. A failed
+        digest leaves its rows pending with ``attempts`` incremented until
+        NOTIFICATION_MAX_ATTEMPTS is reached.
+
+        Returns:
+            Number of notifications delivered
+        """
+        batch_size = batch_size or settings.NOTIFICATION_DRAIN_BATCH_SIZE
+        delivered = 0
+        while True:
+            batch = (
+                await db.execute(
+                    select(NotificationOutbox)
+                    .where(*NotificationService._pending())
+                    .order_by(NotificationOutbox.created_at)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).scalars().all()
+            if not batch:
+                return delivered
+
+            emails = dict(
+                (
+                    await db.execute(
+                        select(User.id, User.email).where(User.id.in_({row.recipient_id for row in batch}))
+                    )
+                ).all()
+            )
+            by_recipient: Dict[str, List[NotificationOutbox]] = defaultdict(list)
+            for row in batch:
+                by_recipient[emails[row.recipient_id]].append(row)
+
+            sent_ids, failed = [], []
+            for email, rows in by_recipient.items():
+                subject, body = _render_digest(rows)
+                try:
+                    await mailer.send(email, subject, body)
+                    sent_ids.extend(row.id for row in rows)
+                except Exception as e:
+                    logger.warning(f"Notification digest to {email} failed: {e}")
+                    failed.append(([row.id for row in rows], str(e)))
+
+            if sent_ids:
+                await db.execute(
+                    update(NotificationOutbox)
+                    .where(NotificationOutbox.id.in_(sent_ids))
+                    .values(sent_at=datetime.utcnow())
+                )
+            for row_ids, error in failed:
+                await db.execute(
+                    update(NotificationOutbox)
+                    .where(NotificationOutbox.id.in_(row_ids))
+                    .values(attempts=NotificationOutbox.attempts + 1, last_error=error)
+                )
+            await db.commit()
+            delivered += len(sent_ids)
+
+            # Stop on a short batch, or when nothing went through (mail server down)
+            if len(batch) < batch_size or not sent_ids:
+                return delivered
@@ -0,0 +1,139 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import exists, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document, DocumentStatus
+from app.models.suggestion import AISuggestion, SuggestionStatus
+from app.schemas.suggestion import (
+    SuggestionTriageItem,
+    SuggestionTriageItemResult,
+    SuggestionTriageResponse,
+)
+from app.services.audit_service import AuditWriter
+from app.services.compliance_summary_service import ComplianceSummaryService
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+# The analysis commits suggestions as they stream in and a retried attempt replaces
+# them, so they are only triaged once their document is out of these states
+ANALYSING_STATUSES = (DocumentStatus.pending, DocumentStatus.processing)
+
+
+class SuggestionService:
+    """Compliance-officer triage of AI suggestions."""
+
+    @staticmethod
+    def analysis_finished():
+        """Where-clause for suggestions whose document is no longer being analysed."""
+        return ~exists().where(
+            Document.id == AISuggestion.document_id,
+            Document.status.in_(ANALYSING_STATUSES),
+        )
+
+    @staticmethod
+    async def triage(
+        db: AsyncSession, items: List[SuggestionTriageItem], actor_id: UUID, tenant_id: UUID
+    ) -> SuggestionTriageResponse:
+        """
+        Apply many pending -> pending_review/rejected transitions in one transaction.
+
+        Items sharing a target status and BPO become one UPDATE guarded on
+        ``status = pending``; the ids it returns are the suggestions actually moved,
+        anything else was missing, in another tenant, already triaged or still being
+        analysed. Audit rows are buffered by AuditWriter and inserted in one statement
+        at commit, and BPO notifications are queued in the outbox, to be delivered as
+        one digest per BPO.
+        """
+        groups: Dict[Tuple[SuggestionStatus, Optional[UUID]], List[UUID]] = defaultdict(list)
+        seen = set()
+        for item in items:
+            # Only the first action per suggestion is applied
+            if item.suggestion_id in seen:
+                continue
+            seen.add(item.suggestion_id)
+            groups[(item.status, item.bpo_id)].append(item.suggestion_id)
+
+        scope = AISuggestion.id.in_(list(seen))
+        before = await ComplianceSummaryService.count(db, tenant_id, suggestions=scope)
+        moved: Dict[UUID, Tuple[SuggestionStatus, Optional[UUID]]] = {}
+        for (new_status, bpo_id), suggestion_ids in groups.items():
+            values = {"status": new_status}
+            if bpo_id:
+                values["assigned_bpo_id"] = bpo_id
+            result = await db.execute(
+                update(AISuggestion)
+                .where(
+                    AISuggestion.id.in_(suggestion_ids),
+                    AISuggestion.tenant_id == tenant_id,
+                    AISuggestion.status == SuggestionStatus.pending,
+                    SuggestionService.analysis_finished(),
+                )
+                .values(**values)
+                .returning(AISuggestion.id)
+            )
+            for suggestion_id in result.scalars().all():
+                moved[suggestion_id] = (new_status, bpo_id)
+
+        if moved:
+            for suggestion_id, (new_status, bpo_id) in moved.items():
+                changes = {"status": {"old": SuggestionStatus.pending.value, "new": new_status.value}}
+                if bpo_id:
+                    changes["assigned_bpo_id"] = str(bpo_id)
+                AuditWriter.record(
+                    db,
+                    actor_id=actor_id,
+                    action=f"SUGGESTION_{new_status.name.upper()}",
+                    entity_type="AISuggestion",
+                    entity_id=suggestion_id,
+                    changes=changes,
+                )
+            await SuggestionService._notify_assignees(db, tenant_id, moved)
+            await ComplianceSummaryService.record_change(
+                db, tenant_id, before, events=len(moved), suggestions=scope
+            )
+        await db.commit()
+
+        results = []
+        reported = set()
+        for item in items:
+            if item.suggestion_id in reported:
+                message = "Suggestion appears more than once in this request"
+            elif item.suggestion_id in moved:
+                message = None
+            else:
+                message = "Suggestion not found or not pending"
+            reported.add(item.suggestion_id)
+            results.append(
+                SuggestionTriageItemResult(
+                    suggestion_id=item.suggestion_id,
+                    success=message is None,
+                    status=item.status if message is None else None,
+                    message=message or "Suggestion triaged",
+                )
+            )
+        return SuggestionTriageResponse(
+            results=results, updated=len(moved), skipped=len(results) - len(moved)
+        )
+
+    @staticmethod
+    async def _notify_assignees(
+        db: AsyncSession, tenant_id: UUID, moved: Dict[UUID, Tuple[SuggestionStatus, Optional[UUID]]]
+    ) -> None:
+        """Queue BPO notifications in the triage transaction; the worker sends one digest per BPO."""
+        by_bpo: Dict[UUID, List[UUID]] = defaultdict(list)
+        unassigned = 0
+        for suggestion_id, (new_status, bpo_id) in moved.items():
+            if new_status != SuggestionStatus.pending_review:
+                continue
+            if bpo_id:
+                by_bpo[bpo_id].append(suggestion_id)
+            else:
+                unassigned += 1
+        await NotificationService.enqueue_bpo_assignments(db, tenant_id, by_bpo)
+        if unassigned:
+            logger.warning("%d suggestions accepted without BPO assignment", unassigned)
@@ -1,4 +1,7 @@
 from app.core.celery_app import celery_app
 
 # Import tasks here to ensure they are registered when Celery starts
-from tasks.analysis import process_document
+from tasks.analysis import process_document, reap_expired_analyses
+from tasks.audit import maintain_audit_logs
+from tasks.compliance import materialize_assessments, refresh_compliance_summaries
+from tasks.notifications import deliver_notifications
@@ -0,0 +1,101 @@
+"""
+Benchmark GUID row hydration on SQLite: former CHAR(32) hex storage vs 16-byte BLOB.
+
+Loads a table of ``--rows`` rows with three GUID columns (id plus two foreign-key
+style columns) through SQLAlchemy and reports rows/second for both encodings, along
+with the bind cost of filtering on GUIDs. Run from backend/:
+
+    python -m scripts.benchmark_guid --rows 100000
+"""
+import argparse
+import time
+import uuid
+
+from sqlalchemy import CHAR, Column, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.types import TypeDecorator
+
+from app.models.guid import GUID
+
+
+class HexGUID(TypeDecorator):
+    """GUID as it was stored before migration f7b9d1e3a568."""
+
+    impl = CHAR
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(CHAR(32))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        if not isinstance(value, uuid.UUID):
+            return "%.32x" % uuid.UUID(value).int
+        return "%.32x" % value.int
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        return value
+
+
+def build_table(guid_type) -> Table:
+    return Table(
+        "items",
+        MetaData(),
+        Column("id", guid_type, primary_key=True),
+        Column("tenant_id", guid_type, nullable=False),
+        Column("owner_id", guid_type, nullable=False),
+        Column("name", String(50)),
+    )
+
+
+def bench(label: str, guid_type, rows: list, repeat: int) -> float:
+    engine = create_engine("sqlite://")
+    table = build_table(guid_type)
+    table.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(table), rows)
+
+    ids = [row["id"] for row in rows[:: max(1, len(rows) // 500)]]
+    with engine.connect() as conn:
+        conn.execute(select(table)).all()  # warm-up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            loaded = conn.execute(select(table)).all()
+        load = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            matched = conn.execute(select(table.c.id).where(table.c.id.in_(ids))).all()
+        lookup = (time.perf_counter() - start) / repeat
+
+    assert len(loaded) == len(rows) and len(matched) == len(ids)
+    print(
+        f"  {label:<14} {load * 1000:8.1f} ms/query  {len(rows) / load:12,.0f} rows/s  "
+        f"IN ({len(ids)} ids) {lookup * 1000:6.2f} ms"
+    )
+    return load
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tenants = [uuid.uuid4() for _ in range(10)]
+    rows = [
+        {"id": uuid.uuid4(), "tenant_id": tenants[i % 10], "owner_id": uuid.uuid4(), "name": f"Item {i}"}
+        for i in range(args.rows)
+    ]
+    print(f"Hydrating {args.rows:,} rows x 3 GUID columns from SQLite")
+    hex_time = bench("CHAR(32) hex", HexGUID, rows, args.repeat)
+    blob_time = bench("BLOB(16)", GUID, rows, args.repeat)
+    print(f"  speed-up: {hex_time / blob_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
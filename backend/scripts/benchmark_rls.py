@@ -0,0 +1,112 @@
+"""
+Compare query plans and latency of tenant filtering on RLS-protected tables.
+
+Each dashboard query runs twice inside a transaction scoped like a request
+(``SET LOCAL ROLE`` to a role subject to RLS, then app.tenant_id set as in
+app/core/tenancy.py):
+
+  predicate + RLS   the query keeps its ``tenant_id = :tenant`` filter (default)
+  RLS only          the filter is dropped and the policy alone restricts rows
+                    (TENANT_FILTER_VIA_RLS=true)
+
+Needs a Postgres DATABASE_URL with migration e6a8c0d2f457 applied. Run from backend/:
+
+    python -m scripts.benchmark_rls --role authenticated --repeat 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import async_db_connection_url
+
+QUERIES = {
+    "count risks": "SELECT count(id) FROM risks {where}",
+    "count controls": "SELECT count(id) FROM controls {where}",
+    "overview page": (
+        "SELECT id, name, description, created_at FROM business_processes {where} "
+        "ORDER BY created_at DESC, id DESC LIMIT 50"
+    ),
+    "overview controls": (
+        "SELECT c.process_id, c.id, c.name FROM controls c "
+        "WHERE c.process_id IN (SELECT id FROM business_processes ORDER BY created_at DESC LIMIT 50) {and_}"
+    ),
+}
+
+
+def render(sql: str, with_predicate: bool) -> str:
+    return sql.format(
+        where="WHERE tenant_id = :tenant_id" if with_predicate else "",
+        and_="AND c.tenant_id = :tenant_id" if with_predicate else "",
+    )
+
+
+async def scoped(conn, role: str, tenant_id: str) -> None:
+    await conn.execute(text(f'SET LOCAL ROLE "{role}"'))
+    await conn.execute(text("SELECT set_config('app.tenant_id', :tenant_id, true)"), {"tenant_id": tenant_id})
+
+
+async def run_variant(engine, sql: str, role: str, tenant_id: str, repeat: int, show_plan: bool):
+    async with engine.connect() as conn:
+        async with conn.begin():
+            await scoped(conn, role, tenant_id)
+            if show_plan:
+                plan = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), {"tenant_id": tenant_id})
+                print("\n".join(f"      {line}" for line in plan.scalars()))
+            rows = len((await conn.execute(text(sql), {"tenant_id": tenant_id})).all())  # warm-up
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await conn.execute(text(sql), {"tenant_id": tenant_id})
+                timings.append(time.perf_counter() - start)
+    return rows, timings
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenant", help="tenant id; defaults to the tenant with the most business processes")
+    parser.add_argument("--role", default="authenticated", help="database role subject to RLS")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--plans", action="store_true", help="print EXPLAIN ANALYZE for each variant")
+    args = parser.parse_args()
+
+    engine = create_async_engine(async_db_connection_url)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("benchmark_rls needs a Postgres DATABASE_URL")
+
+    tenant_id = args.tenant
+    if not tenant_id:
+        async with engine.connect() as conn:
+            tenant_id = str(
+                (
+                    await conn.execute(
+                        text("SELECT tenant_id FROM business_processes GROUP BY tenant_id ORDER BY count(*) DESC LIMIT 1")
+                    )
+                ).scalar()
+            )
+    print(f"Tenant {tenant_id}, role {args.role}, {args.repeat} runs per variant")
+
+    for label, sql in QUERIES.items():
+        print(f"\n  {label}")
+        medians = {}
+        for variant, with_predicate in (("predicate + RLS", True), ("RLS only", False)):
+            rows, timings = await run_variant(
+                engine, render(sql, with_predicate), args.role, tenant_id, args.repeat, args.plans
+            )
+            medians[variant] = statistics.median(timings)
+            p95 = sorted(timings)[int(len(timings) * 0.95) - 1]
+            print(
+                f"    {variant:<16} {rows:6d} rows  median {medians[variant] * 1000:7.2f} ms  "
+                f"p95 {p95 * 1000:7.2f} ms"
+            )
+        if medians["predicate + RLS"] and medians["RLS only"]:
+            print(f"    RLS only / predicate: {medians['RLS only'] / medians['predicate + RLS']:.2f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
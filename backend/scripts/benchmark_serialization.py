@@ -0,0 +1,94 @@
+"""
+Benchmark response serialisation for the dashboard overview payload.
+
+Compares FastAPI's default path (per-row pydantic models, jsonable_encoder, json
+module) with app.core.responses.ResponseSerializer. Run from backend/:
+
+    python -m scripts.benchmark_serialization --processes 500 --children 20
+"""
+import argparse
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from app.core.responses import ResponseSerializer, orjson
+from app.schemas.dashboard import OverviewControl, OverviewProcess, OverviewResponse, OverviewRisk
+
+
+def build_rows(processes: int, children: int):
+    """ORM-shaped rows: attribute access only, like loaded SQLAlchemy instances."""
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            name=f"Process {p}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            controls=[
+                SimpleNamespace(id=uuid4(), name=f"Control {c}", description="Control text", type="preventive")
+                for c in range(children)
+            ],
+            risks=[
+                SimpleNamespace(id=uuid4(), name=f"Risk {r}", description="Risk text", category="operational")
+                for r in range(children)
+            ],
+        )
+        for p in range(processes)
+    ]
+
+
+def default_path(rows) -> bytes:
+    response = OverviewResponse(
+        processes=[
+            OverviewProcess(
+                id=p.id,
+                name=p.name,
+                description=p.description,
+                controls=[OverviewControl(id=c.id, name=c.name, description=c.description, type=c.type) for c in p.controls],
+                risks=[OverviewRisk(id=r.id, name=r.name, description=r.description, category=r.category) for r in p.risks],
+            )
+            for p in rows
+        ]
+    )
+    # FastAPI re-validates against response_model before encoding
+    validated = OverviewResponse.model_validate(response.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+_serializer = ResponseSerializer(OverviewResponse)
+
+
+def fast_path(rows) -> bytes:
+    return _serializer.dump_json({"processes": rows})
+
+
+def bench(label: str, fn, rows, repeat: int) -> float:
+    fn(rows)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        size = len(fn(rows))
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<22} {elapsed * 1000:8.2f} ms/response  {size / 1024:8.1f} KiB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=500)
+    parser.add_argument("--children", type=int, default=20, help="controls and risks per process")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = build_rows(args.processes, args.children)
+    print(
+        f"Overview with {args.processes} processes x {args.children} controls/risks "
+        f"(orjson {'available' if orjson else 'not installed'})"
+    )
+    slow = bench("default (FastAPI)", default_path, rows, args.repeat)
+    fast = bench("ResponseSerializer", fast_path, rows, args.repeat)
+    print(f"  speed-up: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
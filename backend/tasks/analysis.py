@@ -1,27 +1,298 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 import asyncio
 import logging
+import os
+import socket
+import time
 import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, delete, func, or_, update
 from sqlalchemy.future import select
 
+from app.config import settings
 from app.core.celery_app import celery_app
 
 # Internal imports need to be careful with Celery context
 from app.database import async_session_maker
 from app.models.document import Document, DocumentStatus
+from app.models.analysis_job import AnalysisJob, AnalysisJobStatus
 from app.models.suggestion import AISuggestion, SuggestionStatus
 from app.models.compliance import RegulatoryFramework, RegulatoryRequirement
 from app.services.document_service import DocumentService
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, DocumentClassification, Suggestion, TokenUsage, split_sections
+from app.services.compliance_summary_service import ComplianceSummaryService
+from app.services.framework_tree_service import FrameworkTreeService
 from app.core.supabase import supabase_client, get_supabase_client # Ensure we have access
+from app.core.progress import publish_progress
+from app.core.metrics import ANALYSIS_JOBS, ANALYSIS_STAGE_DURATION
+from app.schemas.progress import DocumentProgressEvent
 
 logger = logging.getLogger(__name__)
 
-async def _process_document_async(document_id: uuid.UUID):
+
+async def _update_compliance_summary(
+    db: AsyncSession, tenant_id, document_id: uuid.UUID, before: Optional[dict], suggestions: int
+) -> None:
+    """Count the new suggestions as activity and add the document's backlog change to the summary.
+
+    ``before`` counts the document's suggestions when the run started. Best-effort,
+    after the analysis has committed: the periodic refresh repairs a miss.
+    """
+    if not tenant_id or before is None:
+        return
+    try:
+        await ComplianceSummaryService.record_change(
+            db, tenant_id, before, events=suggestions, suggestions=AISuggestion.document_id == document_id
+        )
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to update compliance summary for tenant {tenant_id}: {e}")
+        await db.rollback()
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lease_deadline() -> datetime:
+    return datetime.utcnow() + timedelta(seconds=settings.ANALYSIS_LEASE_SECONDS)
+
+
+def _retry_backoff_seconds(attempts: int) -> int:
+    """Exponential backoff after ``attempts`` failed attempts: base, 2*base, 4*base, ... capped."""
+    delay = settings.ANALYSIS_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0))
+    return min(delay, settings.ANALYSIS_RETRY_BACKOFF_MAX_SECONDS)
+
+
+class LeaseLostError(Exception):
+    """The document's processing lease was reclaimed while this attempt was running."""
+
+
+class LeaseHeartbeat:
+    """Renews a document's processing lease from a background task.
+
+    Renewal uses its own short session so it keeps working while the pipeline
+    awaits the LLM. If the lease is found to belong to someone else (the reaper
+    reclaimed it), ``lost`` is set and the pipeline abandons its results.
+    """
+
+    def __init__(self, document_id: uuid.UUID, owner: uuid.UUID):
+        self.document_id = document_id
+        self.owner = owner
+        self.lost = False
+        self._task: asyncio.Task = None
+
+    async def _renew(self) -> bool:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                update(Document)
+                .where(Document.id == self.document_id, Document.lease_owner == self.owner)
+                .values(lease_expires_at=_lease_deadline())
+            )
+            await session.commit()
+            return result.rowcount != 0
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.ANALYSIS_HEARTBEAT_SECONDS)
+            try:
+                if not await self._renew():
+                    self.lost = True
+                    logger.warning(f"Lease on document {self.document_id} was reclaimed")
+                    return
+            except Exception as e:
+                # Transient failure: the lease stays valid until it expires
+                logger.warning(f"Lease heartbeat for document {self.document_id} failed: {e}")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class ProgressReporter:
+    """Accumulates pipeline counters and publishes them with every stage change.
+
+    When an ``AnalysisJob`` is attached, stage timings are kept on it as well; the
+    row is only written by the pipeline's own commits, so tracking adds no queries.
+    """
+
+    def __init__(self, document_id: uuid.UUID, tenant_id: uuid.UUID = None):
+        self.document_id = document_id
+        self.tenant_id = tenant_id
+        self.pages_extracted = 0
+        self.chunks_analysed = 0
+        self.suggestions_saved = 0
+        # Set once the classification pass is done; sent with every later event
+        self.classification: DocumentClassification = None
+        self.job: AnalysisJob = None
+        self._started = time.perf_counter()
+        self._stage_name = "fetching"
+        self._stage_started = self._started
+        self._durations = {}
+
+    def _close_stage(self, now: float) -> None:
+        if self._stage_name is not None:
+            ANALYSIS_STAGE_DURATION.observe(now - self._stage_started, stage=self._stage_name)
+            elapsed_ms = int((now - self._stage_started) * 1000)
+            self._durations[self._stage_name] = self._durations.get(self._stage_name, 0) + elapsed_ms
+        if self.job is not None:
+            # Assign a fresh dict so the JSON column is flagged as modified
+            self.job.stage_durations = dict(self._durations)
+
+    def finish_job(self, status: AnalysisJobStatus, error: Exception = None) -> None:
+        """Close the running stage and stamp the final outcome onto the job row."""
+        now = time.perf_counter()
+        self._close_stage(now)
+        self._stage_name = None
+        ANALYSIS_JOBS.inc(status=status.value)
+        if self.job is None:
+            return
+        self.job.status = status
+        self.job.finished_at = datetime.utcnow()
+        self.job.duration_ms = int((now - self._started) * 1000)
+        self.job.suggestions_count = self.suggestions_saved
+        if error is not None:
+            self.job.error_class = type(error).__name__
+            self.job.error_message = str(error)[:2000]
+
+    async def stage(self, stage: str, status: DocumentStatus = DocumentStatus.processing, message: str = None):
+        if stage != self._stage_name and status == DocumentStatus.processing:
+            now = time.perf_counter()
+            self._close_stage(now)
+            self._stage_name = stage
+            self._stage_started = now
+            if self.job is not None:
+                self.job.current_stage = stage
+        await publish_progress(
+            DocumentProgressEvent(
+                document_id=self.document_id,
+                tenant_id=self.tenant_id,
+                status=status,
+                stage=stage,
+                pages_extracted=self.pages_extracted,
+                chunks_analysed=self.chunks_analysed,
+                suggestions_saved=self.suggestions_saved,
+                document_type=self.classification.document_type if self.classification else None,
+                framework_name=self.classification.framework_name if self.classification else None,
+                message=message,
+            )
+        )
+
+
+async def _apply_classification(
+    db: AsyncSession, tenant_id, document: Document, classification: Optional[DocumentClassification]
+) -> bool:
+    """Create or update the framework (Law) or requirement (Regulation) the document describes.
+
+    Returns:
+        True if the tenant's framework tree changed
+    """
+    framework_tree_changed = False
+    if classification:
+        framework_tree_changed = classification.document_type in ("Law", "Regulation")
+        logger.info(f"[STEP 4.5/6] Processing classification: {classification.document_type}")
+        cls = classification
+        
+        if cls.document_type == "Law":
+            # Check if framework exists
+            stmt = select(RegulatoryFramework).filter(
+                RegulatoryFramework.tenant_id == tenant_id,
+                RegulatoryFramework.name == cls.framework_name
+            )
+            result = await db.execute(stmt)
+            framework = result.scalars().first()
+            
+            if not framework:
+                framework = RegulatoryFramework(
+                    tenant_id=tenant_id,
+                    name=cls.framework_name,
+                    description=cls.framework_description,
+                    version=cls.version,
+                    document_id=document.id
+                )
+                db.add(framework)
+                logger.info(f"[STEP 4.5/6] Created new Framework: {cls.framework_name}")
+            else:
+                framework.description = cls.framework_description or framework.description
+                framework.version = cls.version or framework.version
+                framework.document_id = document.id
+                logger.info(f"[STEP 4.5/6] Updated Framework: {cls.framework_name}")
+                
+        elif cls.document_type == "Regulation":
+            # 1. Ensure parent framework exists
+            parent_name = cls.parent_law_name or "Unknown Law"
+            stmt = select(RegulatoryFramework).filter(
+                RegulatoryFramework.tenant_id == tenant_id,
+                RegulatoryFramework.name == parent_name
+            )
+            result = await db.execute(stmt)
+            parent_framework = result.scalars().first()
+            
+            if not parent_framework:
+                parent_framework = RegulatoryFramework(
+                    tenant_id=tenant_id,
+                    name=parent_name,
+                    description=f"Auto-created parent for {cls.framework_name}",
+                    version=cls.version
+                )
+                db.add(parent_framework)
+                await db.flush() # Need ID
+                logger.info(f"[STEP 4.5/6] Auto-created parent Framework: {parent_name}")
+            
+            # 2. Check/Create Requirement
+            stmt = select(RegulatoryRequirement).filter(
+                RegulatoryRequirement.tenant_id == tenant_id,
+                RegulatoryRequirement.framework_id == parent_framework.id,
+                RegulatoryRequirement.name == cls.framework_name
+            )
+            result = await db.execute(stmt)
+            requirement = result.scalars().first()
+            
+            if not requirement:
+                requirement = RegulatoryRequirement(
+                    tenant_id=tenant_id,
+                    framework_id=parent_framework.id,
+                    name=cls.framework_name,
+                    description=cls.framework_description,
+                    document_id=document.id
+                )
+                db.add(requirement)
+                logger.info(f"[STEP 4.5/6] Created new Requirement: {cls.framework_name}")
+            else:
+                requirement.description = cls.framework_description or requirement.description
+                requirement.document_id = document.id
+                logger.info(f"[STEP 4.5/6] Updated Requirement: {cls.framework_name}")
+    else:
+         logger.warning("[STEP 4.5/6] No classification returned from AI")
+
+    return framework_tree_changed
+
+
+async def _process_document_async(
+    document_id: uuid.UUID, celery_task_id: str = None, worker_id: str = None, reprocess: bool = False
+):
     """
     Async worker function to handle the logic.
     Celery tasks are synchronous by default, so we bridge here.
+
+    Only pending documents (whose retry is due) and processing documents whose
+    lease expired are claimed, so a redelivered message does not redo finished
+    work. ``reprocess`` also claims completed and failed documents (manual runs).
     """
+    progress = ProgressReporter(document_id)
+    started_at = datetime.utcnow()
+    job_id = uuid.uuid4()
+    heartbeat = None
+    summary_before = None
     async with async_session_maker() as db:
         try:
             logger.info(f"[STEP 1/6] Fetching document {document_id}")
@@ -33,17 +304,78 @@ async def _process_document_async(document_id: uuid.UUID):
 
             logger.info(f"[STEP 1/6] ✓ Document found: {document.filename}")
 
-            # Fetch uploader to get tenant_id for suggestions
-            from app.models.user import User
-            uploader = await db.get(User, document.uploaded_by)
-            tenant_id = uploader.tenant_id if uploader else None
-            if not tenant_id:
-                logger.warning(f"Document {document_id} uploader has no tenant_id")
+            tenant_id = document.tenant_id
+            progress.tenant_id = tenant_id
+
+            # Claim the processing lease. Fails if another attempt holds a live lease
+            # (e.g. a redelivered message racing the original worker), if the retry is
+            # scheduled for later, or if an earlier attempt already finished the document.
+            now = datetime.utcnow()
+            claimable = [
+                and_(
+                    Document.status == DocumentStatus.pending,
+                    or_(Document.next_attempt_at.is_(None), Document.next_attempt_at <= now),
+                ),
+                and_(
+                    Document.status == DocumentStatus.processing,
+                    or_(Document.lease_expires_at.is_(None), Document.lease_expires_at < now),
+                ),
+            ]
+            if reprocess:
+                claimable.append(Document.status.in_([DocumentStatus.completed, DocumentStatus.failed]))
+            claim = await db.execute(
+                update(Document)
+                .where(Document.id == document_id, or_(*claimable))
+                .values(
+                    lease_owner=job_id,
+                    lease_expires_at=_lease_deadline(),
+                    next_attempt_at=None,
+                )
+            )
+            if claim.rowcount == 0:
+                logger.info(f"Document {document_id} is already being processed or done, skipping")
+                return
+
+            # Record this attempt; the row is written together with the status change
+            previous_attempts = await db.scalar(
+                select(func.count()).select_from(AnalysisJob).where(AnalysisJob.document_id == document_id)
+            )
+            job = AnalysisJob(
+                id=job_id,
+                document_id=document_id,
+                tenant_id=tenant_id,
+                status=AnalysisJobStatus.running,
+                attempt=int(previous_attempts or 0) + 1,
+                celery_task_id=celery_task_id,
+                worker_id=worker_id or _default_worker_id(),
+                current_stage="fetching",
+                started_at=started_at,
+            )
+            db.add(job)
+            progress.job = job
+            if tenant_id:
+                summary_before = await ComplianceSummaryService.count(
+                    db, tenant_id, suggestions=AISuggestion.document_id == document_id
+                )
+            if previous_attempts:
+                # Suggestions are committed as they stream in, so an earlier attempt may
+                # have left some behind; this attempt generates them again. They are hidden
+                # from triage while the document is pending or processing (see
+                # SuggestionService.analysis_finished), so none of them was acted on.
+                await db.execute(
+                    delete(AISuggestion).where(
+                        AISuggestion.document_id == document_id,
+                        AISuggestion.status == SuggestionStatus.pending,
+                    )
+                )
 
             # Update status to processing
             document.status = DocumentStatus.processing
             await db.commit()
             logger.info(f"[STEP 2/6] ✓ Status updated to processing")
+            heartbeat = LeaseHeartbeat(document_id, owner=job_id)
+            heartbeat.start()
+            await progress.stage("downloading")
 
             # 2. Download File
             logger.info(f"[STEP 2/6] Downloading file from Supabase: {document.storage_path}")
@@ -54,10 +386,13 @@ async def _process_document_async(document_id: uuid.UUID):
             # Download file content
             file_bytes = client.storage.from_(DocumentService.BUCKET_NAME).download(document.storage_path)
             logger.info(f"[STEP 2/6] ✓ Downloaded {len(file_bytes)} bytes")
+            job.file_bytes = len(file_bytes)
+            await progress.stage("extracting")
 
             # 3. Extract Text
             logger.info(f"[STEP 3/6] Extracting text from {document.filename}")
             text_content = ""
+            pages = []
             if document.filename.lower().endswith(".pdf"):
                 from pypdf import PdfReader
                 from io import BytesIO
@@ -67,141 +402,164 @@ async def _process_document_async(document_id: uuid.UUID):
                     logger.info(f"[STEP 3/6] PDF has {len(reader.pages)} pages")
                     for i, page in enumerate(reader.pages):
                         page_text = page.extract_text()
+                        pages.append(page_text)
                         text_content += page_text + "\n"
                         logger.info(f"[STEP 3/6] Page {i+1}: extracted {len(page_text)} chars")
+                        progress.pages_extracted = i + 1
+                        await progress.stage("extracting")
                 except Exception as e:
                     logger.error(f"[STEP 3/6] ✗ PDF extraction failed: {e}")
                     raise ValueError(f"Failed to extract text from PDF: {e}")
             else:
                 # Assume text/plain
                 text_content = file_bytes.decode("utf-8", errors="ignore")
+                pages = [text_content]
                 logger.info(f"[STEP 3/6] Text file decoded: {len(text_content)} chars")
+                progress.pages_extracted = 1
 
             if not text_content.strip():
                 logger.error(f"[STEP 3/6] ✗ Extracted text is empty")
                 raise ValueError("Extracted text is empty")
 
             logger.info(f"[STEP 3/6] ✓ Extracted {len(text_content)} characters")
+            job.page_count = progress.pages_extracted
+            job.text_chars = len(text_content)
 
-            # 4. AI Analysis
-            logger.info(f"[STEP 4/6] Calling AI service for analysis")
+            # 4. AI Analysis; each suggestion is saved (step 5) as soon as the LLM has produced it
             ai_service = AIService()
-            analysis_result = await ai_service.analyze_document(text_content)
-            logger.info(f"[STEP 4/6] ✓ AI returned {len(analysis_result.suggestions)} suggestions")
+            save_lock = asyncio.Lock()
 
-            # 4.5 Process Classification
-            if analysis_result.classification:
-                logger.info(f"[STEP 4.5/6] Processing classification: {analysis_result.classification.document_type}")
-                cls = analysis_result.classification
-                
-                if cls.document_type == "Law":
-                    # Check if framework exists
-                    stmt = select(RegulatoryFramework).filter(
-                        RegulatoryFramework.tenant_id == tenant_id,
-                        RegulatoryFramework.name == cls.framework_name
-                    )
-                    result = await db.execute(stmt)
-                    framework = result.scalars().first()
-                    
-                    if not framework:
-                        framework = RegulatoryFramework(
+            async def save_suggestion(item: Suggestion) -> None:
+                # Sections stream concurrently and the session takes one writer at a time
+                async with save_lock:
+                    if heartbeat.lost:
+                        raise LeaseLostError(f"Lease on document {document_id} was reclaimed")
+                    db.add(
+                        AISuggestion(
+                            document_id=document.id,
                             tenant_id=tenant_id,
-                            name=cls.framework_name,
-                            description=cls.framework_description,
-                            version=cls.version,
-                            document_id=document.id
+                            type=item.type,
+                            content=item.content,
+                            rationale=item.rationale,
+                            source_reference=item.source_reference,
+                            status=SuggestionStatus.pending
                         )
-                        db.add(framework)
-                        logger.info(f"[STEP 4.5/6] Created new Framework: {cls.framework_name}")
-                    else:
-                        framework.description = cls.framework_description or framework.description
-                        framework.version = cls.version or framework.version
-                        framework.document_id = document.id
-                        logger.info(f"[STEP 4.5/6] Updated Framework: {cls.framework_name}")
-                        
-                elif cls.document_type == "Regulation":
-                    # 1. Ensure parent framework exists
-                    parent_name = cls.parent_law_name or "Unknown Law"
-                    stmt = select(RegulatoryFramework).filter(
-                        RegulatoryFramework.tenant_id == tenant_id,
-                        RegulatoryFramework.name == parent_name
                     )
-                    result = await db.execute(stmt)
-                    parent_framework = result.scalars().first()
-                    
-                    if not parent_framework:
-                        parent_framework = RegulatoryFramework(
-                            tenant_id=tenant_id,
-                            name=parent_name,
-                            description=f"Auto-created parent for {cls.framework_name}",
-                            version=cls.version
-                        )
-                        db.add(parent_framework)
-                        await db.flush() # Need ID
-                        logger.info(f"[STEP 4.5/6] Auto-created parent Framework: {parent_name}")
-                    
-                    # 2. Check/Create Requirement
-                    stmt = select(RegulatoryRequirement).filter(
-                        RegulatoryRequirement.tenant_id == tenant_id,
-                        RegulatoryRequirement.framework_id == parent_framework.id,
-                        RegulatoryRequirement.name == cls.framework_name
+                    progress.suggestions_saved += 1
+                    await db.commit()
+                    logger.info(
+                        f"[STEP 5/6] Suggestion {progress.suggestions_saved}: type={item.type}, status=pending"
                     )
-                    result = await db.execute(stmt)
-                    requirement = result.scalars().first()
-                    
-                    if not requirement:
-                        requirement = RegulatoryRequirement(
-                            tenant_id=tenant_id,
-                            framework_id=parent_framework.id,
-                            name=cls.framework_name,
-                            description=cls.framework_description,
-                            document_id=document.id
-                        )
-                        db.add(requirement)
-                        logger.info(f"[STEP 4.5/6] Created new Requirement: {cls.framework_name}")
-                    else:
-                        requirement.description = cls.framework_description or requirement.description
-                        requirement.document_id = document.id
-                        logger.info(f"[STEP 4.5/6] Updated Requirement: {cls.framework_name}")
-            else:
-                 logger.warning("[STEP 4.5/6] No classification returned from AI")
+                    await progress.stage("analysing")
+            if settings.AI_TWO_STAGE_ANALYSIS:
+                # 4a. Classify from the opening pages and commit the framework right away
+                logger.info("[STEP 4/6] Classifying document from its first pages")
+                await progress.stage("classifying")
+                classified = await ai_service.classify_document(pages)
+                framework_tree_changed = await _apply_classification(
+                    db, tenant_id, document, classified.classification
+                )
+                if heartbeat.lost:
+                    raise LeaseLostError(f"Lease on document {document_id} was reclaimed")
+                await db.commit()
+                if framework_tree_changed:
+                    await FrameworkTreeService.invalidate(tenant_id)
+                progress.classification = classified.classification
 
-            # 5. Save Suggestions
-            logger.info(f"[STEP 5/6] Saving {len(analysis_result.suggestions)} suggestions to database")
-            for i, item in enumerate(analysis_result.suggestions):
-                suggestion = AISuggestion(
-                    document_id=document.id,
-                    tenant_id=tenant_id,
-                    type=item.type,
-                    content=item.content,
-                    rationale=item.rationale,
-                    source_reference=item.source_reference,
-                    status=SuggestionStatus.pending
+                # 4b. Extract per section, concurrently
+                sections = split_sections(pages)
+                logger.info(f"[STEP 4/6] Extracting suggestions from {len(sections)} sections")
+                await progress.stage("analysing")
+
+                async def section_done(count: int) -> None:
+                    progress.chunks_analysed = count
+                    await progress.stage("analysing")
+
+                analysis_result = await ai_service.extract_suggestions(
+                    sections,
+                    classified.classification,
+                    on_section_done=section_done,
+                    on_suggestion=save_suggestion,
+                )
+                usage = TokenUsage.combine([classified.usage, analysis_result.usage])
+                # The framework is already committed; nothing left to invalidate at the end
+                framework_tree_changed = False
+            else:
+                logger.info("[STEP 4/6] Calling AI service for analysis")
+                await progress.stage("analysing")
+                analysis_result = await ai_service.analyze_document(
+                    text_content, on_suggestion=save_suggestion
+                )
+                progress.chunks_analysed += 1
+                usage = analysis_result.usage
+                await progress.stage("classifying")
+                framework_tree_changed = await _apply_classification(
+                    db, tenant_id, document, analysis_result.classification
                 )
-                db.add(suggestion)
-                logger.info(f"[STEP 5/6] Suggestion {i+1}: type={item.type}, status=pending")
+            logger.info(f"[STEP 4/6] ✓ AI returned {len(analysis_result.suggestions)} suggestions")
+            if isinstance(usage, TokenUsage):
+                job.llm_model = usage.model
+                job.prompt_tokens = usage.prompt_tokens
+                job.completion_tokens = usage.completion_tokens
+                job.total_tokens = usage.total_tokens
+
+            logger.info(f"[STEP 5/6] ✓ Saved {progress.suggestions_saved} suggestions")
 
             # 6. Complete
             logger.info(f"[STEP 6/6] Committing changes and marking document as completed")
+            if heartbeat.lost:
+                raise LeaseLostError(f"Lease on document {document_id} was reclaimed")
             document.status = DocumentStatus.completed
+            document.lease_owner = None
+            document.lease_expires_at = None
+            progress.finish_job(AnalysisJobStatus.succeeded)
             await db.commit()
             logger.info(f"[STEP 6/6] ✓ Document {document_id} analysis completed successfully")
+            if framework_tree_changed:
+                await FrameworkTreeService.invalidate(tenant_id)
+            await _update_compliance_summary(
+                db, tenant_id, document_id, summary_before, progress.suggestions_saved
+            )
+            await progress.stage("completed", status=DocumentStatus.completed)
+
+        except LeaseLostError as e:
+            # Another attempt owns the document now; leave its state alone
+            logger.warning(f"Abandoning results for document {document_id}: {e}")
+            await db.rollback()
 
         except Exception as e:
+            if heartbeat is not None and heartbeat.lost:
+                # The failure may stem from the reclaim itself; the new owner decides the outcome
+                logger.warning(f"Abandoning failed attempt on document {document_id}: lease was reclaimed ({e})")
+                await db.rollback()
+                return
             logger.exception(f"✗ Error processing document {document_id}: {e}")
             # Update status to failed
             try:
+                # Discard uncommitted work; the job row and the suggestions saved so far stay
+                await db.rollback()
+                progress.finish_job(AnalysisJobStatus.failed, error=e)
                 # Re-fetch in case session was rolled back
                 document = await db.get(Document, document_id)
                 if document:
                     document.status = DocumentStatus.failed
+                    document.lease_owner = None
+                    document.lease_expires_at = None
                     await db.commit()
                     logger.error(f"Document {document_id} marked as FAILED")
             except Exception as db_e:
                 logger.error(f"Failed to update document status to failed: {db_e}")
+            await _update_compliance_summary(
+                db, progress.tenant_id, document_id, summary_before, progress.suggestions_saved
+            )
+            await progress.stage("failed", status=DocumentStatus.failed, message=str(e))
 
-@celery_app.task(name="process_document")
-def process_document(document_id_str: str):
+        finally:
+            if heartbeat is not None:
+                await heartbeat.stop()
+
+@celery_app.task(name="process_document", bind=True)
+def process_document(self, document_id_str: str):
     """
     Celery task entry point.
     """
@@ -210,10 +568,116 @@ def process_document(document_id_str: str):
         # Celery doesn't natively support async/await tasks in standard pool
         # We use asyncio.run to execute the async logic
         document_id = uuid.UUID(document_id_str)
-        asyncio.run(_process_document_async(document_id))
+        asyncio.run(
+            _process_document_async(
+                document_id,
+                celery_task_id=self.request.id,
+                worker_id=self.request.hostname,
+            )
+        )
         print(f"DEBUG: Celery Task process_document FINISHED logic")
     except Exception as e:
         print(f"CRITICAL ERROR IN TASK: {e}")
         import traceback
         traceback.print_exc()
     print(f"DEBUG: Celery Task process_document END")
+
+
+async def _reap_expired_analyses_async() -> dict:
+    """
+    Reclaim documents whose processing lease expired (worker crashed or hung) and
+    requeue them with exponential backoff, up to ANALYSIS_MAX_ATTEMPTS attempts.
+    """
+    now = datetime.utcnow()
+    reclaimed, exhausted, requeue_ids = 0, 0, []
+
+    async with async_session_maker() as db:
+        # 1. Expired leases. A NULL lease on a processing row predates leases and is stuck too.
+        expired = (
+            await db.execute(
+                select(Document)
+                .where(
+                    Document.status == DocumentStatus.processing,
+                    or_(Document.lease_expires_at.is_(None), Document.lease_expires_at < now),
+                )
+                .with_for_update(skip_locked=True)
+            )
+        ).scalars().all()
+
+        if expired:
+            expired_ids = [document.id for document in expired]
+            await db.execute(
+                update(AnalysisJob)
+                .where(
+                    AnalysisJob.document_id.in_(expired_ids),
+                    AnalysisJob.status == AnalysisJobStatus.running,
+                )
+                .values(
+                    status=AnalysisJobStatus.failed,
+                    finished_at=now,
+                    error_class="LeaseExpired",
+                    error_message="Processing lease expired; worker presumed dead",
+                )
+            )
+            attempts = dict(
+                (
+                    await db.execute(
+                        select(AnalysisJob.document_id, func.count())
+                        .where(AnalysisJob.document_id.in_(expired_ids))
+                        .group_by(AnalysisJob.document_id)
+                    )
+                ).all()
+            )
+
+            for document in expired:
+                document_attempts = attempts.get(document.id, 0)
+                document.lease_owner = None
+                document.lease_expires_at = None
+                if document_attempts >= settings.ANALYSIS_MAX_ATTEMPTS:
+                    document.status = DocumentStatus.failed
+                    exhausted += 1
+                    logger.error(
+                        f"Document {document.id} failed after {document_attempts} attempts (lease expired)"
+                    )
+                else:
+                    delay = _retry_backoff_seconds(document_attempts)
+                    document.status = DocumentStatus.pending
+                    document.next_attempt_at = now + timedelta(seconds=delay)
+                    reclaimed += 1
+                    logger.warning(f"Reclaimed document {document.id}; retrying in {delay}s")
+            await db.commit()
+
+        # 2. Retries whose backoff has elapsed
+        due = (
+            await db.execute(
+                select(Document)
+                .where(
+                    Document.status == DocumentStatus.pending,
+                    Document.next_attempt_at.is_not(None),
+                    Document.next_attempt_at <= now,
+                )
+                .with_for_update(skip_locked=True)
+            )
+        ).scalars().all()
+        for document in due:
+            document.next_attempt_at = None
+            requeue_ids.append(document.id)
+        if due:
+            await db.commit()
+
+    # Enqueue only after the commit so a fast worker sees the cleared schedule
+    for document_id in requeue_ids:
+        process_document.delay(str(document_id))
+
+    return {"reclaimed": reclaimed, "exhausted": exhausted, "requeued": len(requeue_ids)}
+
+
+@celery_app.task(name="reap_expired_analyses")
+def reap_expired_analyses():
+    """
+    Celery beat entry point for the stuck-job reaper.
+    """
+    result = asyncio.run(_reap_expired_analyses_async())
+    if any(result.values()):
+        logger.info(f"Analysis reaper: {result}")
+    return result
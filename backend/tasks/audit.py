@@ -0,0 +1,26 @@
+import asyncio
+import logging
+
+from app.core.celery_app import celery_app
+from app.database import async_session_maker
+from app.services.audit_archive_service import AuditArchiveService, get_archive_store
+
+logger = logging.getLogger(__name__)
+
+
+async def _maintain_audit_logs_async() -> dict:
+    async with async_session_maker() as db:
+        created = await AuditArchiveService.ensure_partitions(db)
+        archived = await AuditArchiveService.archive_expired(db, get_archive_store())
+    return {"partitions_created": created, "months_archived": [month.isoformat() for month in archived]}
+
+
+@celery_app.task(name="maintain_audit_logs")
+def maintain_audit_logs():
+    """
+    Celery beat entry point: create upcoming audit_logs partitions and archive
+    months past AUDIT_RETENTION_MONTHS.
+    """
+    result = asyncio.run(_maintain_audit_logs_async())
+    logger.info(f"Audit log maintenance: {result}")
+    return result
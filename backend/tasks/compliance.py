@@ -0,0 +1,52 @@
+import asyncio
+import logging
+
+from sqlalchemy.future import select
+
+from app.core.celery_app import celery_app
+from app.database import async_session_maker
+from app.models.user import User
+from app.services.assessment_schedule_service import AssessmentScheduleService
+from app.services.compliance_summary_service import ComplianceSummaryService
+
+logger = logging.getLogger(__name__)
+
+
+async def _refresh_compliance_summaries_async() -> int:
+    """
+    Recompute every tenant's compliance summary from scratch. Writes keep the
+    summaries current with deltas; this pass ages the suggestion backlog (which
+    changes without any write), creates missing rows and repairs any drift.
+    """
+    async with async_session_maker() as db:
+        tenant_ids = (await db.execute(select(User.tenant_id).distinct())).scalars().all()
+        for tenant_id in tenant_ids:
+            await ComplianceSummaryService.refresh(db, tenant_id)
+            await db.commit()
+    return len(tenant_ids)
+
+
+@celery_app.task(name="refresh_compliance_summaries")
+def refresh_compliance_summaries():
+    """
+    Celery beat entry point for the compliance summary refresh.
+    """
+    refreshed = asyncio.run(_refresh_compliance_summaries_async())
+    logger.info(f"Refreshed compliance summaries for {refreshed} tenants")
+    return refreshed
+
+
+async def _materialize_assessments_async() -> int:
+    async with async_session_maker() as db:
+        return await AssessmentScheduleService.materialize_due(db)
+
+
+@celery_app.task(name="materialize_assessments")
+def materialize_assessments():
+    """
+    Celery beat entry point: create scheduled control assessments due within the horizon.
+    """
+    created = asyncio.run(_materialize_assessments_async())
+    if created:
+        logger.info(f"Materialised {created} control assessments")
+    return created
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+
+from app.config import settings
+from app.core.celery_app import celery_app
+from app.database import async_session_maker
+from app.email import SMTPMailer
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+async def _deliver_notifications_async() -> int:
+    async with async_session_maker() as db:
+        # Most beat runs find the outbox empty; don't open an SMTP session for those
+        if not await NotificationService.has_pending(db):
+            return 0
+        async with SMTPMailer() as mailer:
+            return await NotificationService.drain(db, mailer)
+
+
+@celery_app.task(name="deliver_notifications")
+def deliver_notifications():
+    """
+    Celery beat entry point: send pending outbox notifications as per-recipient digests.
+    """
+    if not settings.MAIL_SERVER:
+        logger.info("MAIL_SERVER not configured, leaving notifications in the outbox")
+        return 0
+    delivered = asyncio.run(_deliver_notifications_async())
+    if delivered:
+        logger.info(f"Delivered {delivered} notifications")
+    return delivered
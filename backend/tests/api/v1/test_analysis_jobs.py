@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from httpx import AsyncClient
+
+from app.models.analysis_job import AnalysisJob, AnalysisJobStatus
+from app.models.document import Document, DocumentStatus
+
+
+async def _seed_jobs(db_session, admin_user):
+    document = Document(
+        id=uuid4(),
+        filename="jobs.pdf",
+        storage_path="path/to/jobs.pdf",
+        status=DocumentStatus.completed,
+        uploaded_by=admin_user.id,
+        tenant_id=admin_user.tenant_id,
+    )
+    db_session.add(document)
+    now = datetime.utcnow()
+    for i, duration in enumerate([100, 200, 300, 400, 500]):
+        db_session.add(AnalysisJob(
+            document_id=document.id,
+            tenant_id=admin_user.tenant_id,
+            status=AnalysisJobStatus.succeeded,
+            attempt=i + 1,
+            started_at=now - timedelta(minutes=30),
+            finished_at=now - timedelta(minutes=29),
+            duration_ms=duration,
+            stage_durations={"extracting": duration // 2, "analysing": duration // 2},
+            page_count=150 if duration >= 300 else 10,
+            total_tokens=1000,
+        ))
+    db_session.add(AnalysisJob(
+        document_id=document.id,
+        tenant_id=admin_user.tenant_id,
+        status=AnalysisJobStatus.failed,
+        started_at=now - timedelta(minutes=5),
+        error_class="ValueError",
+    ))
+    db_session.add(AnalysisJob(
+        document_id=document.id,
+        tenant_id=admin_user.tenant_id,
+        status=AnalysisJobStatus.running,
+        started_at=now - timedelta(hours=2),
+        current_stage="analysing",
+    ))
+    # Another tenant's job must never be visible
+    db_session.add(AnalysisJob(
+        document_id=document.id,
+        tenant_id=uuid4(),
+        status=AnalysisJobStatus.succeeded,
+        started_at=now,
+        duration_ms=99999,
+    ))
+    await db_session.commit()
+    return document
+
+
+@pytest.mark.asyncio
+async def test_analysis_job_stats_percentiles(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    await _seed_jobs(db_session, admin_user)
+
+    response = await test_client.get("/api/v1/analysis-jobs/stats", headers=admin_token_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["jobs"] == 7
+    assert data["by_status"] == {"succeeded": 5, "failed": 1, "running": 1}
+    assert data["error_classes"] == {"ValueError": 1}
+    assert data["duration"]["count"] == 5
+    assert data["duration"]["p50_ms"] == 300
+    assert data["duration"]["p90_ms"] == pytest.approx(460)
+    assert data["duration"]["max_ms"] == 500
+    assert data["stages"]["extracting"]["p50_ms"] == 150
+    assert data["tokens"]["total_tokens"] == 5000
+
+
+@pytest.mark.asyncio
+async def test_analysis_job_stats_page_filter(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    await _seed_jobs(db_session, admin_user)
+
+    response = await test_client.get(
+        "/api/v1/analysis-jobs/stats?min_pages=100", headers=admin_token_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["duration"]["count"] == 3
+    assert data["duration"]["p50_ms"] == 400
+
+
+@pytest.mark.asyncio
+async def test_list_analysis_jobs_running_too_long(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    await _seed_jobs(db_session, admin_user)
+
+    response = await test_client.get(
+        "/api/v1/analysis-jobs?running_longer_than_minutes=60", headers=admin_token_headers
+    )
+
+    assert response.status_code == 200
+    jobs = response.json()
+    assert len(jobs) == 1
+    assert jobs[0]["status"] == "running"
+    assert jobs[0]["current_stage"] == "analysing"
+
+
+@pytest.mark.asyncio
+async def test_analysis_jobs_requires_admin(test_client: AsyncClient, bpo_token_headers):
+    response = await test_client.get("/api/v1/analysis-jobs", headers=bpo_token_headers)
+    assert response.status_code == 403
@@ -27,7 +27,8 @@ async def test_get_pending_reviews(
         id=uuid4(), 
         filename="Test Doc", 
         storage_path="/tmp/doc.pdf", 
-        uploaded_by=user.id
+        uploaded_by=user.id,
+        tenant_id=user.tenant_id,
     )
     db_session.add(doc)
     
@@ -91,7 +92,8 @@ async def test_submit_assessment_approve(
         id=uuid4(), 
         filename="Test Doc", 
         storage_path="/tmp/doc.pdf", 
-        uploaded_by=user.id
+        uploaded_by=user.id,
+        tenant_id=user.tenant_id,
     )
     db_session.add(doc)
     
@@ -0,0 +1,178 @@
+"""Tests for scheduled control assessments and the overdue queue."""
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assessment_schedule import AssessmentRecurrence, AssessmentSchedule, ControlAssessment
+from app.models.compliance import Control
+from app.models.user import User
+from app.schemas.assessment_schedule import AssessmentScheduleCreate
+from app.services.assessment_schedule_service import AssessmentScheduleService, add_months
+from app.services.dashboard_service import DashboardService
+
+
+def test_add_months_clamps_to_month_end():
+    assert add_months(datetime(2025, 1, 31), 1) == datetime(2025, 2, 28)
+    assert add_months(datetime(2025, 11, 15), 3) == datetime(2026, 2, 15)
+
+
+@pytest.mark.asyncio
+async def test_schedule_materialises_and_overdue_queue_paginates(
+    test_client: AsyncClient, bpo_user: User, bpo_token_headers: dict, db_session: AsyncSession
+):
+    control = Control(id=uuid4(), tenant_id=bpo_user.tenant_id, name="Access review", owner_id=bpo_user.id)
+    db_session.add(control)
+    await db_session.commit()
+
+    first_due = datetime.utcnow() - timedelta(days=75)
+    created = await test_client.post(
+        "/api/v1/control-assessments/schedules",
+        json={"control_id": str(control.id), "recurrence": "monthly", "first_due_at": first_due.isoformat()},
+        headers=bpo_token_headers,
+    )
+    assert created.status_code == 201
+    assert created.json()["owner_id"] == str(bpo_user.id)
+
+    # Past occurrences are overdue; the one inside the horizon is materialised but not yet due
+    due_dates = (
+        await db_session.execute(select(ControlAssessment.due_at).order_by(ControlAssessment.due_at))
+    ).scalars().all()
+    assert len(due_dates) >= 3
+    overdue_count = sum(1 for due_at in due_dates if due_at < datetime.utcnow())
+    assert overdue_count == 3
+
+    page = await test_client.get("/api/v1/control-assessments/overdue?limit=2", headers=bpo_token_headers)
+    assert page.status_code == 200
+    assert [a["due_at"] for a in page.json()] == [d.isoformat() for d in due_dates[:2]]
+    rest = await test_client.get(
+        f"/api/v1/control-assessments/overdue?limit=2&cursor={page.headers['x-next-cursor']}",
+        headers=bpo_token_headers,
+    )
+    assert len(rest.json()) == 1
+    assert "x-next-cursor" not in rest.headers
+
+    done = await test_client.post(
+        f"/api/v1/control-assessments/{page.json()[0]['id']}/complete", headers=bpo_token_headers
+    )
+    assert done.status_code == 200
+    again = await test_client.post(
+        f"/api/v1/control-assessments/{page.json()[0]['id']}/complete", headers=bpo_token_headers
+    )
+    assert again.status_code == 400
+
+    metrics = await DashboardService.get_metrics(db_session, bpo_user.id, bpo_user.tenant_id, "bpo")
+    overdue_card = next(c for c in metrics.cards if c.card_id == "overdue_assessments")
+    assert overdue_card.metric == 2
+
+
+@pytest.mark.asyncio
+async def test_materialize_due_runs_in_batches(db_session: AsyncSession):
+    tenant_id, owner_id = uuid4(), uuid4()
+    now = datetime.utcnow()
+    for _ in range(3):
+        control = Control(id=uuid4(), tenant_id=tenant_id, name="C", owner_id=owner_id)
+        db_session.add(control)
+        db_session.add(
+            AssessmentSchedule(
+                tenant_id=tenant_id, control_id=control.id, owner_id=owner_id,
+                recurrence=AssessmentRecurrence.quarterly,
+                first_due_at=now + timedelta(days=10), next_due_at=now + timedelta(days=10),
+            )
+        )
+    await db_session.commit()
+
+    created = await AssessmentScheduleService.materialize_due(
+        db_session, horizon=now + timedelta(days=200), batch_size=2
+    )
+
+    # Each schedule: +10d, +3mo and +6mo fall inside a 200-day horizon
+    assert created == 9
+    schedules = (await db_session.execute(select(AssessmentSchedule))).scalars().all()
+    assert all(s.next_due_at > now + timedelta(days=200) for s in schedules)
+    assert await AssessmentScheduleService.materialize_due(db_session, horizon=now + timedelta(days=200)) == 0
+
+
+@pytest.mark.asyncio
+async def test_month_end_schedule_does_not_drift(db_session: AsyncSession):
+    tenant_id, owner_id = uuid4(), uuid4()
+    control = Control(id=uuid4(), tenant_id=tenant_id, name="C", owner_id=owner_id)
+    anchor = datetime(2025, 1, 31, 9, 0)
+    schedule = AssessmentSchedule(
+        tenant_id=tenant_id, control_id=control.id, owner_id=owner_id,
+        recurrence=AssessmentRecurrence.monthly, first_due_at=anchor, next_due_at=anchor,
+    )
+    db_session.add_all([control, schedule])
+    await db_session.commit()
+
+    await AssessmentScheduleService.materialize_due(db_session, horizon=datetime(2025, 4, 30, 9, 0))
+
+    due_dates = (
+        await db_session.execute(select(ControlAssessment.due_at).order_by(ControlAssessment.due_at))
+    ).scalars().all()
+    assert [d.date().isoformat() for d in due_dates] == ["2025-01-31", "2025-02-28", "2025-03-31", "2025-04-30"]
+    await db_session.refresh(schedule)
+    assert schedule.next_due_at == datetime(2025, 5, 31, 9, 0)
+
+
+@pytest.mark.asyncio
+async def test_schedule_owner_must_belong_to_tenant(
+    test_client: AsyncClient, bpo_user: User, bpo_token_headers: dict, db_session: AsyncSession
+):
+    control = Control(id=uuid4(), tenant_id=bpo_user.tenant_id, name="Access review", owner_id=bpo_user.id)
+    outsider = User(id=uuid4(), email="outsider@example.com", hashed_password="x", tenant_id=uuid4())
+    db_session.add_all([control, outsider])
+    await db_session.commit()
+
+    response = await test_client.post(
+        "/api/v1/control-assessments/schedules",
+        json={
+            "control_id": str(control.id),
+            "recurrence": "monthly",
+            "first_due_at": datetime.utcnow().isoformat(),
+            "owner_id": str(outsider.id),
+        },
+        headers=bpo_token_headers,
+    )
+    assert response.status_code == 404
+    assert (await db_session.execute(select(AssessmentSchedule))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_only_owner_or_admin_completes_assessment(
+    test_client: AsyncClient, bpo_user: User, bpo_token_headers: dict, db_session: AsyncSession
+):
+    colleague = User(
+        id=uuid4(), email="colleague@example.com", hashed_password="x", roles=["bpo"], tenant_id=bpo_user.tenant_id
+    )
+    control = Control(id=uuid4(), tenant_id=bpo_user.tenant_id, name="Access review", owner_id=colleague.id)
+    db_session.add_all([colleague, control])
+    await db_session.commit()
+    schedule = await AssessmentScheduleService.create_schedule(
+        db_session,
+        AssessmentScheduleCreate(
+            control_id=control.id, recurrence="monthly", first_due_at=datetime.utcnow() - timedelta(days=1)
+        ),
+        bpo_user.tenant_id,
+        colleague.id,
+    )
+    await db_session.commit()
+    assessment = (
+        await db_session.execute(
+            select(ControlAssessment).where(ControlAssessment.schedule_id == schedule.id).limit(1)
+        )
+    ).scalar_one()
+
+    response = await test_client.post(
+        f"/api/v1/control-assessments/{assessment.id}/complete", headers=bpo_token_headers
+    )
+    assert response.status_code == 403
+    await db_session.refresh(assessment)
+    assert assessment.completed_at is None
+
+    completed = await AssessmentScheduleService.complete_assessment(
+        db_session, assessment.id, bpo_user.tenant_id, bpo_user.id, is_admin=True
+    )
+    assert completed.completed_by == bpo_user.id
@@ -82,6 +82,7 @@ async def test_get_dashboard_metrics_bpo_success():
     mock_db.execute = AsyncMock(side_effect=[
         MagicMock(scalar=lambda: 7),  # pending_reviews
         MagicMock(scalar=lambda: 12),  # my_controls
+        MagicMock(scalar=lambda: 0),  # overdue_assessments
     ])
 
     # Override dependencies
@@ -129,9 +130,9 @@ async def test_get_dashboard_metrics_executive_success():
 
     # Mock database session with query results
     mock_db = AsyncMock()
+    summary = MagicMock(risks_total=25, compliance_score=72, recent_activity=10)
     mock_db.execute = AsyncMock(side_effect=[
-        MagicMock(scalar=lambda: 25),  # total_risks
-        MagicMock(scalar=lambda: 10),  # recent_activity
+        MagicMock(one_or_none=lambda: summary),  # compliance summary row
     ])
 
     # Override dependencies
@@ -226,3 +227,72 @@ async def test_get_dashboard_metrics_tenant_isolation():
             assert risks_card["metric"] == 5
     finally:
         app.dependency_overrides = {}
+
+
+async def _seed_overview(db_session, owner):
+    from datetime import datetime, timedelta
+    from app.models.compliance import BusinessProcess, Control, Risk
+
+    base = datetime(2025, 1, 1)
+    processes = []
+    for i in range(3):
+        process = BusinessProcess(
+            id=uuid4(), tenant_id=owner.tenant_id, name=f"Process {i}",
+            owner_id=owner.id, created_at=base + timedelta(days=i),
+        )
+        processes.append(process)
+        db_session.add(process)
+        db_session.add(Control(
+            id=uuid4(), tenant_id=owner.tenant_id, name=f"Control {i}",
+            type="preventive", owner_id=owner.id, process_id=process.id,
+        ))
+        db_session.add(Risk(
+            id=uuid4(), tenant_id=owner.tenant_id, name=f"Risk {i}",
+            owner_id=owner.id, process_id=process.id,
+        ))
+    db_session.add(BusinessProcess(id=uuid4(), tenant_id=uuid4(), name="Foreign", owner_id=owner.id))
+    await db_session.commit()
+    return processes
+
+
+@pytest.mark.asyncio
+async def test_get_overview_paginates_processes(test_client, admin_user, admin_token_headers, db_session):
+    """Overview pages newest process first with a keyset cursor; children are attached per page."""
+    await _seed_overview(db_session, admin_user)
+
+    first = await test_client.get("/api/v1/dashboard/overview?limit=2", headers=admin_token_headers)
+    assert first.status_code == 200
+    assert [p["name"] for p in first.json()["processes"]] == ["Process 2", "Process 1"]
+    assert first.json()["processes"][0]["controls"][0]["name"] == "Control 2"
+    assert first.json()["processes"][0]["risks"][0]["name"] == "Risk 2"
+
+    second = await test_client.get(
+        f"/api/v1/dashboard/overview?limit=2&cursor={first.headers['x-next-cursor']}",
+        headers=admin_token_headers,
+    )
+    assert [p["name"] for p in second.json()["processes"]] == ["Process 0"]
+    assert "x-next-cursor" not in second.headers
+
+    unpaged = await test_client.get("/api/v1/dashboard/overview", headers=admin_token_headers)
+    assert len(unpaged.json()["processes"]) == 3
+
+    invalid = await test_client.get("/api/v1/dashboard/overview?cursor=bogus", headers=admin_token_headers)
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_overview_ndjson(test_client, admin_user, admin_token_headers, db_session, monkeypatch):
+    """The NDJSON stream emits one process per line across batches, tenant-scoped."""
+    import json
+    from app.api.v1.endpoints import dashboard
+
+    await _seed_overview(db_session, admin_user)
+    monkeypatch.setattr(dashboard, "OVERVIEW_STREAM_BATCH_SIZE", 2)
+
+    response = await test_client.get("/api/v1/dashboard/overview/stream", headers=admin_token_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [p["name"] for p in lines] == ["Process 2", "Process 1", "Process 0"]
+    assert all(len(p["controls"]) == 1 and len(p["risks"]) == 1 for p in lines)
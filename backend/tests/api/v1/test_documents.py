@@ -435,3 +435,188 @@ async def test_manually_process_document_returns_classification(
         assert data["classification"]["framework_name"] == "PCI DSS"
     finally:
         del app.dependency_overrides[get_current_active_user]
+
+
+async def _seed_document(db_session, admin_user, status: DocumentStatus) -> Document:
+    document = Document(
+        id=uuid4(),
+        filename="progress.pdf",
+        storage_path="path/to/progress.pdf",
+        status=status,
+        uploaded_by=admin_user.id,
+        tenant_id=admin_user.tenant_id,
+    )
+    db_session.add(document)
+    await db_session.commit()
+    return document
+
+
+def _sse_events(body: str):
+    import json
+
+    return [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_document_events_completed_document_sends_snapshot_and_closes(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    """A finished document yields a single snapshot event and the stream ends."""
+    document = await _seed_document(db_session, admin_user, DocumentStatus.completed)
+
+    response = await test_client.get(
+        f"/api/v1/documents/{document.id}/events", headers=admin_token_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    assert len(events) == 1
+    assert events[0]["document_id"] == str(document.id)
+    assert events[0]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_document_events_relays_published_progress(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    """Events published by the pipeline are relayed until a terminal status arrives."""
+    import asyncio
+    from app.core.progress import publish_progress
+    from app.schemas.progress import DocumentProgressEvent
+
+    document = await _seed_document(db_session, admin_user, DocumentStatus.processing)
+
+    async def run_pipeline():
+        await asyncio.sleep(0.05)
+        await publish_progress(DocumentProgressEvent(
+            document_id=document.id, status=DocumentStatus.processing,
+            stage="extracting", pages_extracted=3,
+        ))
+        await publish_progress(DocumentProgressEvent(
+            document_id=document.id, status=DocumentStatus.completed,
+            stage="completed", pages_extracted=3, suggestions_saved=2,
+        ))
+
+    pipeline = asyncio.create_task(run_pipeline())
+    response = await test_client.get(
+        f"/api/v1/documents/{document.id}/events", headers=admin_token_headers
+    )
+    await pipeline
+
+    assert response.status_code == 200
+    events = _sse_events(response.text)
+    assert [e["stage"] for e in events] == ["processing", "extracting", "completed"]
+    assert events[-1]["suggestions_saved"] == 2
+
+
+@pytest.mark.asyncio
+async def test_document_events_other_tenant_not_found(
+    test_client: AsyncClient, db_session, admin_user, bpo_token_headers
+):
+    """Progress of another tenant's document is not exposed."""
+    document = await _seed_document(db_session, admin_user, DocumentStatus.processing)
+
+    response = await test_client.get(
+        f"/api/v1/documents/{document.id}/events", headers=bpo_token_headers
+    )
+
+    assert response.status_code == 404
+
+
+async def _seed_regulation_documents(db_session, admin_user, count: int):
+    from datetime import datetime, timedelta
+
+    framework = RegulatoryFramework(id=uuid4(), tenant_id=admin_user.tenant_id, name="GDPR")
+    db_session.add(framework)
+    base = datetime.utcnow()
+    documents = []
+    for i in range(count):
+        document = Document(
+            id=uuid4(),
+            filename=f"article_{i}.pdf",
+            storage_path=f"path/article_{i}.pdf",
+            status=DocumentStatus.completed,
+            uploaded_by=admin_user.id,
+            tenant_id=admin_user.tenant_id,
+            created_at=base - timedelta(minutes=i),
+        )
+        db_session.add(document)
+        db_session.add(RegulatoryRequirement(
+            id=uuid4(),
+            tenant_id=admin_user.tenant_id,
+            framework_id=framework.id,
+            name=f"Article {i}",
+            description=f"Article {i} of GDPR",
+            document_id=document.id,
+        ))
+        documents.append(document)
+    await db_session.commit()
+    db_session.expunge_all()
+    return documents
+
+
+@pytest.mark.asyncio
+async def test_list_documents_constant_query_count(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers, query_budget
+):
+    """Regulation classifications (with parent law) load without a query per document."""
+    await _seed_regulation_documents(db_session, admin_user, count=12)
+
+    with query_budget(6):
+        response = await test_client.get("/api/v1/documents", headers=admin_token_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 12
+    assert all(d["classification"]["parent_law_name"] == "GDPR" for d in data)
+
+
+@pytest.mark.asyncio
+async def test_list_documents_keyset_pagination(
+    test_client: AsyncClient, db_session, admin_user, admin_token_headers
+):
+    documents = await _seed_regulation_documents(db_session, admin_user, count=5)
+
+    first = await test_client.get("/api/v1/documents?limit=2", headers=admin_token_headers)
+    assert [d["id"] for d in first.json()] == [str(d.id) for d in documents[:2]]
+    cursor = first.headers["x-next-cursor"]
+
+    second = await test_client.get(
+        f"/api/v1/documents?limit=2&cursor={cursor}", headers=admin_token_headers
+    )
+    assert [d["id"] for d in second.json()] == [str(d.id) for d in documents[2:4]]
+
+    last = await test_client.get(
+        f"/api/v1/documents?limit=2&cursor={second.headers['x-next-cursor']}",
+        headers=admin_token_headers,
+    )
+    assert [d["id"] for d in last.json()] == [str(documents[4].id)]
+    assert "x-next-cursor" not in last.headers
+
+    bad = await test_client.get("/api/v1/documents?cursor=not-a-cursor", headers=admin_token_headers)
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_document_by_id_checks_tenant_in_one_query(db_session, admin_user, query_budget):
+    """Tenant scoping is part of the fetch: no separate uploader lookup."""
+    document = await _seed_document(db_session, admin_user, DocumentStatus.completed)
+    db_session.expunge_all()
+
+    # Document plus the two eager-loaded classification relationships
+    with query_budget(3):
+        found = await DocumentService.get_document_by_id(
+            db_session, document.id, user_id=uuid4(), tenant_id=admin_user.tenant_id
+        )
+    assert found.id == document.id
+
+    with pytest.raises(HTTPException) as exc_info:
+        await DocumentService.get_document_by_id(
+            db_session, document.id, user_id=admin_user.id, tenant_id=uuid4()
+        )
+    assert exc_info.value.status_code == 404
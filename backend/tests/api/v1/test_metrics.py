@@ -0,0 +1,47 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import Counter, Histogram, Registry, HTTP_REQUEST_DURATION, DB_QUERIES_PER_REQUEST
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    counter = registry.register(Counter("jobs_total", "Jobs.", ("status",)))
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{status="ok"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert "latency_seconds_sum 5.55" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_latency_and_queries(
+    test_client: AsyncClient, admin_token_headers
+):
+    route = "audit-logs-list_audit_logs"
+    before_requests = HTTP_REQUEST_DURATION.count(route=route, method="GET", status="200")
+    before_queries = DB_QUERIES_PER_REQUEST.sum(route=route)
+
+    response = await test_client.get("/api/v1/audit-logs", headers=admin_token_headers)
+    assert response.status_code == 200
+
+    assert HTTP_REQUEST_DURATION.count(route=route, method="GET", status="200") == before_requests + 1
+    # At least the user lookup and the audit log query
+    assert DB_QUERIES_PER_REQUEST.sum(route=route) >= before_queries + 2
+
+    metrics = await test_client.get("/metrics")
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert f'http_request_duration_seconds_count{{route="{route}",method="GET",status="200"}}' in metrics.text
+    assert "db_query_duration_seconds_count" in metrics.text
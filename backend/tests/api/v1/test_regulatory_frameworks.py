@@ -7,6 +7,7 @@ from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.core.query_profiler import capture_queries
 from app.models.compliance import RegulatoryFramework, RegulatoryRequirement
 
 
@@ -189,3 +190,51 @@ async def test_get_regulatory_frameworks_tree_unauthorized(
 
     # FastAPI returns 403 Forbidden for unauthenticated requests with dependency injection
     assert response.status_code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
+
+
+@pytest.mark.asyncio
+async def test_get_regulatory_frameworks_tree_cached_with_etag(
+    test_client: AsyncClient,
+    admin_user: User,
+    admin_token_headers: dict,
+    db_session: AsyncSession,
+):
+    """Repeat loads skip the tree queries, honour If-None-Match, and see writes made via the API."""
+    framework = RegulatoryFramework(
+        id=uuid4(), tenant_id=admin_user.tenant_id, name="DORA"
+    )
+    db_session.add(framework)
+    await db_session.commit()
+
+    first = await test_client.get("/api/v1/regulatory-frameworks/tree", headers=admin_token_headers)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first.headers["etag"]
+
+    with capture_queries() as profile:
+        second = await test_client.get(
+            "/api/v1/regulatory-frameworks/tree", headers=admin_token_headers
+        )
+    assert second.content == first.content
+    assert not any("regulatory_frameworks" in shape for shape in profile.shapes)
+
+    not_modified = await test_client.get(
+        "/api/v1/regulatory-frameworks/tree",
+        headers={**admin_token_headers, "If-None-Match": etag},
+    )
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+
+    created = await test_client.post(
+        "/api/v1/regulatory-requirements",
+        json={"framework_id": str(framework.id), "name": "Article 6"},
+        headers=admin_token_headers,
+    )
+    assert created.status_code == status.HTTP_201_CREATED
+
+    refreshed = await test_client.get(
+        "/api/v1/regulatory-frameworks/tree",
+        headers={**admin_token_headers, "If-None-Match": etag},
+    )
+    assert refreshed.status_code == status.HTTP_200_OK
+    assert refreshed.headers["etag"] != etag
+    assert [r["name"] for r in refreshed.json()[0]["requirements"]] == ["Article 6"]
@@ -2,11 +2,14 @@ import pytest
 from httpx import AsyncClient
 from uuid import uuid4
 from fastapi import status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.audit_log import AuditLog
 from app.models.user import User
 from app.models.compliance import RegulatoryFramework, RegulatoryRequirement, Control
 from app.models.mapping import ControlRegulatoryRequirement
+from app.services.audit_service import audit_queue
 
 
 @pytest.mark.asyncio
@@ -98,6 +101,13 @@ async def test_get_gap_analysis_report_admin(
     assert "Article 5.2" in gap_names
     assert "Article 5.3" not in gap_names  # Mapped requirement should not be in gaps
 
+    # The view is audited through the background queue
+    await audit_queue.flush()
+    views = (await db_session.execute(
+        select(AuditLog).where(AuditLog.entity_id == framework.id, AuditLog.action == "VIEW")
+    )).scalars().all()
+    assert [view.actor_id for view in views] == [admin_user.id]
+
 
 @pytest.mark.asyncio
 async def test_get_gap_analysis_report_100_percent_coverage(
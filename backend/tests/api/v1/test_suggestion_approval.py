@@ -23,6 +23,7 @@ async def test_approve_suggestion_creates_control_with_owner(
         id=uuid4(),
         filename="test.pdf",
         uploaded_by=bpo_user.id,
+        tenant_id=bpo_user.tenant_id,
         storage_path="test/path"
     )
     db_session.add(document)
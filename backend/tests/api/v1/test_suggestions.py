@@ -100,4 +100,132 @@ async def test_update_suggestion_not_found():
             response = await ac.patch(f"/api/v1/suggestions/{uuid4()}/status", json={"status": "rejected"})
             assert response.status_code == 404
     finally:
-        app.dependency_overrides = {}
\ No newline at end of file
+        app.dependency_overrides = {}
+
+@pytest.mark.asyncio
+async def test_triage_suggestions_applies_pending_only(test_client, db_session, admin_user, admin_token_headers):
+    """Batch triage moves pending suggestions and skips the rest."""
+    from sqlalchemy import select
+    from app.models.audit_log import AuditLog
+    from app.models.document import Document, DocumentStatus
+    from app.models.notification import NotificationOutbox
+    from app.models.suggestion import AISuggestion
+
+    doc = Document(
+        id=uuid4(), filename="Reg", storage_path="/tmp/reg.pdf", uploaded_by=admin_user.id,
+        tenant_id=admin_user.tenant_id, status=DocumentStatus.completed,
+    )
+    db_session.add(doc)
+    suggestions = [
+        AISuggestion(
+            id=uuid4(), tenant_id=admin_user.tenant_id, document_id=doc.id, type=SuggestionType.risk,
+            content={}, rationale="r", source_reference="s", status=status,
+        )
+        for status in (SuggestionStatus.pending, SuggestionStatus.pending, SuggestionStatus.rejected)
+    ]
+    db_session.add_all(suggestions)
+    await db_session.commit()
+
+    accepted, rejected, already_done = suggestions
+    response = await test_client.post(
+        "/api/v1/suggestions/triage",
+        json={"items": [
+            {"suggestion_id": str(accepted.id), "status": "pending_review", "bpo_id": str(admin_user.id)},
+            {"suggestion_id": str(rejected.id), "status": "rejected"},
+            {"suggestion_id": str(already_done.id), "status": "pending_review"},
+        ]},
+        headers=admin_token_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["updated"], data["skipped"]) == (2, 1)
+    assert [r["success"] for r in data["results"]] == [True, True, False]
+
+    for suggestion in suggestions:
+        await db_session.refresh(suggestion)
+    assert accepted.status == SuggestionStatus.pending_review
+    assert accepted.assigned_bpo_id == admin_user.id
+    assert rejected.status == SuggestionStatus.rejected
+
+    audit_actions = (await db_session.execute(
+        select(AuditLog.action).where(AuditLog.entity_id.in_([accepted.id, rejected.id, already_done.id]))
+    )).scalars().all()
+    assert sorted(audit_actions) == ["SUGGESTION_PENDING_REVIEW", "SUGGESTION_REJECTED"]
+
+    queued = (await db_session.execute(
+        select(NotificationOutbox).where(NotificationOutbox.recipient_id == admin_user.id)
+    )).scalars().all()
+    assert [n.payload["suggestion_id"] for n in queued] == [str(accepted.id)]
+
+
+@pytest.mark.asyncio
+async def test_triage_rejects_non_triage_status(test_client, admin_token_headers):
+    response = await test_client.post(
+        "/api/v1/suggestions/triage",
+        json={"items": [{"suggestion_id": str(uuid4()), "status": "active"}]},
+        headers=admin_token_headers,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_suggestions_hidden_while_document_is_analysed(test_client, db_session, admin_user, admin_token_headers):
+    """A retried analysis replaces the suggestions it streamed so far, so they cannot be triaged yet."""
+    from app.models.document import Document, DocumentStatus
+    from app.models.suggestion import AISuggestion
+
+    doc = Document(
+        id=uuid4(), filename="Reg", storage_path="/tmp/reg.pdf", uploaded_by=admin_user.id,
+        tenant_id=admin_user.tenant_id, status=DocumentStatus.processing,
+    )
+    suggestion = AISuggestion(
+        id=uuid4(), tenant_id=admin_user.tenant_id, document_id=doc.id, type=SuggestionType.risk,
+        content={}, rationale="r", source_reference="s", status=SuggestionStatus.pending,
+    )
+    db_session.add_all([doc, suggestion])
+    await db_session.commit()
+
+    listed = await test_client.get("/api/v1/suggestions", headers=admin_token_headers)
+    assert str(suggestion.id) not in [s["id"] for s in listed.json()]
+    triage = await test_client.post(
+        "/api/v1/suggestions/triage",
+        json={"items": [{"suggestion_id": str(suggestion.id), "status": "rejected"}]},
+        headers=admin_token_headers,
+    )
+    assert triage.json()["updated"] == 0
+    update = await test_client.patch(
+        f"/api/v1/suggestions/{suggestion.id}/status", json={"status": "rejected"}, headers=admin_token_headers
+    )
+    assert update.status_code == 404
+
+    doc.status = DocumentStatus.completed
+    await db_session.commit()
+    listed = await test_client.get("/api/v1/suggestions", headers=admin_token_headers)
+    assert str(suggestion.id) in [s["id"] for s in listed.json()]
+
+
+@pytest.mark.asyncio
+async def test_list_suggestions_only_returns_own_tenant(test_client, db_session, admin_user, admin_token_headers):
+    """Listing filters on AISuggestion.tenant_id, not on the document or uploader."""
+    from app.models.document import Document, DocumentStatus
+    from app.models.suggestion import AISuggestion
+
+    other_tenant = uuid4()
+    doc = Document(
+        id=uuid4(), filename="Reg", storage_path="/tmp/reg.pdf", uploaded_by=admin_user.id,
+        tenant_id=admin_user.tenant_id, status=DocumentStatus.completed,
+    )
+    own, foreign = (
+        AISuggestion(
+            id=uuid4(), tenant_id=tenant_id, document_id=doc.id, type=SuggestionType.risk,
+            content={}, rationale="r", source_reference="s", status=SuggestionStatus.pending,
+        )
+        for tenant_id in (admin_user.tenant_id, other_tenant)
+    )
+    db_session.add_all([doc, own, foreign])
+    await db_session.commit()
+
+    response = await test_client.get("/api/v1/suggestions", headers=admin_token_headers)
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()] == [str(own.id)]
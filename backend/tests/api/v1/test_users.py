@@ -22,3 +22,43 @@ async def test_update_role_endpoint_structure():
         user_id = uuid4()
         response = await ac.put(f"/api/v1/users/{user_id}/role", json={"role": "admin"})
         assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_list_users_filters_by_role_mask(test_client, db_session, admin_user, admin_token_headers):
+    from fastapi_users.password import PasswordHelper
+    from app.models.user import ROLE_BITS, User
+
+    colleagues = [
+        User(
+            id=uuid4(),
+            email=f"{name}@example.com",
+            hashed_password=PasswordHelper().hash("Password123!"),
+            roles=roles,
+            tenant_id=admin_user.tenant_id,
+        )
+        for name, roles in [("reviewer", ["bpo", "executive"]), ("reader", ["general_user"])]
+    ]
+    db_session.add_all(colleagues)
+    await db_session.commit()
+    assert colleagues[0].role_mask == ROLE_BITS["bpo"] | ROLE_BITS["executive"]
+
+    response = await test_client.get("/api/v1/users?role=bpo", headers=admin_token_headers)
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()] == ["reviewer@example.com"]
+
+    response = await test_client.get("/api/v1/users?role=unknown", headers=admin_token_headers)
+    assert response.json() == []
+
+    # Role changes keep the mask in sync
+    colleagues[1].roles = ["bpo"]
+    await db_session.commit()
+    response = await test_client.get("/api/v1/users?role=bpo", headers=admin_token_headers)
+    assert {user["email"] for user in response.json()} == {"reviewer@example.com", "reader@example.com"}
+
+
+def test_has_role_rejects_unknown_roles():
+    from app.core.deps import has_role
+
+    with pytest.raises(ValueError):
+        has_role(["admin", "superuser"])
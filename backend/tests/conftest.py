@@ -1,9 +1,11 @@
 import uuid
+from contextlib import contextmanager
 from unittest.mock import patch
 from datetime import datetime, timedelta, timezone
 from jose import jwt
 
 from httpx import AsyncClient, ASGITransport
+import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from fastapi_users.db import SQLAlchemyUserDatabase
@@ -13,8 +15,10 @@ from fastapi_users.password import PasswordHelper
 from app.config import settings
 from app.models import User, Base
 
+from app.core.query_profiler import capture_queries
 from app.database import get_user_db, get_async_session
 from app.main import app
+from app.services.audit_service import audit_queue
 from app.users import get_jwt_strategy, auth_backend # Import auth_backend here
 
 
@@ -30,6 +34,45 @@ from app.users import get_jwt_strategy, auth_backend # Import auth_backend here
 # Removed:         yield
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Enforce @pytest.mark.query_budget(n) over the test body (fixtures excluded)."""
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+    with capture_queries() as profile:
+        outcome = yield
+    if outcome.excinfo is None and profile.count > marker.args[0]:
+        pytest.fail(
+            f"Query budget exceeded: {profile.count} > {marker.args[0]}\n"
+            f"{profile.summary(threshold=2)}",
+            pytrace=False,
+        )
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager failing the test if the block runs more than ``n`` statements.
+
+        with query_budget(3):
+            await test_client.get("/api/v1/documents", headers=headers)
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        with capture_queries() as profile:
+            yield profile
+        if profile.count > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {profile.count} > {max_queries}\n"
+                f"{profile.summary(threshold=2)}",
+                pytrace=False,
+            )
+
+    return budget
+
+
 @pytest_asyncio.fixture(scope="function")
 async def engine():
     """Create a fresh test database engine for each test function."""
@@ -84,11 +127,17 @@ async def test_client(db_session):
     app.dependency_overrides[get_user_db] = override_get_user_db
     app.dependency_overrides[get_async_session] = override_get_async_session
 
+    # Queued (non-critical) audit events go to the test database too
+    queue_session_factory = audit_queue.session_factory
+    audit_queue.session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://localhost:8000"
     ) as client:
         yield client
 
+    await audit_queue.close()
+    audit_queue.session_factory = queue_session_factory
     app.dependency_overrides.clear()
 
 
@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 from fastapi_users.router import ErrorCode
 from sqlalchemy import select
+from app.config import settings
 from app.models import User
 
 
@@ -100,3 +101,13 @@ class TestPasswordValidation:
         assert response.status_code == status.HTTP_201_CREATED
         assert user is not None
         assert user.email == "user@1.com"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cors_exposes_next_cursor_header(test_client):
+    """Cross-origin clients can read the keyset pagination cursor."""
+    origin = sorted(settings.CORS_ORIGINS)[0]
+    response = await test_client.get("/api/v1/documents/", headers={"Origin": origin})
+
+    assert response.headers["access-control-allow-origin"] == origin
+    assert "X-Next-Cursor" in response.headers["access-control-expose-headers"]
@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from app.services.ai_service import AIService, AnalysisResult, Suggestion
+from openai.types import CompletionUsage
+from app.services.ai_service import AIService, AnalysisResult, Suggestion, split_sections
 from app.config import settings
 import json
 
@@ -58,3 +60,161 @@ async def test_analyze_document_missing_key():
         service = AIService()
         with pytest.raises(ValueError, match="OPENAI_API_KEY is not set"):
             await service.analyze_document("Test text")
+
+
+def _completion(payload: dict, tokens: int = 10) -> MagicMock:
+    completion = MagicMock()
+    completion.choices = [MagicMock(message=MagicMock(content=json.dumps(payload)))]
+    completion.model = "gpt-4o-mini"
+    completion.usage = CompletionUsage(prompt_tokens=tokens, completion_tokens=1, total_tokens=tokens + 1)
+    return completion
+
+
+def test_split_sections_breaks_at_headings():
+    pages = ["Preamble\n" + "intro\n" * 20, "Article 1 Scope\n" + "a\n" * 30, "Article 2 Duties\n" + "b\n" * 10]
+    sections = split_sections(pages, max_chars=200)
+
+    assert "".join(sections) == "\n".join(pages)
+    assert all(len(section) <= 200 for section in sections)
+    assert sections[1].startswith("Article 1 Scope")
+
+
+@pytest.mark.asyncio
+async def test_classify_document_reads_only_opening_pages():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(
+        return_value=_completion(
+            {"classification": {"document_type": "Regulation", "framework_name": "Art. 32",
+                                "framework_description": "Security", "parent_law_name": "GDPR"}}
+        )
+    )
+    pages = ["Cover page", "Recitals", "Article 5 Principles\nbody text", "Article 32 Security\nmore body"]
+
+    with patch.object(settings, "AI_CLASSIFY_MAX_PAGES", 2):
+        result = await AIService(client=mock_client).classify_document(pages)
+
+    assert result.classification.parent_law_name == "GDPR"
+    assert result.usage.total_tokens == 11
+    kwargs = mock_client.chat.completions.create.await_args.kwargs
+    prompt = kwargs["messages"][1]["content"]
+    assert "Recitals" in prompt and "Article 32 Security" in prompt and "more body" not in prompt
+    assert kwargs["model"] == settings.AI_CLASSIFY_MODEL
+
+
+@pytest.mark.asyncio
+async def test_extract_suggestions_runs_sections_concurrently():
+    running, peak = 0, 0
+
+    async def create(**kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        section = kwargs["messages"][1]["content"].split(":", 1)[0]
+        return _completion(
+            {"suggestions": [
+                {"type": "control", "content": {"name": "Access review"}, "rationale": "r", "source_reference": section},
+                {"type": "risk", "content": {"name": f"Risk of {section}"}, "rationale": "r", "source_reference": section},
+            ]}
+        )
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = create
+    done = []
+
+    async def on_section_done(count):
+        done.append(count)
+
+    with patch.object(settings, "AI_EXTRACTION_CONCURRENCY", 2):
+        result = await AIService(client=mock_client).extract_suggestions(
+            ["one", "two", "three"], on_section_done=on_section_done
+        )
+
+    assert peak == 2
+    assert sorted(done) == [1, 2, 3]
+    # The control repeated by every section is kept once, from the first section
+    names = [suggestion.content["name"] for suggestion in result.suggestions]
+    assert names.count("Access review") == 1
+    assert result.suggestions[0].source_reference == "Section 1 of 3"
+    assert len(result.suggestions) == 4
+    assert result.usage.total_tokens == 33
+
+
+
+@pytest.mark.asyncio
+async def test_extract_suggestions_raises_the_failing_section_error():
+    async def create(**kwargs):
+        if kwargs["messages"][1]["content"].startswith("Section 2"):
+            raise TimeoutError("section timed out")
+        await asyncio.sleep(0.01)
+        return _completion({"suggestions": []})
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = create
+
+    # The section's own exception, not the TaskGroup's ExceptionGroup
+    with pytest.raises(TimeoutError, match="section timed out"):
+        await AIService(client=mock_client).extract_suggestions(["one", "two", "three"])
+
+def _stream(content: str, piece: int = 7, tokens: int = 10):
+    """A streamed completion delivering ``content`` in ``piece``-sized deltas, then the usage chunk."""
+
+    async def chunks():
+        for start in range(0, len(content), piece):
+            yield MagicMock(
+                model="gpt-4o-mini", usage=None,
+                choices=[MagicMock(delta=MagicMock(content=content[start:start + piece]))],
+            )
+        yield MagicMock(
+            model="gpt-4o-mini", choices=[],
+            usage=CompletionUsage(prompt_tokens=tokens, completion_tokens=1, total_tokens=tokens + 1),
+        )
+
+    return chunks()
+
+
+@pytest.mark.asyncio
+async def test_analyze_document_streams_suggestions_as_they_close():
+    content = json.dumps({
+        "classification": {"document_type": "Law", "framework_name": "Act {\"2024\"}", "framework_description": "d"},
+        "suggestions": [
+            {"type": "risk", "content": {"name": "Leak [of] {data}"}, "rationale": "r \\ \"q\"", "source_reference": "S1"},
+            {"type": "control", "content": {"name": "Review"}, "rationale": "r", "source_reference": "S2"},
+        ],
+    })
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=_stream(content))
+    received = []
+
+    async def on_suggestion(suggestion):
+        received.append(suggestion)
+
+    result = await AIService(client=mock_client).analyze_document("text", on_suggestion=on_suggestion)
+
+    assert [s.content["name"] for s in received] == ["Leak [of] {data}", "Review"]
+    assert received[0].rationale == 'r \\ "q"'
+    assert result.suggestions == received
+    assert result.classification.framework_name == 'Act {"2024"}'
+    assert result.usage.total_tokens == 11
+    assert mock_client.chat.completions.create.await_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_analyze_document_keeps_valid_prefix():
+    items = [
+        {"type": "risk", "content": {"name": "One"}, "rationale": "r", "source_reference": "S1"},
+        {"type": "not-a-type", "content": {}, "rationale": "r", "source_reference": "S2"},
+        {"type": "control", "content": {"name": "Three"}, "rationale": "r", "source_reference": "S3"},
+    ]
+    # Truncated mid-way through a fourth element
+    content = json.dumps({"suggestions": items})[:-2] + ', {"type": "risk", "content": {"na'
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=_stream(content, piece=3))
+
+    async def on_suggestion(suggestion):
+        pass
+
+    result = await AIService(client=mock_client).analyze_document("text", on_suggestion=on_suggestion)
+
+    assert [s.content["name"] for s in result.suggestions] == ["One", "Three"]
@@ -6,7 +6,8 @@ from sqlalchemy import select
 from app.services.assessment_service import AssessmentService
 from app.models.suggestion import AISuggestion, SuggestionStatus, SuggestionType
 from app.models.user import User
-from app.schemas.assessment import ResidualRisk
+from app.schemas.assessment import BulkAssessmentItem, ResidualRisk
+from app.models.audit_log import AuditLog
 from app.models.compliance import BusinessProcess, Risk, Control
 from app.models.document import Document
 
@@ -54,7 +55,8 @@ async def test_approve_suggestion(db_session: AsyncSession):
 
         storage_path="/tmp/doc.pdf",
 
-        uploaded_by=bpo_user.id
+        uploaded_by=bpo_user.id,
+        tenant_id=bpo_user.tenant_id,
 
     )
 
@@ -196,7 +198,8 @@ async def test_discard_suggestion(db_session: AsyncSession):
 
         storage_path="/tmp/doc2.pdf",
 
-        uploaded_by=bpo_user.id
+        uploaded_by=bpo_user.id,
+        tenant_id=bpo_user.tenant_id,
 
     )
 
@@ -259,3 +262,113 @@ async def test_discard_suggestion(db_session: AsyncSession):
     updated_suggestion = await db_session.get(AISuggestion, suggestion.id)
 
     assert updated_suggestion.status == SuggestionStatus.archived
+
+
+@pytest.mark.asyncio
+async def test_bulk_assess_reports_per_item_outcomes(db_session: AsyncSession):
+    # Setup
+    tenant_id = uuid4()
+    bpo_user = User(id=uuid4(), email="bpo3@example.com", hashed_password="hashed", roles=["bpo"], tenant_id=tenant_id)
+    db_session.add(bpo_user)
+    doc = Document(id=uuid4(), filename="Bulk Doc", storage_path="/tmp/bulk.pdf", uploaded_by=bpo_user.id, tenant_id=bpo_user.tenant_id)
+    db_session.add(doc)
+
+    def make_suggestion(name, status=SuggestionStatus.pending_review):
+        suggestion = AISuggestion(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            document_id=doc.id,
+            type=SuggestionType.risk,
+            content={"business_process_name": f"{name} Process", "risk_name": f"{name} Risk", "control_name": f"{name} Control"},
+            rationale="Because",
+            source_reference="Ref",
+            status=status,
+            assigned_bpo_id=bpo_user.id
+        )
+        db_session.add(suggestion)
+        return suggestion
+
+    to_approve = make_suggestion("Bulk A")
+    to_discard = make_suggestion("Bulk B")
+    already_active = make_suggestion("Bulk C", status=SuggestionStatus.active)
+    await db_session.commit()
+
+    items = [
+        BulkAssessmentItem(suggestion_id=to_approve.id, action="approve", residual_risk="high",
+                           edited_business_process="Edited Process"),
+        BulkAssessmentItem(suggestion_id=to_discard.id, action="discard"),
+        BulkAssessmentItem(suggestion_id=already_active.id, action="discard"),
+        BulkAssessmentItem(suggestion_id=uuid4(), action="discard"),
+    ]
+
+    # Action
+    response = await AssessmentService.bulk_assess(
+        db=db_session, items=items, actor_id=bpo_user.id, tenant_id=tenant_id
+    )
+
+    # Assertions
+    assert (response.succeeded, response.failed) == (2, 2)
+    approved, discarded, conflict, missing = response.results
+    assert approved.updated_status == "active"
+    assert discarded.updated_status == "archived"
+    assert "expected 'pending_review'" in conflict.message
+    assert not missing.success
+
+    await db_session.refresh(to_approve)
+    await db_session.refresh(to_discard)
+    assert to_approve.status == SuggestionStatus.active
+    assert to_discard.status == SuggestionStatus.archived
+
+    bp = (await db_session.execute(
+        select(BusinessProcess).where(BusinessProcess.id == approved.active_record_ids["business_process_id"])
+    )).scalar_one()
+    assert bp.name == "Edited Process"
+    risk = await db_session.get(Risk, approved.active_record_ids["risk_id"])
+    assert risk.category == "high"
+
+    audit = await db_session.get(AuditLog, approved.audit_log_id)
+    assert audit.action == "approve_suggestion"
+    assert audit.changes["edits"]["business_process"]["new"] == "Edited Process"
+
+
+@pytest.mark.asyncio
+async def test_bulk_assess_applies_only_first_action_per_suggestion(db_session: AsyncSession):
+    # Setup
+    tenant_id = uuid4()
+    bpo_user = User(id=uuid4(), email="bpo4@example.com", hashed_password="hashed", roles=["bpo"], tenant_id=tenant_id)
+    db_session.add(bpo_user)
+    doc = Document(id=uuid4(), filename="Dup Doc", storage_path="/tmp/dup.pdf", uploaded_by=bpo_user.id, tenant_id=bpo_user.tenant_id)
+    db_session.add(doc)
+    suggestion = AISuggestion(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        document_id=doc.id,
+        type=SuggestionType.risk,
+        content={"business_process_name": "Dup Process", "risk_name": "Dup Risk", "control_name": "Dup Control"},
+        rationale="Because",
+        source_reference="Ref",
+        status=SuggestionStatus.pending_review,
+        assigned_bpo_id=bpo_user.id
+    )
+    db_session.add(suggestion)
+    await db_session.commit()
+
+    # The first action fails its checks; the later discard must not be applied instead
+    items = [
+        BulkAssessmentItem(suggestion_id=suggestion.id, action="approve"),
+        BulkAssessmentItem(suggestion_id=suggestion.id, action="discard"),
+    ]
+
+    # Action
+    response = await AssessmentService.bulk_assess(
+        db=db_session, items=items, actor_id=bpo_user.id, tenant_id=tenant_id
+    )
+
+    # Assertions
+    assert (response.succeeded, response.failed) == (0, 2)
+    first, duplicate = response.results
+    assert first.message == "Residual risk is required for approve action"
+    assert "appears more than once" in duplicate.message
+
+    await db_session.refresh(suggestion)
+    assert suggestion.status == SuggestionStatus.pending_review
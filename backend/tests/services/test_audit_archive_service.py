@@ -0,0 +1,114 @@
+import gzip
+import json
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.audit_log import AuditLog, AuditLogArchive
+from app.services.audit_archive_service import (
+    AuditArchiveService,
+    LocalArchiveStore,
+    month_start,
+    partition_name,
+    shift_month,
+)
+
+
+def test_month_helpers():
+    assert shift_month(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert shift_month(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_name(date(2026, 3, 1)) == "audit_logs_y2026m03"
+
+
+async def _seed(db_session, actor_id):
+    this_month = month_start(datetime.utcnow().date())
+    old_month = shift_month(this_month, -30)
+    entity_id = uuid4()
+    entries = [
+        AuditLog(action="UPDATE", entity_type="Risk", entity_id=entity_id, actor_id=actor_id,
+                 changes={"n": 1}, created_at=datetime.combine(old_month, datetime.min.time()) + timedelta(days=2)),
+        AuditLog(action="DELETE", entity_type="Risk", entity_id=uuid4(), actor_id=actor_id,
+                 created_at=datetime.combine(old_month, datetime.min.time()) + timedelta(days=5)),
+        AuditLog(action="UPDATE", entity_type="Risk", entity_id=entity_id, actor_id=actor_id,
+                 created_at=datetime.combine(shift_month(old_month, 3), datetime.min.time())),
+        AuditLog(action="UPDATE", entity_type="Risk", entity_id=entity_id, actor_id=actor_id,
+                 created_at=datetime.utcnow()),
+    ]
+    db_session.add_all(entries)
+    await db_session.commit()
+    return old_month, entity_id
+
+
+@pytest.mark.asyncio
+async def test_archive_expired_exports_then_removes_months(db_session: AsyncSession, admin_user, tmp_path):
+    old_month, entity_id = await _seed(db_session, admin_user.id)
+    store = LocalArchiveStore(str(tmp_path))
+
+    archived = await AuditArchiveService.archive_expired(db_session, store, retention_months=24)
+
+    assert archived[old_month] == 2
+    assert archived[shift_month(old_month, 3)] == 1
+    assert sum(archived.values()) == 3
+    remaining = (await db_session.execute(select(AuditLog))).scalars().all()
+    assert len(remaining) == 1
+
+    manifest = (
+        await db_session.execute(select(AuditLogArchive).where(AuditLogArchive.month == old_month))
+    ).scalar_one()
+    lines = gzip.decompress((tmp_path / manifest.object_path).read_bytes()).splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["UPDATE", "DELETE"]
+
+    # Nothing left to archive on the next run
+    assert await AuditArchiveService.archive_expired(db_session, store, retention_months=24) == {}
+
+    history = await AuditArchiveService.read_archived(
+        db_session, store, since=datetime.combine(old_month, datetime.min.time()),
+        until=datetime.utcnow(), entity_id=entity_id,
+    )
+    assert [entry["created_at"][:7] for entry in history] == [
+        old_month.isoformat()[:7], shift_month(old_month, 3).isoformat()[:7]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_audit_log_api_reads_archive_on_request(
+    test_client, db_session: AsyncSession, admin_user, admin_token_headers, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUDIT_ARCHIVE_DIR", str(tmp_path))
+    _, entity_id = await _seed(db_session, admin_user.id)
+    await AuditArchiveService.archive_expired(db_session, LocalArchiveStore(str(tmp_path)), retention_months=24)
+
+    live = await test_client.get(f"/api/v1/audit-logs?entity_id={entity_id}", headers=admin_token_headers)
+    assert len(live.json()) == 1
+
+    # Archives are read into memory, so the range must be bounded
+    unbounded = await test_client.get(
+        f"/api/v1/audit-logs?entity_id={entity_id}&include_archived=true", headers=admin_token_headers
+    )
+    assert unbounded.status_code == 400
+    until = datetime.utcnow() + timedelta(days=1)
+    too_wide = await test_client.get(
+        "/api/v1/audit-logs",
+        params={"entity_id": str(entity_id), "include_archived": "true",
+                "since": (until - timedelta(days=settings.AUDIT_ARCHIVE_MAX_READ_DAYS + 1)).isoformat(),
+                "until": until.isoformat()},
+        headers=admin_token_headers,
+    )
+    assert too_wide.status_code == 400
+
+    old_month = shift_month(month_start(datetime.utcnow().date()), -30)
+    full = await test_client.get(
+        "/api/v1/audit-logs",
+        params={"entity_id": str(entity_id), "include_archived": "true",
+                "since": datetime.combine(old_month, datetime.min.time()).isoformat(),
+                "until": datetime.combine(shift_month(old_month, 4), datetime.min.time()).isoformat()},
+        headers=admin_token_headers,
+    )
+    assert full.status_code == 200
+    created = [entry["created_at"] for entry in full.json()]
+    assert len(created) == 2
+    assert created == sorted(created, reverse=True)
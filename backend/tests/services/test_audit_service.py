@@ -1,6 +1,6 @@
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
-from app.services.audit_service import AuditService
+from unittest.mock import AsyncMock
+from app.services.audit_service import AuditQueue, AuditService, AuditWriter
 from app.models.audit_log import AuditLog
 from uuid import uuid4
 
@@ -50,3 +50,87 @@ async def test_log_action_success():
     assert log.actor_id == actor_id
     assert log.action == "UPDATE"
     assert log.changes["field"]["new"] == "b"
+
+def test_calculate_diff_as_patch():
+    """JSON-patch diffs keep only new values and recurse into nested dicts."""
+    old_obj = MockObj(name="Old", content={"risk": "a", "control": "b"}, owner="x")
+    new_data = {"name": "New", "content": {"risk": "a", "control": "c", "extra": 1}, "owner": "x"}
+
+    ops = AuditService.calculate_diff(old_obj, new_data, as_patch=True)
+
+    assert ops == [
+        {"op": "replace", "path": "/name", "value": "New"},
+        {"op": "replace", "path": "/content/control", "value": "c"},
+        {"op": "add", "path": "/content/extra", "value": 1},
+    ]
+
+
+def test_json_patch_remove_and_escape():
+    ops = AuditService.json_patch({"a/b": 1, "gone": 2}, {"a/b": 3})
+    assert ops == [
+        {"op": "remove", "path": "/gone"},
+        {"op": "replace", "path": "/a~1b", "value": 3},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_audit_writer_inserts_on_commit_and_discards_on_rollback(db_session, admin_user):
+    """Buffered entries are written by the commit and dropped by a rollback."""
+    from sqlalchemy import select
+
+    kept = [
+        AuditWriter.record(db_session, admin_user.id, "UPDATE", "Risk", uuid4(), changes=[{"op": "add", "path": "/a", "value": i}])
+        for i in range(3)
+    ]
+    await db_session.commit()
+
+    dropped = AuditWriter.record(db_session, admin_user.id, "DELETE", "Risk", uuid4())
+    await db_session.rollback()
+    await db_session.commit()
+
+    ids = (await db_session.execute(select(AuditLog.id))).scalars().all()
+    assert set(ids) == set(kept)
+    assert dropped not in ids
+
+
+@pytest.mark.asyncio
+async def test_audit_writer_drops_entries_of_rolled_back_savepoint(db_session, admin_user):
+    from sqlalchemy import select
+
+    kept = AuditWriter.record(db_session, admin_user.id, "UPDATE", "Risk", uuid4())
+    savepoint = await db_session.begin_nested()
+    dropped = AuditWriter.record(db_session, admin_user.id, "DELETE", "Risk", uuid4())
+    await savepoint.rollback()
+    released = await db_session.begin_nested()
+    also_kept = AuditWriter.record(db_session, admin_user.id, "CREATE", "Risk", uuid4())
+    await released.commit()
+    await db_session.commit()
+
+    ids = (await db_session.execute(select(AuditLog.id))).scalars().all()
+    assert set(ids) == {kept, also_kept}
+    assert dropped not in ids
+
+
+@pytest.mark.asyncio
+async def test_audit_queue_writes_in_background(engine):
+    """Queued events are written by the background task; a full queue drops events."""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.models.user import User
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    actor = User(id=uuid4(), email="queue@example.com", hashed_password="x", roles=["admin"], tenant_id=uuid4())
+    async with session_factory() as db:
+        db.add(actor)
+        await db.commit()
+
+    queue = AuditQueue(maxsize=2, batch_size=10, session_factory=session_factory)
+    assert queue.put(actor.id, "VIEW", "Report", uuid4())
+    assert queue.put(actor.id, "VIEW", "Report", uuid4())
+    assert not queue.put(actor.id, "VIEW", "Report", uuid4())
+    await queue.close()
+
+    async with session_factory() as db:
+        actions = (await db.execute(select(AuditLog.action))).scalars().all()
+    assert actions == ["VIEW", "VIEW"]
+    assert queue.dropped == 1
@@ -0,0 +1,138 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.compliance import BusinessProcess, Control, RegulatoryFramework, RegulatoryRequirement, Risk
+from app.models.compliance_summary import TenantActivityCounter, TenantComplianceSummary
+from app.models.suggestion import AISuggestion, SuggestionStatus, SuggestionType
+from app.services.compliance_summary_service import ComplianceSummaryService, compute_compliance_score
+from app.services.dashboard_service import DashboardService
+from app.services.mapping_service import MappingService
+
+
+def test_compute_compliance_score_weights_available_components():
+    assert compute_compliance_score(0, 0, 0, 0, 0, 0, 0) is None
+    # Only coverage known: 1 of 4 requirements mapped
+    assert compute_compliance_score(4, 1, 0, 0, 0, 0, 0) == 25
+    # coverage 0.5 (w .5), residual risk 1 - (1 high + .5 medium) / 4 rated (w .3), fresh backlog 0.0 (w .2)
+    assert compute_compliance_score(2, 1, 1, 1, 2, 1, 1) == 44
+    # Only low residual risks: no exposure
+    assert compute_compliance_score(0, 0, 0, 0, 3, 0, 0) == 100
+
+
+async def _seed_tenant(db_session: AsyncSession):
+    tenant_id = uuid4()
+    admin = User(
+        id=uuid4(), email=f"summary_{tenant_id.hex[:8]}@example.com", hashed_password="hashed",
+        is_active=True, is_verified=True, roles=["admin"], tenant_id=tenant_id,
+    )
+    process = BusinessProcess(id=uuid4(), tenant_id=tenant_id, name="Payments", owner_id=admin.id)
+    control = Control(id=uuid4(), tenant_id=tenant_id, name="Review", owner_id=admin.id, process_id=process.id)
+    frameworks = [RegulatoryFramework(id=uuid4(), tenant_id=tenant_id, name=name) for name in ("DORA", "NIS2")]
+    requirements = [
+        RegulatoryRequirement(id=uuid4(), tenant_id=tenant_id, framework_id=framework.id, name="Art 1")
+        for framework in frameworks
+    ]
+    risks = [
+        Risk(id=uuid4(), tenant_id=tenant_id, name="Fraud", owner_id=admin.id, category="high"),
+        Risk(id=uuid4(), tenant_id=tenant_id, name="Outage", owner_id=admin.id, category="Low"),
+        Risk(id=uuid4(), tenant_id=tenant_id, name="Unrated", owner_id=admin.id, category="Operational"),
+    ]
+    stale = AISuggestion(
+        id=uuid4(), tenant_id=tenant_id, document_id=uuid4(), type=SuggestionType.risk,
+        content={}, rationale="r", source_reference="s", status=SuggestionStatus.pending,
+        created_at=datetime.utcnow() - timedelta(days=60),
+    )
+    db_session.add_all([admin, process, control, *frameworks, *requirements, *risks, stale])
+    await db_session.commit()
+    return tenant_id, admin, control, frameworks
+
+
+@pytest.mark.asyncio
+async def test_summary_maintained_on_writes_and_read_by_executive(db_session: AsyncSession):
+    """The first write builds the summary row; the executive cards read it back in one query."""
+    tenant_id, admin, control, frameworks = await _seed_tenant(db_session)
+
+    await MappingService.create_mapping(db_session, control.id, frameworks[0].id, tenant_id, admin.id)
+    await db_session.commit()
+
+    summary = await db_session.get(TenantComplianceSummary, tenant_id)
+    await db_session.refresh(summary)
+    assert (summary.requirements_total, summary.requirements_mapped) == (2, 1)
+    assert (summary.risks_total, summary.risks_high, summary.risks_medium, summary.risks_low) == (3, 1, 0, 1)
+    assert (summary.suggestions_backlog, summary.suggestions_stale) == (1, 1)
+    # coverage .5 * .5 + residual (1 - 1/2) * .3 + backlog 0 * .2
+    assert summary.compliance_score == 40
+
+    metrics = await DashboardService.get_metrics(db_session, admin.id, tenant_id, "executive")
+    cards = {card.card_id: card.metric for card in metrics.cards}
+    assert cards == {"risk_overview": 3, "compliance_status": 40, "recent_activity": 1}
+
+
+@pytest.mark.asyncio
+async def test_deltas_match_full_recompute(db_session: AsyncSession):
+    tenant_id, admin, control, frameworks = await _seed_tenant(db_session)
+    await ComplianceSummaryService.refresh(db_session, tenant_id)
+    await db_session.commit()
+
+    # Mapping the second framework covers its requirement: requirements_mapped += 1
+    await MappingService.create_mapping(db_session, control.id, frameworks[1].id, tenant_id, admin.id)
+    # A new medium risk and the stale suggestion leaving the backlog
+    risk = Risk(tenant_id=tenant_id, name="Leak", owner_id=admin.id, category="medium")
+    db_session.add(risk)
+    await db_session.flush()
+    await ComplianceSummaryService.record_change(db_session, tenant_id, risks=Risk.id == risk.id)
+    scope = AISuggestion.tenant_id == tenant_id
+    before = await ComplianceSummaryService.count(db_session, tenant_id, suggestions=scope)
+    suggestion = (await db_session.execute(AISuggestion.__table__.select().where(scope))).one()
+    await db_session.execute(
+        AISuggestion.__table__.update().where(AISuggestion.id == suggestion.id).values(status=SuggestionStatus.rejected)
+    )
+    await ComplianceSummaryService.record_change(db_session, tenant_id, before, suggestions=scope)
+    await db_session.commit()
+
+    summary = await db_session.get(TenantComplianceSummary, tenant_id)
+    await db_session.refresh(summary)
+    incremental = {key: getattr(summary, key) for key in ("requirements_mapped", "risks_total", "risks_medium",
+                                                        "suggestions_backlog", "suggestions_stale", "compliance_score")}
+    assert incremental == {
+        "requirements_mapped": 1, "risks_total": 4, "risks_medium": 1,
+        "suggestions_backlog": 0, "suggestions_stale": 0, "compliance_score": 50,
+    }
+
+    await ComplianceSummaryService.refresh(db_session, tenant_id)
+    await db_session.commit()
+    await db_session.refresh(summary)
+    assert {key: getattr(summary, key) for key in incremental} == incremental
+
+
+@pytest.mark.asyncio
+async def test_executive_cards_without_summary_row_do_not_write(db_session: AsyncSession):
+    tenant_id, admin, _, _ = await _seed_tenant(db_session)
+
+    metrics = await DashboardService.get_metrics(db_session, admin.id, tenant_id, "executive")
+
+    cards = {card.card_id: card.metric for card in metrics.cards}
+    assert cards["risk_overview"] == 3
+    assert await db_session.get(TenantComplianceSummary, tenant_id) is None
+    assert not db_session.new and not db_session.dirty
+
+
+@pytest.mark.asyncio
+async def test_recent_activity_covers_last_seven_utc_days(db_session: AsyncSession):
+    tenant_id, other_tenant = uuid4(), uuid4()
+    today = datetime.utcnow().date()
+    db_session.add_all([
+        TenantActivityCounter(tenant_id=tenant_id, bucket_date=today, events=1),
+        # Oldest day still inside the window
+        TenantActivityCounter(tenant_id=tenant_id, bucket_date=today - timedelta(days=6), events=2),
+        TenantActivityCounter(tenant_id=tenant_id, bucket_date=today - timedelta(days=7), events=4),
+        TenantActivityCounter(tenant_id=other_tenant, bucket_date=today, events=8),
+    ])
+    await db_session.commit()
+
+    assert await db_session.scalar(ComplianceSummaryService.recent_activity_query(tenant_id)) == 3
+    summary = await ComplianceSummaryService.compute_executive_summary(db_session, tenant_id)
+    assert summary["recent_activity"] == 3
@@ -67,6 +67,7 @@ async def test_get_metrics_bpo_role():
     mock_db.execute = AsyncMock(side_effect=[
         MockAsyncResult(7),  # pending_reviews
         MockAsyncResult(12),  # my_controls
+        MockAsyncResult(3),  # overdue_assessments
     ])
 
     metrics = await DashboardService.get_metrics(
@@ -95,6 +96,10 @@ async def test_get_metrics_bpo_role():
     my_controls_card = next(c for c in metrics.cards if c.card_id == "my_controls")
     assert my_controls_card.metric == 12
 
+    overdue_card = next(c for c in metrics.cards if c.card_id == "overdue_assessments")
+    assert overdue_card.metric == 3
+    assert overdue_card.status == "urgent"
+
 
 @pytest.mark.asyncio
 async def test_get_metrics_executive_role():
@@ -103,10 +108,10 @@ async def test_get_metrics_executive_role():
     user_id = uuid4()
     tenant_id = uuid4()
 
-    # Mock database query results for executive metrics
+    # Executive metrics are a single read of the tenant's compliance summary row
+    summary = MagicMock(risks_total=25, compliance_score=72, recent_activity=10)
     mock_db.execute = AsyncMock(side_effect=[
-        MockAsyncResult(25),  # total_risks
-        MockAsyncResult(10),  # recent_activity
+        MagicMock(one_or_none=lambda: summary),
     ])
 
     metrics = await DashboardService.get_metrics(
@@ -129,6 +134,8 @@ async def test_get_metrics_executive_role():
     # Verify risk overview count
     risk_card = next(c for c in metrics.cards if c.card_id == "risk_overview")
     assert risk_card.metric == 25
+    assert next(c for c in metrics.cards if c.card_id == "compliance_status").metric == 72
+    assert next(c for c in metrics.cards if c.card_id == "recent_activity").metric == 10
 
 
 @pytest.mark.asyncio
@@ -196,6 +203,7 @@ async def test_bpo_urgent_status_threshold():
     mock_db.execute = AsyncMock(side_effect=[
         MockAsyncResult(6),  # pending_reviews
         MockAsyncResult(5),  # my_controls
+        MockAsyncResult(0),  # overdue_assessments
     ])
 
     metrics = await DashboardService.get_metrics(
@@ -220,6 +228,7 @@ async def test_bpo_normal_status_threshold():
     mock_db.execute = AsyncMock(side_effect=[
         MockAsyncResult(3),  # pending_reviews
         MockAsyncResult(8),  # my_controls
+        MockAsyncResult(0),  # overdue_assessments
     ])
 
     metrics = await DashboardService.get_metrics(
@@ -0,0 +1,96 @@
+import pytest
+from uuid import uuid4
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.compliance import Control, RegulatoryFramework
+from app.models.audit_log import AuditLog
+from app.models.mapping import ControlRegulatoryRequirement
+from app.services.mapping_service import MappingService
+
+
+async def _seed(db_session: AsyncSession):
+    tenant_id = uuid4()
+    admin = User(
+        id=uuid4(),
+        email="mapping_admin@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        is_verified=True,
+        roles=["admin"],
+        tenant_id=tenant_id,
+    )
+    db_session.add(admin)
+    control = Control(id=uuid4(), tenant_id=tenant_id, name="Access Review", owner_id=admin.id)
+    framework = RegulatoryFramework(id=uuid4(), tenant_id=tenant_id, name="GDPR")
+    db_session.add_all([control, framework])
+    await db_session.commit()
+    return tenant_id, admin, control, framework
+
+
+@pytest.mark.asyncio
+async def test_create_mapping_returns_detail_from_insert(db_session: AsyncSession):
+    """Created mapping carries control/requirement names without a re-query of the control's mappings."""
+    tenant_id, admin, control, framework = await _seed(db_session)
+
+    # Pre-existing mappings on the same control must not affect the result
+    for _ in range(3):
+        other = RegulatoryFramework(id=uuid4(), tenant_id=tenant_id, name="Other")
+        db_session.add(other)
+        await db_session.flush()
+        db_session.add(
+            ControlRegulatoryRequirement(
+                control_id=control.id,
+                regulatory_requirement_id=other.id,
+                tenant_id=tenant_id,
+                created_by=admin.id,
+            )
+        )
+    await db_session.commit()
+
+    detail = await MappingService.create_mapping(
+        db_session, control.id, framework.id, tenant_id, admin.id
+    )
+    await db_session.commit()
+
+    assert detail.control_id == control.id
+    assert detail.regulatory_requirement_id == framework.id
+    assert detail.control_name == "Access Review"
+    assert detail.requirement_name == "GDPR"
+    assert detail.created_by == admin.id
+    assert detail.created_at is not None
+
+    audit = (
+        await db_session.execute(select(AuditLog).where(AuditLog.entity_id == detail.id))
+    ).scalar_one()
+    assert audit.action == "create_mapping"
+
+
+@pytest.mark.asyncio
+async def test_delete_mapping_audits_returned_id(db_session: AsyncSession):
+    """Delete uses the RETURNING id for the audit entry and 404s when nothing matched."""
+    tenant_id, admin, control, framework = await _seed(db_session)
+    detail = await MappingService.create_mapping(
+        db_session, control.id, framework.id, tenant_id, admin.id
+    )
+    await db_session.commit()
+
+    assert await MappingService.delete_mapping(
+        db_session, control.id, framework.id, tenant_id, admin.id
+    )
+    await db_session.commit()
+
+    actions = (
+        await db_session.execute(
+            select(AuditLog.action).where(AuditLog.entity_id == detail.id)
+        )
+    ).scalars().all()
+    assert "delete_mapping" in actions
+
+    with pytest.raises(HTTPException) as exc_info:
+        await MappingService.delete_mapping(
+            db_session, control.id, framework.id, tenant_id, admin.id
+        )
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,118 @@
+import asyncio
+from email import message_from_bytes
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.email import SMTPMailer
+from app.models.notification import NotificationOutbox
+from app.models.user import User
+from app.services.notification_service import NotificationService
+
+
+class SMTPSink:
+    """Minimal local SMTP server that accepts every message and keeps it in memory."""
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self._server = None
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        writer.write(b"220 sink ESMTP\r\n")
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                writer.write(b"250-sink\r\n250 8BITMIME\r\n")
+            elif command == "DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                data = await reader.readuntil(b"\r\n.\r\n")
+                self.messages.append(message_from_bytes(data[:-5]))
+                writer.write(b"250 OK\r\n")
+            elif command == "QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+class FailingMailer:
+    async def send(self, to, subject, body):
+        raise ConnectionError("mail server unavailable")
+
+
+async def _make_bpo(db_session, email):
+    user = User(id=uuid4(), email=email, hashed_password="hashed", roles=["bpo"], tenant_id=uuid4())
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_drain_sends_one_digest_per_recipient_over_one_connection(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "MAIL_FROM", "noreply@example.com")
+    alice = await _make_bpo(db_session, "alice@example.com")
+    bob = await _make_bpo(db_session, "bob@example.com")
+    await NotificationService.enqueue_bpo_assignments(
+        db_session, alice.tenant_id, {alice.id: [uuid4(), uuid4(), uuid4()], bob.id: [uuid4()]}
+    )
+    await db_session.commit()
+
+    async with SMTPSink() as sink:
+        async with SMTPMailer("127.0.0.1", sink.port, start_tls=False, use_tls=False, use_credentials=False) as mailer:
+            delivered = await NotificationService.drain(db_session, mailer)
+
+    assert delivered == 4
+    assert sink.connections == 1
+    subjects = {m["To"]: m["Subject"] for m in sink.messages}
+    assert subjects == {
+        "alice@example.com": "3 suggestions awaiting your review",
+        "bob@example.com": "1 suggestion awaiting your review",
+    }
+
+    pending = (await db_session.execute(
+        select(NotificationOutbox).where(NotificationOutbox.sent_at.is_(None))
+    )).scalars().all()
+    assert pending == []
+    assert await NotificationService.drain(db_session, FailingMailer()) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_digest_stays_pending_until_max_attempts(db_session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings, "NOTIFICATION_MAX_ATTEMPTS", 2)
+    carol = await _make_bpo(db_session, "carol@example.com")
+    await NotificationService.enqueue_bpo_assignments(db_session, carol.tenant_id, {carol.id: [uuid4()]})
+    await db_session.commit()
+
+    assert await NotificationService.drain(db_session, FailingMailer()) == 0
+    row = (await db_session.execute(
+        select(NotificationOutbox).where(NotificationOutbox.recipient_id == carol.id)
+    )).scalar_one()
+    await db_session.refresh(row)
+    assert (row.attempts, row.sent_at) == (1, None)
+    assert "unavailable" in row.last_error
+
+    await NotificationService.drain(db_session, FailingMailer())
+    await db_session.refresh(row)
+    assert row.attempts == 2
+    # Exhausted rows are no longer picked up
+    await NotificationService.drain(db_session, FailingMailer())
+    await db_session.refresh(row)
+    assert row.attempts == 2
@@ -0,0 +1,150 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.analysis_job import AnalysisJob, AnalysisJobStatus
+from app.models.document import Document, DocumentStatus
+from tasks.analysis import _process_document_async, _reap_expired_analyses_async
+
+
+def _document(uploader, status, lease_expires_at=None, next_attempt_at=None):
+    return Document(
+        id=uuid4(),
+        filename="doc.pdf",
+        storage_path="path/to/doc.pdf",
+        status=status,
+        uploaded_by=uploader.id,
+        tenant_id=uploader.tenant_id,
+        lease_owner=uuid4() if lease_expires_at else None,
+        lease_expires_at=lease_expires_at,
+        next_attempt_at=next_attempt_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reaper_reclaims_expired_leases(engine, db_session: AsyncSession, admin_user):
+    now = datetime.utcnow()
+    crashed = _document(admin_user, DocumentStatus.processing, lease_expires_at=now - timedelta(minutes=1))
+    exhausted = _document(admin_user, DocumentStatus.processing, lease_expires_at=now - timedelta(minutes=1))
+    alive = _document(admin_user, DocumentStatus.processing, lease_expires_at=now + timedelta(minutes=5))
+    due = _document(admin_user, DocumentStatus.pending, next_attempt_at=now - timedelta(seconds=1))
+    db_session.add_all([crashed, exhausted, alive, due])
+    db_session.add(AnalysisJob(document_id=crashed.id, status=AnalysisJobStatus.running))
+    for attempt in range(settings.ANALYSIS_MAX_ATTEMPTS):
+        db_session.add(AnalysisJob(
+            document_id=exhausted.id,
+            attempt=attempt + 1,
+            status=AnalysisJobStatus.running if attempt == settings.ANALYSIS_MAX_ATTEMPTS - 1 else AnalysisJobStatus.failed,
+        ))
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("tasks.analysis.async_session_maker", session_maker), \
+         patch("tasks.analysis.process_document") as mock_task:
+        result = await _reap_expired_analyses_async()
+
+    assert result == {"reclaimed": 1, "exhausted": 1, "requeued": 1}
+    mock_task.delay.assert_called_once_with(str(due.id))
+
+    for document in (crashed, exhausted, alive, due):
+        await db_session.refresh(document)
+    assert crashed.status == DocumentStatus.pending
+    assert crashed.lease_owner is None
+    # First retry waits the base backoff
+    expected = now + timedelta(seconds=settings.ANALYSIS_RETRY_BACKOFF_SECONDS)
+    assert abs((crashed.next_attempt_at - expected).total_seconds()) < 5
+    assert exhausted.status == DocumentStatus.failed
+    assert alive.status == DocumentStatus.processing
+    assert due.next_attempt_at is None
+
+    job = (await db_session.execute(
+        select(AnalysisJob).where(AnalysisJob.document_id == crashed.id)
+    )).scalar_one()
+    assert job.status == AnalysisJobStatus.failed
+    assert job.error_class == "LeaseExpired"
+
+
+@pytest.mark.asyncio
+async def test_process_skips_document_with_live_lease(engine, db_session: AsyncSession, admin_user):
+    """A redelivered task must not run alongside the attempt that holds the lease."""
+    document = _document(
+        admin_user, DocumentStatus.processing,
+        lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+    )
+    db_session.add(document)
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    mock_get_client = MagicMock()
+    with patch("tasks.analysis.async_session_maker", session_maker), \
+         patch("tasks.analysis.get_supabase_client", mock_get_client):
+        await _process_document_async(document.id)
+
+    mock_get_client.assert_not_called()
+    jobs = (await db_session.execute(
+        select(AnalysisJob).where(AnalysisJob.document_id == document.id)
+    )).scalars().all()
+    assert jobs == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, next_attempt_at", [
+    (DocumentStatus.completed, None),
+    (DocumentStatus.failed, None),
+    (DocumentStatus.pending, datetime.utcnow() + timedelta(minutes=5)),
+])
+async def test_process_skips_documents_not_due(engine, db_session: AsyncSession, admin_user, status, next_attempt_at):
+    """A redelivery after the retry finished (or before its backoff elapsed) does not run again."""
+    document = _document(admin_user, status, next_attempt_at=next_attempt_at)
+    db_session.add(document)
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    mock_get_client = MagicMock()
+    with patch("tasks.analysis.async_session_maker", session_maker), \
+         patch("tasks.analysis.get_supabase_client", mock_get_client):
+        await _process_document_async(document.id)
+
+    mock_get_client.assert_not_called()
+    await db_session.refresh(document)
+    assert document.status == status
+
+
+@pytest.mark.asyncio
+async def test_reprocess_claims_completed_document(engine, db_session: AsyncSession, admin_user):
+    document = _document(admin_user, DocumentStatus.completed)
+    db_session.add(document)
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("tasks.analysis.async_session_maker", session_maker), \
+         patch("tasks.analysis.get_supabase_client", return_value=None), \
+         patch("tasks.analysis.publish_progress"):
+        await _process_document_async(document.id, reprocess=True)
+
+    await db_session.refresh(document)
+    # Claimed and run; the missing storage client fails the attempt
+    assert document.status == DocumentStatus.failed
+
+
+@pytest.mark.asyncio
+async def test_failure_after_lost_lease_leaves_document_alone(engine, db_session: AsyncSession, admin_user):
+    document = _document(admin_user, DocumentStatus.pending)
+    db_session.add(document)
+    await db_session.commit()
+
+    heartbeat = MagicMock(lost=True)
+    heartbeat.stop = AsyncMock()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("tasks.analysis.async_session_maker", session_maker), \
+         patch("tasks.analysis.LeaseHeartbeat", return_value=heartbeat), \
+         patch("tasks.analysis.get_supabase_client", return_value=None), \
+         patch("tasks.analysis.publish_progress"):
+        await _process_document_async(document.id)
+
+    await db_session.refresh(document)
+    assert document.status == DocumentStatus.processing
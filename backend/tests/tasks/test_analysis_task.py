@@ -3,6 +3,14 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import uuid
 from app.models.document import Document, DocumentStatus
 from app.models.suggestion import AISuggestion
+from app.services.ai_service import (
+    AIService,
+    AnalysisResult,
+    ClassificationResult,
+    DocumentClassification,
+    Suggestion,
+    TokenUsage,
+)
 from tasks.analysis import _process_document_async
 
 @pytest.mark.asyncio
@@ -14,7 +22,8 @@ async def test_process_document_success():
         filename="test.pdf",
         storage_path="path/to/test.pdf",
         status=DocumentStatus.pending,
-        uploaded_by=uuid.uuid4() # Add missing field
+        uploaded_by=uuid.uuid4(), # Add missing field
+        tenant_id=uuid.uuid4(),
     )
     
     mock_user = MagicMock()
@@ -59,12 +68,18 @@ async def test_process_document_success():
     mock_suggestion.source_reference = "ref"
     mock_analysis_result.suggestions = [mock_suggestion]
     
+    async def analyze(text, on_suggestion=None):
+        await on_suggestion(mock_suggestion)
+        return mock_analysis_result
+
     mock_ai_service = AsyncMock()
-    mock_ai_service.analyze_document.return_value = mock_analysis_result
+    mock_ai_service.analyze_document.side_effect = analyze
 
     with patch("tasks.analysis.async_session_maker", return_value=mock_session_maker), \
          patch("tasks.analysis.get_supabase_client", return_value=mock_supabase), \
          patch("tasks.analysis.AIService", return_value=mock_ai_service), \
+         patch("tasks.analysis.settings.AI_TWO_STAGE_ANALYSIS", False), \
+         patch("tasks.analysis.ComplianceSummaryService.count", AsyncMock(return_value={})), \
          patch("pypdf.PdfReader", return_value=mock_reader):
          
         await _process_document_async(document_id)
@@ -90,7 +105,8 @@ async def test_process_document_failure():
         filename="test.txt", 
         storage_path="path", 
         status=DocumentStatus.pending,
-        uploaded_by=uuid.uuid4() # Add missing field
+        uploaded_by=uuid.uuid4(), # Add missing field
+        tenant_id=uuid.uuid4(),
     )
     
     mock_user = MagicMock()
@@ -118,4 +134,150 @@ async def test_process_document_failure():
         await _process_document_async(document_id)
         
         # Verify status update to failed
-        assert mock_document.status == DocumentStatus.failed
\ No newline at end of file
+        assert mock_document.status == DocumentStatus.failed
+
+@pytest.mark.asyncio
+async def test_process_document_two_stage():
+    """Classification is committed before the per-section extraction runs."""
+    document_id = uuid.uuid4()
+    tenant_id = uuid.uuid4()
+    mock_document = Document(
+        id=document_id,
+        filename="law.txt",
+        storage_path="path/to/law.txt",
+        status=DocumentStatus.pending,
+        uploaded_by=uuid.uuid4(),
+        tenant_id=tenant_id,
+    )
+
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()
+    mock_db.get.return_value = mock_document
+    mock_db.execute.return_value = MagicMock(rowcount=1, **{"scalars.return_value.first.return_value": None})
+    mock_db.scalar.return_value = 0
+    mock_session_maker = MagicMock()
+    mock_session_maker.__aenter__.return_value = mock_db
+    mock_session_maker.__aexit__.return_value = None
+
+    mock_storage = MagicMock()
+    mock_storage.download.return_value = b"Data Protection Act 2024\nArticle 1 Scope\nArticle 2 Duties"
+    mock_supabase = MagicMock()
+    mock_supabase.storage.from_.return_value = mock_storage
+
+    events = []
+    commits_before_extraction = []
+    commits_after_suggestion = []
+
+    suggestion = Suggestion(type="risk", content={"name": "Breach"}, rationale="r", source_reference="Article 2")
+
+    async def extract(sections, classification, on_section_done=None, on_suggestion=None):
+        commits_before_extraction.append(mock_db.commit.await_count)
+        await on_suggestion(suggestion)
+        # Saved and committed before the extraction has finished
+        commits_after_suggestion.append(mock_db.commit.await_count)
+        await on_section_done(1)
+        return AnalysisResult(
+            suggestions=[suggestion],
+            usage=TokenUsage(model="extract", prompt_tokens=100, completion_tokens=40, total_tokens=140),
+        )
+
+    mock_ai_service = MagicMock()
+    mock_ai_service.classify_document = AsyncMock(
+        return_value=ClassificationResult(
+            classification=DocumentClassification(
+                document_type="Law", framework_name="Data Protection Act", framework_description="Privacy"
+            ),
+            usage=TokenUsage(model="classify", prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+    )
+    mock_ai_service.extract_suggestions = AsyncMock(side_effect=extract)
+
+    async def publish(event):
+        events.append(event)
+
+    with patch("tasks.analysis.async_session_maker", return_value=mock_session_maker), \
+         patch("tasks.analysis.get_supabase_client", return_value=mock_supabase), \
+         patch("tasks.analysis.AIService", return_value=mock_ai_service), \
+         patch("tasks.analysis.FrameworkTreeService.invalidate", AsyncMock()) as invalidate, \
+         patch("tasks.analysis.publish_progress", side_effect=publish):
+
+        await _process_document_async(document_id)
+
+    assert mock_document.status == DocumentStatus.completed
+    mock_ai_service.classify_document.assert_awaited_once()
+    sections = mock_ai_service.extract_suggestions.await_args.args[0]
+    assert "".join(sections).startswith("Data Protection Act 2024")
+    # Framework committed (and the tree invalidated) before extraction started
+    assert commits_before_extraction[0] >= 2
+    invalidate.assert_awaited_once_with(tenant_id)
+
+    analysing = [event for event in events if event.stage == "analysing"]
+    assert analysing[0].framework_name == "Data Protection Act"
+    assert analysing[-1].chunks_analysed == 1
+    assert analysing[-1].suggestions_saved == 1
+    assert commits_after_suggestion[0] == commits_before_extraction[0] + 1
+    saved = [arg.args[0] for arg in mock_db.add.call_args_list if isinstance(arg.args[0], AISuggestion)]
+    assert [item.source_reference for item in saved] == ["Article 2"]
+
+    job = next(arg.args[0] for arg in mock_db.add.call_args_list if type(arg.args[0]).__name__ == "AnalysisJob")
+    assert job.llm_model == "classify,extract"
+    assert job.total_tokens == 155
+
+
+@pytest.mark.asyncio
+async def test_process_document_two_stage_records_section_error():
+    """A failing section is recorded on the job under its own error class."""
+    document_id = uuid.uuid4()
+    mock_document = Document(
+        id=document_id,
+        filename="law.txt",
+        storage_path="path/to/law.txt",
+        status=DocumentStatus.pending,
+        uploaded_by=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+    )
+
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()
+    mock_db.get.return_value = mock_document
+    mock_db.execute.return_value = MagicMock(rowcount=1, **{"scalars.return_value.first.return_value": None})
+    mock_db.scalar.return_value = 0
+    mock_session_maker = MagicMock()
+    mock_session_maker.__aenter__.return_value = mock_db
+    mock_session_maker.__aexit__.return_value = None
+
+    mock_storage = MagicMock()
+    mock_storage.download.return_value = b"Data Protection Act 2024\nArticle 1 Scope\nArticle 2 Duties"
+    mock_supabase = MagicMock()
+    mock_supabase.storage.from_.return_value = mock_storage
+
+    async def create(**kwargs):
+        raise TimeoutError("extraction timed out")
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = create
+    ai_service = AIService(client=mock_client)
+    ai_service.classify_document = AsyncMock(
+        return_value=ClassificationResult(
+            classification=DocumentClassification(
+                document_type="Law", framework_name="Data Protection Act", framework_description="Privacy"
+            ),
+            usage=None,
+        )
+    )
+
+    with patch("tasks.analysis.async_session_maker", return_value=mock_session_maker), \
+         patch("tasks.analysis.get_supabase_client", return_value=mock_supabase), \
+         patch("tasks.analysis.AIService", return_value=ai_service), \
+         patch("tasks.analysis.FrameworkTreeService.invalidate", AsyncMock()), \
+         patch("tasks.analysis.publish_progress", AsyncMock()) as publish:
+
+        await _process_document_async(document_id)
+
+    assert mock_document.status == DocumentStatus.failed
+    job = next(arg.args[0] for arg in mock_db.add.call_args_list if type(arg.args[0]).__name__ == "AnalysisJob")
+    assert job.error_class == "TimeoutError"
+    assert job.error_message == "extraction timed out"
+    failed = publish.await_args_list[-1].args[0]
+    assert failed.stage == "failed"
+    assert failed.message == "extraction timed out"
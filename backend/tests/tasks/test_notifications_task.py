@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.notification import NotificationOutbox
+from tasks.notifications import _deliver_notifications_async
+
+
+@pytest.mark.asyncio
+async def test_empty_outbox_does_not_connect_to_smtp(engine):
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("tasks.notifications.async_session_maker", session_maker), \
+         patch("tasks.notifications.SMTPMailer") as mock_mailer:
+        assert await _deliver_notifications_async() == 0
+
+    mock_mailer.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pending_notifications_open_the_mailer(engine, db_session: AsyncSession, admin_user):
+    db_session.add(
+        NotificationOutbox(
+            tenant_id=admin_user.tenant_id, recipient_id=admin_user.id, kind="bpo_assignment",
+            payload={"suggestion_id": str(uuid4())},
+        )
+    )
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("tasks.notifications.async_session_maker", session_maker), \
+         patch("tasks.notifications.SMTPMailer") as mock_mailer, \
+         patch("tasks.notifications.NotificationService.drain", return_value=1) as mock_drain:
+        assert await _deliver_notifications_async() == 1
+
+    mock_mailer.assert_called_once()
+    mock_drain.assert_awaited_once()
@@ -0,0 +1,24 @@
+import pytest
+from unittest.mock import patch
+
+from app.core.cache import CachedBody, InMemoryTenantCache
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_entries():
+    """Without a shared store, invalidations from other processes are missed; bodies age out."""
+    cache = InMemoryTenantCache(ttl_seconds=30)
+    entry = CachedBody(0, '"etag"', b"{}")
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        await cache.set("cache:tree:t", entry)
+        assert await cache.get("cache:tree:t") == (0, entry)
+    with patch("app.core.cache.time.monotonic", return_value=131.0):
+        assert await cache.get("cache:tree:t") == (0, None)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_bump_invalidates():
+    cache = InMemoryTenantCache(ttl_seconds=30)
+    await cache.set("cache:tree:t", CachedBody(0, '"etag"', b"{}"))
+    await cache.bump("cache:tree:t")
+    assert await cache.get("cache:tree:t") == (1, None)
@@ -1,11 +1,17 @@
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
+from fastapi import Request, Response
+from sqlalchemy import Column, Integer, MetaData, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, async_sessionmaker, create_async_engine
 from fastapi_users.db import SQLAlchemyUserDatabase
 
 from app.database import (
+    READ_PRIMARY_COOKIE,
+    ReplicaSet,
+    ReplicaWriteError,
     async_session_maker,
     create_db_and_tables,
     get_async_session,
+    get_read_session,
     get_user_db,
 )
 from app.models import Base, User
@@ -106,3 +112,91 @@ async def test_session_maker_configuration():
     # Create a test session
     async with async_session_maker() as session:
         assert isinstance(session, AsyncSession)
+
+
+def _request(cookies: str = "") -> Request:
+    headers = [(b"cookie", cookies.encode())] if cookies else []
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.fixture
+def replica_setup(tmp_path, mocker):
+    """Primary and replica as two SQLite files, with the replica set pointed at the latter."""
+    primary_maker = async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/primary.db"), expire_on_commit=False
+    )
+    replica_maker = async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db"), expire_on_commit=False
+    )
+    mocker.patch("app.database.async_session_maker", primary_maker)
+    mocker.patch("app.database.replicas", ReplicaSet([replica_maker]))
+    return primary_maker, replica_maker
+
+
+async def _read_session(request: Request, primary: AsyncSession) -> AsyncSession:
+    return await get_read_session(request, primary).__anext__()
+
+
+@pytest.mark.asyncio
+async def test_read_session_uses_replica(replica_setup):
+    primary_maker, _ = replica_setup
+    async with primary_maker() as primary:
+        session = await _read_session(_request(), primary)
+
+    assert session is not primary
+    assert session.bind.url.database.endswith("replica.db")
+
+
+@pytest.mark.asyncio
+async def test_write_pins_reads_to_primary(replica_setup):
+    primary_maker, _ = replica_setup
+    table = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+    async with primary_maker() as conn_session:
+        await conn_session.run_sync(lambda s: table.create(s.connection()))
+        await conn_session.commit()
+
+    response = Response()
+    session = await get_async_session(response).__anext__()
+    await session.execute(insert(table).values(id=1))
+    await session.commit()
+    await session.close()
+
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{READ_PRIMARY_COOKIE}=")
+
+    async with primary_maker() as primary:
+        pinned = await _read_session(_request(cookie.split(";")[0]), primary)
+    assert pinned is primary
+
+
+@pytest.mark.asyncio
+async def test_read_only_request_sets_no_cookie(replica_setup):
+    response = Response()
+    session = await get_async_session(response).__anext__()
+    await session.execute(text("SELECT 1"))
+    await session.commit()
+    await session.close()
+
+    assert "set-cookie" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary(tmp_path, mocker):
+    broken = async_sessionmaker(create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db"))
+    mocker.patch("app.database.replicas", ReplicaSet([broken]))
+    mocker.patch.object(ReplicaSet, "_lag_seconds", side_effect=OSError("connection refused"))
+
+    async with async_session_maker() as primary:
+        assert await _read_session(_request(), primary) is primary
+
+
+@pytest.mark.asyncio
+async def test_replica_session_refuses_writes(replica_setup):
+    primary_maker, _ = replica_setup
+    table = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+    async with primary_maker() as primary:
+        session = await _read_session(_request(), primary)
+
+    with pytest.raises(ReplicaWriteError):
+        await session.execute(insert(table).values(id=1))
+    await session.close()
@@ -0,0 +1,37 @@
+import uuid
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select, text
+
+from app.models.guid import GUID
+
+
+@pytest.fixture
+def guid_table():
+    engine = create_engine("sqlite://")
+    table = Table("items", MetaData(), Column("id", GUID, primary_key=True), Column("owner_id", GUID))
+    table.metadata.create_all(engine)
+    return engine, table
+
+
+def test_guid_stored_as_16_bytes(guid_table):
+    engine, table = guid_table
+    item_id, owner_id = uuid.uuid4(), uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(table), [{"id": item_id, "owner_id": str(owner_id)}, {"id": uuid.uuid4(), "owner_id": None}])
+
+        assert conn.execute(text("SELECT typeof(id), length(id) FROM items LIMIT 1")).one() == ("blob", 16)
+        row = conn.execute(select(table).where(table.c.id == item_id)).one()
+        assert row.id == item_id and row.owner_id == owner_id
+        assert isinstance(row.id, uuid.UUID) and row.id.version == 4
+        assert hash(row.id) == hash(item_id) and str(row.id) == str(item_id)
+        assert conn.execute(select(table.c.owner_id).where(table.c.id != item_id)).scalar() is None
+
+
+def test_guid_reads_legacy_hex_rows(guid_table):
+    engine, table = guid_table
+    item_id = uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO items (id) VALUES (:id)"), {"id": item_id.hex})
+
+        assert conn.execute(select(table.c.id)).scalar() == item_id
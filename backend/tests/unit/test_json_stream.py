@@ -0,0 +1,38 @@
+import json
+
+from app.core.json_stream import JSONItemStream
+
+DOCUMENT = json.dumps({
+    "note": "ignored [ { \"suggestions\": [",
+    "classification": {"document_type": "Law", "nested": {"a": [1, 2]}},
+    "suggestions": [
+        {"name": "escaped \\\" quote } ]", "tags": ["x", {"y": 1}]},
+        {"name": "second"},
+    ],
+    "other": [{"skipped": True}],
+})
+
+
+def _scan(pieces):
+    stream = JSONItemStream(array_keys=("suggestions",), value_keys=("classification",))
+    items = [item for piece in pieces for item in stream.feed(piece)]
+    return stream, [(key, json.loads(raw)) for key, raw in items]
+
+
+def test_items_are_emitted_as_they_close():
+    whole_stream, whole = _scan([DOCUMENT])
+    # One character at a time splits every token and escape sequence
+    _, chars = _scan(list(DOCUMENT))
+
+    assert whole_stream.complete
+    assert chars == whole
+    assert [key for key, _ in whole] == ["classification", "suggestions", "suggestions"]
+    assert whole[1][1]["name"] == 'escaped \\" quote } ]'
+
+
+def test_element_is_emitted_before_the_document_ends():
+    stream = JSONItemStream(array_keys=("suggestions",))
+
+    assert stream.feed('{"suggestions": [{"name": "a"}, {"na') == [("suggestions", '{"name": "a"}')]
+    assert stream.feed('me": "b"}') == [("suggestions", '{"name": "b"}')]
+    assert not stream.complete
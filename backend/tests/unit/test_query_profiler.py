@@ -0,0 +1,65 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from app.core import metrics
+from app.core.query_profiler import QueryProfilerMiddleware, capture_queries, install, normalize_statement
+from app.main import app
+
+
+def test_normalize_statement_collapses_literals_and_params():
+    a = normalize_statement("SELECT * FROM documents WHERE id = ? AND name = 'a'")
+    b = normalize_statement("SELECT *\n  FROM documents WHERE id = ? AND name = 'other'")
+    assert a == b == "SELECT * FROM documents WHERE id = ? AND name = ?"
+    assert normalize_statement("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == "SELECT ? FROM t WHERE id IN (?...)"
+    assert normalize_statement("SELECT x FROM t WHERE id IN (?, ?)") == normalize_statement(
+        "SELECT x FROM t WHERE id IN (?, ?, ?, ?)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_adds_query_headers(test_client, admin_token_headers):
+    # test_client installs the database overrides; wrap the same app with the profiler
+    async with AsyncClient(
+        transport=ASGITransport(app=QueryProfilerMiddleware(app, repeat_threshold=2)),
+        base_url="http://localhost:8000",
+    ) as client:
+        response = await client.get("/api/v1/audit-logs", headers=admin_token_headers)
+
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) >= 2
+    assert float(response.headers["x-db-query-time-ms"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fixture_fails_when_exceeded(test_client, admin_token_headers, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="Query budget exceeded"):
+        with query_budget(0):
+            await test_client.get("/api/v1/audit-logs", headers=admin_token_headers)
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(3)
+async def test_audit_logs_query_budget(test_client, admin_token_headers):
+    response = await test_client.get("/api/v1/audit-logs", headers=admin_token_headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_profiler_and_metrics_share_one_listener_pair(engine):
+    """Both consumers are fed by the metrics listeners; the profiler adds none of its own."""
+    metrics.instrument_sqlalchemy()
+    install()
+    assert event.contains(Engine, "after_cursor_execute", metrics._after_cursor_execute)
+
+    stats = metrics.RequestDBStats()
+    token = metrics._request_db_stats.set(stats)
+    try:
+        with capture_queries() as profile:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    finally:
+        metrics._request_db_stats.reset(token)
+    assert profile.count == stats.queries == 1
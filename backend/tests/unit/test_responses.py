@@ -0,0 +1,34 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+from app.core.responses import FastJSONResponse, ResponseSerializer, dumps
+from app.schemas.dashboard import OverviewResponse, OverviewRisk
+
+
+def test_dumps_handles_uuid_datetime_and_models():
+    item_id = uuid4()
+    when = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    risk = OverviewRisk(id=item_id, name="Fraud")
+
+    data = json.loads(dumps({"id": item_id, "at": when, "risk": risk}))
+
+    assert data["id"] == str(item_id)
+    assert data["at"].startswith("2025-01-02T03:04:05")
+    assert data["risk"] == {"id": str(item_id), "name": "Fraud", "description": None, "category": None}
+    assert FastJSONResponse({"id": item_id}).body == dumps({"id": item_id})
+
+
+def test_response_serializer_reads_attribute_rows():
+    risk = SimpleNamespace(id=uuid4(), name="Fraud", description=None, category="financial")
+    process = SimpleNamespace(id=uuid4(), name="Payments", description=None, controls=[], risks=[risk])
+
+    response = ResponseSerializer(OverviewResponse).response({"processes": [process]}, headers={"X-Test": "1"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["x-test"] == "1"
+    expected = OverviewResponse.model_validate({"processes": [process]}, from_attributes=True)
+    assert response.body == expected.model_dump_json().encode()
+    assert ResponseSerializer(List[OverviewRisk]).dump_json([]) == b"[]"
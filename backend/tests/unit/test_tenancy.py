@@ -0,0 +1,56 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.sql.elements import True_
+
+from app.core.tenancy import TENANT_KEY, _apply_tenant_context, set_tenant_context, tenant_clause
+from app.models.compliance import Risk
+from app.models.suggestion import AISuggestion
+
+
+def _postgres_session(tenant_id):
+    db = MagicMock()
+    db.info = {TENANT_KEY: tenant_id}
+    db.bind.dialect.name = "postgresql"
+    return db
+
+
+def test_tenant_clause_keeps_predicate_by_default():
+    tenant_id = uuid.uuid4()
+    clause = tenant_clause(_postgres_session(tenant_id), Risk.tenant_id, tenant_id)
+    assert not isinstance(clause, True_)
+
+
+def test_tenant_clause_defers_to_rls_when_enabled(mocker):
+    mocker.patch("app.core.tenancy.settings.TENANT_FILTER_VIA_RLS", True)
+    tenant_id = uuid.uuid4()
+    db = _postgres_session(tenant_id)
+
+    assert isinstance(tenant_clause(db, Risk.tenant_id, tenant_id), True_)
+    # Another tenant, or a table without the policy, keeps the filter
+    assert not isinstance(tenant_clause(db, Risk.tenant_id, uuid.uuid4()), True_)
+    assert not isinstance(tenant_clause(db, AISuggestion.tenant_id, tenant_id), True_)
+
+
+@pytest.mark.asyncio
+async def test_tenant_clause_keeps_predicate_on_sqlite(db_session, mocker):
+    mocker.patch("app.core.tenancy.settings.TENANT_FILTER_VIA_RLS", True)
+    tenant_id = uuid.uuid4()
+    await set_tenant_context(db_session, tenant_id)
+
+    assert db_session.info[TENANT_KEY] == tenant_id
+    assert not isinstance(tenant_clause(db_session, Risk.tenant_id, tenant_id), True_)
+
+
+def test_transactions_begin_with_tenant_setting():
+    tenant_id = uuid.uuid4()
+    session = MagicMock(info={TENANT_KEY: tenant_id})
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+
+    _apply_tenant_context(session, None, connection)
+
+    statement, params = connection.execute.call_args.args
+    assert "set_config('app.tenant_id'" in str(statement)
+    assert params == {"tenant_id": str(tenant_id)}